@@ -0,0 +1,124 @@
+"""Benchmarks for encoding and decoding of KNX/IP frames, addresses and DPTs."""
+import asyncio
+
+from harness import benchmark
+
+from xknx import XKNX
+from xknx.knx import (AddressFilter, DPT4ByteFloat, DPTArray, DPTString,
+                      DPTTemperature, GroupAddress, PhysicalAddress, Telegram)
+from xknx.knxip import CEMIFrame, KNXIPFrame, KNXIPServiceType
+
+ROUTING_INDICATION = bytes((
+    0x06, 0x10, 0x05, 0x30, 0x00, 0x14, 0x29, 0x00,
+    0xbc, 0xd0, 0x12, 0x02, 0x01, 0x51, 0x03, 0x00,
+    0x80, 0x0c, 0x65))
+
+
+@benchmark('knxip_frame_from_knx', number=20000)
+def knxip_frame_from_knx():
+    """Parse routing indication."""
+    xknx = XKNX(loop=asyncio.new_event_loop())
+
+    def operation():
+        """Parse frame."""
+        KNXIPFrame(xknx).from_knx(ROUTING_INDICATION)
+    return operation
+
+
+@benchmark('knxip_frame_to_knx', number=20000)
+def knxip_frame_to_knx():
+    """Serialize routing indication."""
+    xknx = XKNX(loop=asyncio.new_event_loop())
+    knxipframe = KNXIPFrame(xknx)
+    knxipframe.init(KNXIPServiceType.ROUTING_INDICATION)
+    knxipframe.body.src_addr = PhysicalAddress('1.2.2')
+    knxipframe.body.telegram = Telegram(
+        GroupAddress('337'), payload=DPTArray(DPTTemperature.to_knx(19.85)))
+    knxipframe.normalize()
+
+    def operation():
+        """Serialize frame."""
+        knxipframe.to_knx()
+    return operation
+
+
+@benchmark('cemi_frame_from_knx', number=20000)
+def cemi_frame_from_knx():
+    """Parse CEMI frame and extract telegram."""
+    xknx = XKNX(loop=asyncio.new_event_loop())
+    raw = ROUTING_INDICATION[6:]
+
+    def operation():
+        """Parse CEMI frame."""
+        cemi = CEMIFrame(xknx)
+        cemi.from_knx(raw)
+        return cemi.telegram
+    return operation
+
+
+@benchmark('group_address_from_str', number=50000)
+def group_address_from_str():
+    """Construct group address from string."""
+    def operation():
+        """Construct address."""
+        return GroupAddress('1/2/3')
+    return operation
+
+
+@benchmark('group_address_from_int', number=50000)
+def group_address_from_int():
+    """Construct group address from int."""
+    def operation():
+        """Construct address."""
+        return GroupAddress(2563)
+    return operation
+
+
+@benchmark('dpt_2byte_float_encode_decode', number=50000)
+def dpt_2byte_float_encode_decode():
+    """Encode and decode temperature."""
+    def operation():
+        """Encode and decode value."""
+        return DPTTemperature.from_knx(DPTTemperature.to_knx(21.34))
+    return operation
+
+
+@benchmark('dpt_4byte_float_encode_decode', number=50000)
+def dpt_4byte_float_encode_decode():
+    """Encode and decode 4 byte float."""
+    def operation():
+        """Encode and decode value."""
+        return DPT4ByteFloat.from_knx(DPT4ByteFloat.to_knx(1234.5678))
+    return operation
+
+
+@benchmark('dpt_string_encode_decode', number=20000)
+def dpt_string_encode_decode():
+    """Encode and decode 14 byte string."""
+    def operation():
+        """Encode and decode value."""
+        return DPTString.from_knx(DPTString.to_knx('KNX is OK'))
+    return operation
+
+
+@benchmark('address_filter_match', number=50000)
+def address_filter_match():
+    """Match group address against level3 pattern."""
+    address_filter = AddressFilter('1/*/2-5')
+    address = GroupAddress('1/7/4')
+
+    def operation():
+        """Match address."""
+        return address_filter.match(address)
+    return operation
+
+
+@benchmark('address_filter_match_str', number=20000)
+def address_filter_match_str():
+    """Match string against level3 pattern."""
+    address_filter = AddressFilter('1/*/2-5')
+
+    def operation():
+        """Match address."""
+        return address_filter.match('1/7/4')
+    return operation
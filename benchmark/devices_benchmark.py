@@ -0,0 +1,54 @@
+"""Benchmarks for looking up devices by group address."""
+import asyncio
+from functools import partial
+
+from harness import register
+
+from xknx import XKNX
+from xknx.devices import Switch
+from xknx.knx import GroupAddress
+
+DEVICE_COUNTS = (10, 100, 1000, 10000)
+
+
+def create_xknx(device_count):
+    """Return XKNX object with device_count switches, each with own group addresses."""
+    xknx = XKNX(loop=asyncio.new_event_loop())
+    for number in range(device_count):
+        xknx.devices.add(Switch(
+            xknx,
+            'Switch {0}'.format(number),
+            group_address=GroupAddress(2 * number + 1),
+            group_address_state=GroupAddress(2 * number + 2)))
+    return xknx
+
+
+def devices_by_group_address(device_count):
+    """Look up device with state address of last device."""
+    xknx = create_xknx(device_count)
+    group_address = GroupAddress(2 * device_count)
+
+    def operation():
+        """Look up device."""
+        return list(xknx.devices.devices_by_group_address(group_address))
+    return operation
+
+
+def devices_by_name(device_count):
+    """Look up last device by name."""
+    xknx = create_xknx(device_count)
+    name = 'Switch {0}'.format(device_count - 1)
+
+    def operation():
+        """Look up device."""
+        return xknx.devices[name]
+    return operation
+
+
+for count in DEVICE_COUNTS:
+    register('devices_by_group_address[{0}]'.format(count),
+             partial(devices_by_group_address, count),
+             number=max(10, 200000 // count))
+    register('devices_by_name[{0}]'.format(count),
+             partial(devices_by_name, count),
+             number=max(10, 200000 // count))
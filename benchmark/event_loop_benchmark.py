@@ -0,0 +1,125 @@
+"""
+Benchmarks for end-to-end throughput on different event loops, using GatewaySimulator as KNX/IP device.
+
+* routing_receive: ROUTING_INDICATIONs sent by the simulator are received by Routing and processed
+  by TelegramQueue and devices.
+* tunnel_send: telegrams are sent via Tunnel, each waiting for the TUNNELLING_ACK of the simulator.
+
+uvloop benchmarks are only registered if uvloop is installed.
+"""
+import asyncio
+from collections import OrderedDict
+from functools import partial
+
+from harness import register
+
+from xknx import XKNX
+from xknx.devices import Switch
+from xknx.io import (ConnectionConfig, ConnectionType, GatewaySimulator,
+                     KNXIPInterface, Routing)
+from xknx.knx import DPTBinary, GroupAddress, Telegram
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+TELEGRAMS_PER_BATCH = 100
+
+LOOP_FACTORIES = OrderedDict((('asyncio', asyncio.new_event_loop),))
+if uvloop is not None:
+    LOOP_FACTORIES['uvloop'] = uvloop.new_event_loop
+
+
+class LoopbackRouting(Routing):
+    """Routing receiving ROUTING_INDICATIONs of GatewaySimulator via loopback instead of multicast."""
+
+    def __init__(self, xknx, telegram_received_callback, gateway_addr):
+        """Initialize LoopbackRouting class."""
+        self.gateway_addr = gateway_addr
+        super().__init__(xknx, telegram_received_callback, '127.0.0.1')
+
+    def init_udp_client(self):
+        """Initialize udpclient connected to simulator."""
+        super().init_udp_client()
+        self.udpclient.multicast = False
+        self.udpclient.local_addr = (self.local_ip, 0)
+        self.udpclient.remote_addr = self.gateway_addr
+
+
+def routing_receive(loop_factory):
+    """Receive routing indications and process them until devices are updated."""
+    loop = loop_factory()
+    xknx = XKNX(loop=loop)
+    xknx.devices.add(Switch(xknx, 'Switch', group_address='1/1/1'))
+    simulator = GatewaySimulator(xknx)
+    loop.run_until_complete(simulator.start())
+    state = {'received': 0, 'done': None}
+
+    def telegram_received(telegram):
+        """Put telegram into queue. Callback from Routing."""
+        xknx.telegrams.put_nowait(telegram)
+        state['received'] += 1
+        if state['received'] == TELEGRAMS_PER_BATCH:
+            state['done'].set_result(None)
+    routing = LoopbackRouting(xknx, telegram_received, simulator.address)
+    loop.run_until_complete(routing.start())
+    target = routing.udpclient.getsockname()
+    telegrams = [Telegram(GroupAddress('1/1/1'), payload=DPTBinary(number % 2))
+                 for number in range(TELEGRAMS_PER_BATCH)]
+
+    async def process():
+        """Start queue, send indications and wait until all were processed."""
+        state['received'] = 0
+        state['done'] = loop.create_future()
+        xknx.telegram_queue.queue_stopped.clear()
+        await xknx.telegram_queue.start()
+        for telegram in telegrams:
+            simulator.send_indication(telegram, routing_target=target)
+        await asyncio.wait_for(state['done'], 1)
+        await xknx.telegram_queue.stop()
+
+    def operation():
+        """Receive and process batch of telegrams."""
+        loop.run_until_complete(process())
+    return operation
+
+
+def tunnel_send(loop_factory):
+    """Send telegrams via tunnel, waiting for the ACK of each."""
+    loop = loop_factory()
+    xknx = XKNX(loop=loop)
+    simulator = GatewaySimulator(xknx)
+    loop.run_until_complete(simulator.start())
+    (gateway_ip, gateway_port) = simulator.address
+    knxip_interface = KNXIPInterface(xknx, ConnectionConfig(
+        connection_type=ConnectionType.TUNNELING,
+        local_ip='127.0.0.1',
+        gateway_ip=gateway_ip,
+        gateway_port=gateway_port))
+    loop.run_until_complete(knxip_interface.start())
+    # No heartbeat during benchmark, its task would still be pending when the loop is discarded
+    loop.run_until_complete(xknx.heartbeat_manager.unregister(knxip_interface.interface))
+    telegrams = [Telegram(GroupAddress(number + 1), payload=DPTBinary(number % 2))
+                 for number in range(TELEGRAMS_PER_BATCH)]
+
+    async def process():
+        """Send telegrams one after another."""
+        for telegram in telegrams:
+            await knxip_interface.send_telegram(telegram)
+
+    def operation():
+        """Send batch of telegrams."""
+        loop.run_until_complete(process())
+    return operation
+
+
+for loop_name, loop_factory in LOOP_FACTORIES.items():
+    register('routing_receive[{0}]'.format(loop_name),
+             partial(routing_receive, loop_factory),
+             number=20,
+             items=TELEGRAMS_PER_BATCH)
+    register('tunnel_send[{0}]'.format(loop_name),
+             partial(tunnel_send, loop_factory),
+             number=5,
+             items=TELEGRAMS_PER_BATCH)
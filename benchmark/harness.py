@@ -0,0 +1,69 @@
+"""
+Harness for registering and measuring benchmarks.
+
+A benchmark is registered with a factory. The factory does all the setup work and
+returns the operation to be measured. Each benchmark is measured for
+
+* throughput (best of several timed batches) and
+* memory: peak and retained bytes of one batch, traced by tracemalloc.
+
+An operation may provide additional results (e.g. a breakdown of the measured time)
+by an attribute extra_results, a callable returning a dict, called after measuring.
+"""
+import gc
+import timeit
+import tracemalloc
+from collections import OrderedDict, namedtuple
+
+Benchmark = namedtuple('Benchmark', ['name', 'factory', 'number', 'items'])
+
+BENCHMARKS = OrderedDict()
+
+
+def register(name, factory, number=1000, items=1):
+    """
+    Register benchmark.
+
+    number: number of calls of the operation within one batch.
+    items: number of items (e.g. telegrams) processed by one call of the operation.
+    """
+    BENCHMARKS[name] = Benchmark(name, factory, number, items)
+
+
+def benchmark(name, number=1000, items=1):
+    """Register decorated factory as benchmark."""
+    def decorator(factory):
+        """Register factory."""
+        register(name, factory, number, items)
+        return factory
+    return decorator
+
+
+def measure(bench, repeat=5, scale=1.0):
+    """Measure benchmark and return result as dict."""
+    operation = bench.factory()
+    number = max(1, int(bench.number * scale))
+    operation()  # warm up caches
+    gc.collect()
+    best = min(timeit.repeat(operation, number=number, repeat=repeat))
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        for _ in range(number):
+            operation()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    items = number * bench.items
+    result = OrderedDict((
+        ('ops_per_sec', round(items / best, 1)),
+        ('usec_per_op', round(best / items * 1e6, 3)),
+        ('peak_bytes', peak),
+        ('retained_bytes_per_op', round(retained / items, 1)),
+    ))
+    extra_results = getattr(operation, 'extra_results', None)
+    if extra_results is not None:
+        result.update(extra_results())
+    return result
@@ -0,0 +1,63 @@
+"""
+Benchmarks for the startup time of `import xknx`, run within a fresh interpreter.
+
+Besides the wall time of the interpreter, the cumulative import time of the xknx packages
+is recorded, as reported by -X importtime (best of all runs, in microseconds).
+"""
+import os
+import re
+import subprocess
+import sys
+from collections import OrderedDict
+from functools import partial
+
+from harness import register
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PACKAGES = ('xknx', 'xknx.core', 'xknx.devices', 'xknx.io', 'xknx.knx', 'xknx.knxip')
+
+# e.g. "import time:       311 |       2001 |       xknx.devices"
+IMPORTTIME_RE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|\s*(\S+)$')
+
+
+def parse_importtime(output):
+    """Return cumulative import time in microseconds of PACKAGES within output of -X importtime."""
+    cumulative = {}
+    for line in output.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if match is None:
+            continue
+        name = match.group(3)
+        # A package may be listed again if imported at top level after its parent
+        if name in PACKAGES and name not in cumulative:
+            cumulative[name] = int(match.group(2))
+    return cumulative
+
+
+def import_time(statement):
+    """Run statement within new interpreter with -X importtime."""
+    command = [sys.executable, '-X', 'importtime', '-c', statement]
+    best = {}
+
+    def operation():
+        """Start interpreter, import and keep best import time of packages."""
+        process = subprocess.run(command, cwd=ROOT_DIRECTORY, check=True,
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                 universal_newlines=True)
+        for name, cumulative in parse_importtime(process.stderr).items():
+            best[name] = min(best.get(name, cumulative), cumulative)
+
+    def extra_results():
+        """Return best cumulative import time of packages."""
+        return OrderedDict(('import_usec[{0}]'.format(name), best[name])
+                           for name in PACKAGES if name in best)
+    operation.extra_results = extra_results
+    return operation
+
+
+# Startup of the interpreter itself, as reference for the imports below
+register('import[python]', partial(import_time, 'pass'), number=10)
+register('import[xknx]', partial(import_time, 'import xknx'), number=10)
+register('import[xknx.XKNX]', partial(import_time, 'from xknx import XKNX; XKNX'), number=10)
+register('import[xknx.devices]', partial(import_time, 'from xknx.devices import Light, Sensor'), number=10)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Run benchmarks of xknx hot paths.
+
+All *_benchmark.py modules within this directory are imported and their benchmarks run.
+
+    python3 benchmark/run.py                         # run all benchmarks
+    python3 benchmark/run.py -k devices              # run benchmarks matching 'devices'
+    python3 benchmark/run.py --save baseline.json    # store results as baseline
+    python3 benchmark/run.py --compare baseline.json # compare results with baseline
+
+Additional results of a benchmark (e.g. import time per package) are printed below its line
+and stored within the baseline, but not compared.
+
+When comparing, a benchmark is reported as regression if its throughput dropped or its
+retained memory per operation grew by more than the threshold (default 20%).
+"""
+import argparse
+import glob
+import importlib
+import json
+import os
+import platform
+import sys
+from collections import OrderedDict
+
+import harness
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+
+STANDARD_RESULTS = ('ops_per_sec', 'usec_per_op', 'peak_bytes', 'retained_bytes_per_op')
+
+
+def load_benchmarks():
+    """Import all benchmark modules."""
+    for path in sorted(glob.glob(os.path.join(BENCHMARK_DIR, '*_benchmark.py'))):
+        importlib.import_module(os.path.splitext(os.path.basename(path))[0])
+
+
+def compare(result, baseline, threshold):
+    """Return list of regressions of result compared to baseline."""
+    regressions = []
+    if baseline['ops_per_sec'] and \
+            result['ops_per_sec'] < baseline['ops_per_sec'] * (1 - threshold):
+        regressions.append('throughput {0:.1%}'.format(
+            result['ops_per_sec'] / baseline['ops_per_sec'] - 1))
+    if result['retained_bytes_per_op'] > \
+            max(baseline['retained_bytes_per_op'], 1) * (1 + threshold):
+        regressions.append('retained memory {0} -> {1} bytes/op'.format(
+            baseline['retained_bytes_per_op'], result['retained_bytes_per_op']))
+    return regressions
+
+
+def main(argv=None):
+    """Run benchmarks from command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('-k', '--filter', default='', help='only run benchmarks containing FILTER')
+    parser.add_argument('--save', metavar='FILE', help='store results as JSON baseline')
+    parser.add_argument('--compare', metavar='FILE', help='compare results with JSON baseline')
+    parser.add_argument('--threshold', type=float, default=0.2, help='tolerated deviation from baseline')
+    parser.add_argument('--repeat', type=int, default=5, help='number of timed batches')
+    parser.add_argument('--scale', type=float, default=1.0, help='scale size of timed batches')
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, os.path.dirname(BENCHMARK_DIR))
+    load_benchmarks()
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)['benchmarks']
+
+    results = OrderedDict()
+    regressions = 0
+    print('{0:<45} {1:>14} {2:>12} {3:>12} {4:>10}'.format(
+        'benchmark', 'ops/sec', 'usec/op', 'peak KiB', 'B/op'))
+    for name, bench in harness.BENCHMARKS.items():
+        if args.filter not in name:
+            continue
+        result = harness.measure(bench, repeat=args.repeat, scale=args.scale)
+        results[name] = result
+        line = '{0:<45} {1:>14,.1f} {2:>12.3f} {3:>12.1f} {4:>10.1f}'.format(
+            name, result['ops_per_sec'], result['usec_per_op'],
+            result['peak_bytes'] / 1024, result['retained_bytes_per_op'])
+        if name in baseline:
+            found = compare(result, baseline[name], args.threshold)
+            if found:
+                regressions += 1
+                line += '  REGRESSION: ' + ', '.join(found)
+        print(line)
+        for key, value in list(result.items())[len(STANDARD_RESULTS):]:
+            print('    {0:<41} {1:>14,}'.format(key, value))
+        sys.stdout.flush()
+
+    if args.save:
+        with open(args.save, 'w') as baseline_file:
+            json.dump(OrderedDict((
+                ('python', platform.python_version()),
+                ('platform', platform.platform()),
+                ('benchmarks', results))), baseline_file, indent=2)
+            baseline_file.write('\n')
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,49 @@
+"""Benchmarks for end-to-end throughput of TelegramQueue."""
+import asyncio
+from functools import partial
+
+from harness import register
+
+from xknx import XKNX
+from xknx.devices import Switch
+from xknx.knx import (DPTBinary, GroupAddress, Telegram, TelegramDirection,
+                      TelegramType)
+
+TELEGRAMS_PER_BATCH = 1000
+
+
+def telegram_queue_incoming(device_count):
+    """Process incoming telegrams via TelegramQueue.run to devices."""
+    loop = asyncio.new_event_loop()
+    xknx = XKNX(loop=loop)
+    for number in range(device_count):
+        xknx.devices.add(Switch(
+            xknx,
+            'Switch {0}'.format(number),
+            group_address=GroupAddress(number + 1)))
+    telegrams = [
+        Telegram(GroupAddress(number % device_count + 1),
+                 TelegramType.GROUP_WRITE,
+                 TelegramDirection.INCOMING,
+                 DPTBinary(number % 2))
+        for number in range(TELEGRAMS_PER_BATCH)]
+
+    async def process():
+        """Start queue, feed telegrams and wait until all were processed."""
+        xknx.telegram_queue.queue_stopped.clear()
+        await xknx.telegram_queue.start()
+        for telegram in telegrams:
+            await xknx.telegrams.put(telegram)
+        await xknx.telegram_queue.stop()
+
+    def operation():
+        """Process batch of telegrams."""
+        loop.run_until_complete(process())
+    return operation
+
+
+for count in (10, 1000):
+    register('telegram_queue_incoming[{0}]'.format(count),
+             partial(telegram_queue_incoming, count),
+             number=5,
+             items=TELEGRAMS_PER_BATCH)
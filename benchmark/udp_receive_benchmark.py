@@ -0,0 +1,59 @@
+"""Benchmarks for receiving KNX/IP frames via UDPClient over loopback."""
+import asyncio
+import socket
+from functools import partial
+
+from harness import register
+
+from xknx import XKNX
+from xknx.io import UDPClient
+from xknx.knx import DPTBinary, GroupAddress, Telegram
+from xknx.knxip import KNXIPFrame, KNXIPServiceType
+
+# Small enough to fit into the default receive buffer of the socket
+DATAGRAMS_PER_BATCH = 100
+
+
+def udp_receive(receive_batch_size):
+    """Send datagrams over loopback and wait until UDPClient processed all of them."""
+    loop = asyncio.new_event_loop()
+    xknx = XKNX(loop=loop)
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sender.bind(('127.0.0.1', 0))
+    udp_client = UDPClient(xknx, ('127.0.0.1', 0), sender.getsockname(),
+                           receive_batch_size=receive_batch_size)
+    state = {'received': 0, 'done': None}
+
+    def frame_received(_knxipframe, _udp_client):
+        """Count received frames."""
+        state['received'] += 1
+        if state['received'] == DATAGRAMS_PER_BATCH:
+            state['done'].set_result(None)
+    udp_client.register_callback(frame_received, [KNXIPServiceType.ROUTING_INDICATION])
+    loop.run_until_complete(udp_client.connect())
+    address = udp_client.getsockname()
+
+    knxipframe = KNXIPFrame(xknx)
+    knxipframe.init(KNXIPServiceType.ROUTING_INDICATION)
+    knxipframe.body.telegram = Telegram(GroupAddress('1/2/3'), payload=DPTBinary(1))
+    knxipframe.normalize()
+    raw = bytes(knxipframe.to_knx())
+
+    def operation():
+        """Send batch of datagrams and process them."""
+        state['received'] = 0
+        state['done'] = loop.create_future()
+        for _ in range(DATAGRAMS_PER_BATCH):
+            sender.sendto(raw, address)
+        loop.run_until_complete(asyncio.wait_for(state['done'], 1))
+    return operation
+
+
+register('udp_receive',
+         partial(udp_receive, None),
+         number=20,
+         items=DATAGRAMS_PER_BATCH)
+register('udp_receive_batched[64]',
+         partial(udp_receive, 64),
+         number=20,
+         items=DATAGRAMS_PER_BATCH)
@@ -0,0 +1,57 @@
+"""Benchmarks for sending bursts of KNX/IP frames via UDPClient over loopback."""
+import asyncio
+import socket
+from functools import partial
+
+from harness import register
+
+from xknx import XKNX
+from xknx.io import UDPClient
+from xknx.knx import DPTBinary, GroupAddress, Telegram
+from xknx.knxip import KNXIPFrame, KNXIPServiceType
+
+FRAMES_PER_BATCH = 100
+
+
+def udp_send(receive_batch_size, send_batching):
+    """Send burst of frames, e.g. of a scene recall, within one iteration of the event loop."""
+    loop = asyncio.new_event_loop()
+    xknx = XKNX(loop=loop)
+    # Receiving socket is never read, the kernel drops datagrams once its buffer is full
+    sink = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sink.bind(('127.0.0.1', 0))
+    udp_client = UDPClient(xknx, ('127.0.0.1', 0), sink.getsockname(),
+                           receive_batch_size=receive_batch_size,
+                           send_batching=send_batching)
+    loop.run_until_complete(udp_client.connect())
+
+    knxipframes = []
+    for number in range(FRAMES_PER_BATCH):
+        knxipframe = KNXIPFrame(xknx)
+        knxipframe.init(KNXIPServiceType.ROUTING_INDICATION)
+        knxipframe.body.telegram = Telegram(GroupAddress(number + 1), payload=DPTBinary(number % 2))
+        knxipframe.normalize()
+        knxipframes.append(knxipframe)
+
+    def operation():
+        """Send burst of frames and run one iteration of the event loop."""
+        for knxipframe in knxipframes:
+            udp_client.send(knxipframe)
+        loop.run_until_complete(asyncio.sleep(0))
+    # Keep sink open as long as the benchmark runs
+    operation.sink = sink
+    return operation
+
+
+register('udp_send',
+         partial(udp_send, None, False),
+         number=20,
+         items=FRAMES_PER_BATCH)
+register('udp_send_batched',
+         partial(udp_send, None, True),
+         number=20,
+         items=FRAMES_PER_BATCH)
+register('udp_send_batched[batch_transport]',
+         partial(udp_send, 64, True),
+         number=20,
+         items=FRAMES_PER_BATCH)
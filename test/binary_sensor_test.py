@@ -52,11 +52,55 @@ class TestBinarySensor(unittest.TestCase):
     def test_process_reset_after(self):
         """Test process / reading telegrams from telegram queue."""
         xknx = XKNX(loop=self.loop)
-        binaryinput = BinarySensor(xknx, 'TestInput', '1/2/3', reset_after=0.01)
+        binaryinput = BinarySensor(xknx, 'TestInput', '1/2/3', reset_after=10)
         telegram_on = Telegram(payload=DPTBinary(1))
         self.loop.run_until_complete(asyncio.Task(binaryinput.process(telegram_on)))
+        # process() does not wait for the reset
+        self.assertEqual(binaryinput.state, BinarySensorState.ON)
+        self.loop.run_until_complete(asyncio.sleep(0.05))
         self.assertEqual(binaryinput.state, BinarySensorState.OFF)
 
+    def test_process_reset_after_retrigger(self):
+        """Test if pending reset is restarted by a new telegram."""
+        xknx = XKNX(loop=self.loop)
+        binaryinput = BinarySensor(xknx, 'TestInput', '1/2/3', reset_after=50)
+        telegram_on = Telegram(payload=DPTBinary(1))
+        self.loop.run_until_complete(asyncio.Task(binaryinput.process(telegram_on)))
+        self.loop.run_until_complete(asyncio.sleep(0.03))
+        self.loop.run_until_complete(asyncio.Task(binaryinput.process(telegram_on)))
+        self.loop.run_until_complete(asyncio.sleep(0.03))
+        self.assertEqual(binaryinput.state, BinarySensorState.ON)
+        self.loop.run_until_complete(asyncio.sleep(0.05))
+        self.assertEqual(binaryinput.state, BinarySensorState.OFF)
+
+    def test_process_reset_after_exception(self):
+        """Test if unexpected exceptions of the reset are logged within the reset task."""
+        xknx = XKNX(loop=self.loop)
+        binaryinput = BinarySensor(xknx, 'TestInput', '1/2/3', reset_after=10)
+
+        async def async_after_update_callback(device):
+            """Async callback failing on reset."""
+            if device.is_off():
+                raise ValueError("broken callback")
+        binaryinput.register_device_updated_cb(async_after_update_callback)
+
+        with patch('logging.Logger.exception') as mock_exception:
+            self.loop.run_until_complete(asyncio.Task(binaryinput.process(Telegram(payload=DPTBinary(1)))))
+            self.loop.run_until_complete(asyncio.sleep(0.05))
+            mock_exception.assert_called_once_with(
+                "Unexpected error while resetting state of %s", 'TestInput')
+        self.assertEqual(binaryinput.state, BinarySensorState.OFF)
+
+    def test_shutdown_cancels_reset(self):
+        """Test if shutdown cancels pending reset."""
+        xknx = XKNX(loop=self.loop)
+        binaryinput = BinarySensor(xknx, 'TestInput', '1/2/3', reset_after=10)
+        telegram_on = Telegram(payload=DPTBinary(1))
+        self.loop.run_until_complete(asyncio.Task(binaryinput.process(telegram_on)))
+        binaryinput.shutdown()
+        self.loop.run_until_complete(asyncio.sleep(0.05))
+        self.assertEqual(binaryinput.state, BinarySensorState.ON)
+
     def test_process_significant_bit(self):
         """Test process / reading telegrams from telegram queue with specific significant bit set."""
         xknx = XKNX(loop=self.loop)
@@ -113,6 +157,8 @@ class TestBinarySensor(unittest.TestCase):
         telegram_on = Telegram()
         telegram_on.payload = DPTBinary(1)
         self.loop.run_until_complete(asyncio.Task(binary_sensor.process(telegram_on)))
+        # Actions are executed within separate tasks
+        self.loop.run_until_complete(asyncio.sleep(0))
 
         self.assertEqual(
             xknx.devices['TestInput'].state,
@@ -124,6 +170,7 @@ class TestBinarySensor(unittest.TestCase):
         telegram_off = Telegram()
         telegram_off.payload = DPTBinary(0)
         self.loop.run_until_complete(asyncio.Task(binary_sensor.process(telegram_off)))
+        self.loop.run_until_complete(asyncio.sleep(0))
 
         self.assertEqual(
             xknx.devices['TestInput'].state,
@@ -132,6 +179,22 @@ class TestBinarySensor(unittest.TestCase):
             xknx.devices['TestOutlet'].state,
             False)
 
+    def test_process_action_exception(self):
+        """Test if unexpected exceptions of actions are logged within the action task."""
+        xknx = XKNX(loop=self.loop)
+        binary_sensor = BinarySensor(xknx, 'TestInput', group_address='1/2/3')
+        action = Action(xknx, hook='on', target='TestOutlet', method='on')
+        action.execute = Mock(side_effect=ValueError("broken callback"))
+        binary_sensor.actions.append(action)
+
+        with patch('logging.Logger.exception') as mock_exception:
+            self.loop.run_until_complete(asyncio.Task(binary_sensor.process(Telegram(payload=DPTBinary(1)))))
+            self.loop.run_until_complete(asyncio.sleep(0))
+            mock_exception.assert_called_once_with(
+                "Unexpected error while executing action %s", action)
+        self.assertEqual(binary_sensor.state, BinarySensorState.ON)
+        self.assertFalse(binary_sensor._action_tasks)  # pylint: disable=protected-access
+
     def test_process_wrong_payload(self):
         """Test process wrong telegram (wrong payload type)."""
         xknx = XKNX(loop=self.loop)
@@ -0,0 +1,108 @@
+"""Unit test for BusLoadEstimator objects."""
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from xknx import XKNX
+from xknx.core import BusLoadEstimator, Metrics
+from xknx.knx import (DPTArray, DPTBinary, GroupAddress, Telegram,
+                      TelegramDirection, TelegramType)
+
+
+class TestBusLoadEstimator(unittest.TestCase):
+    """Test class for BusLoadEstimator objects."""
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.loop.close()
+
+    def test_telegram_duration(self):
+        """Test calculating frame length and bus time of telegrams."""
+        switch = Telegram(GroupAddress('1/2/3'), payload=DPTBinary(1))
+        temperature = Telegram(GroupAddress('1/2/3'), payload=DPTArray((0x0c, 0x65)))
+        read = Telegram(GroupAddress('1/2/3'), TelegramType.GROUP_READ)
+        self.assertEqual(BusLoadEstimator.frame_length(switch), 9)
+        self.assertEqual(BusLoadEstimator.frame_length(temperature), 11)
+        self.assertEqual(BusLoadEstimator.frame_length(read), 9)
+        # (50 + 9 * 13 + 15 + 13) bit times at 9600 bit/s
+        self.assertAlmostEqual(BusLoadEstimator.telegram_duration(switch), 195 / 9600)
+        self.assertAlmostEqual(BusLoadEstimator.telegram_duration(temperature), 221 / 9600)
+
+    def test_utilization_window(self):
+        """Test utilization of sliding window."""
+        xknx = XKNX(loop=self.loop)
+        bus_load = BusLoadEstimator(xknx, window_in_seconds=10)
+        incoming = Telegram(GroupAddress('1/2/3'), direction=TelegramDirection.INCOMING)
+        outgoing = Telegram(GroupAddress('1/2/3'), direction=TelegramDirection.OUTGOING)
+        duration = BusLoadEstimator.telegram_duration(incoming)
+        for second in range(10):
+            bus_load.record(incoming, timestamp=second)
+        bus_load.record(outgoing, timestamp=9)
+        self.assertAlmostEqual(bus_load.utilization(TelegramDirection.INCOMING, now=9), duration)
+        self.assertAlmostEqual(bus_load.utilization(TelegramDirection.OUTGOING, now=9), duration / 10)
+        self.assertAlmostEqual(bus_load.utilization(now=9), duration * 1.1)
+        self.assertAlmostEqual(bus_load.utilization(TelegramDirection.INCOMING, now=14.5), duration / 2)
+        self.assertEqual(bus_load.utilization(now=30), 0)
+
+    def test_outbound_delay(self):
+        """Test adapting delay of outgoing telegrams to incoming bus load."""
+        xknx = XKNX(loop=self.loop)
+        bus_load = BusLoadEstimator(xknx, target_utilization=0.5, window_in_seconds=1, min_rate=2, max_rate=50)
+        telegram = Telegram(GroupAddress('1/2/3'), payload=DPTArray((0x0c, 0x65)))
+        duration = BusLoadEstimator.telegram_duration(telegram)
+
+        # Idle bus: outgoing telegrams may use target utilization
+        self.assertAlmostEqual(bus_load.outbound_delay(telegram, now=0), duration / 0.5)
+
+        # Incoming telegrams use 0.25 of window
+        incoming = Telegram(GroupAddress('1/2/3'), direction=TelegramDirection.INCOMING)
+        incoming_duration = BusLoadEstimator.telegram_duration(incoming)
+        for _ in range(round(0.25 / incoming_duration)):
+            bus_load.record(incoming, timestamp=0)
+        available = 0.5 - bus_load.utilization(TelegramDirection.INCOMING, now=0)
+        self.assertAlmostEqual(bus_load.outbound_delay(telegram, now=0), duration / available)
+        self.assertGreater(bus_load.outbound_delay(telegram, now=0), duration / 0.5)
+
+        # Saturated bus: minimum rate
+        for _ in range(round(0.5 / incoming_duration)):
+            bus_load.record(incoming, timestamp=0)
+        self.assertEqual(bus_load.outbound_delay(telegram, now=0), 1 / 2)
+
+        # Maximum rate: a switch telegram occupies the bus for 195 / 9600 s, less than 1 / 40 s
+        bus_load.target_utilization = 1
+        bus_load.max_rate = 40
+        switch = Telegram(GroupAddress('1/2/3'), payload=DPTBinary(1))
+        self.assertEqual(bus_load.outbound_delay(switch, now=5), 1 / 40)
+
+    def test_metrics_and_telegram_queue(self):
+        """Test recording telegrams within TelegramQueue and exposing bus load as metric."""
+        xknx = XKNX(loop=self.loop)
+        telegram = Telegram(GroupAddress('1/2/3'), direction=TelegramDirection.INCOMING, payload=DPTBinary(1))
+        self.loop.run_until_complete(asyncio.Task(xknx.telegram_queue.process_telegram(telegram)))
+        gauges = xknx.metrics.snapshot()['gauges'][Metrics.BUS_LOAD]
+        self.assertAlmostEqual(
+            gauges[(('direction', 'incoming'),)],
+            BusLoadEstimator.telegram_duration(telegram) / xknx.bus_load.window_in_seconds)
+        self.assertEqual(gauges[(('direction', 'outgoing'),)], 0)
+
+    def test_telegram_queue_pacing(self):
+        """Test TelegramQueue waiting after outgoing telegrams as calculated by estimator."""
+        xknx = XKNX(loop=self.loop)
+        telegram = Telegram(GroupAddress('1/2/3'), payload=DPTBinary(1))
+        sleeps = []
+
+        async def sleep(delay):
+            """Record delay."""
+            sleeps.append(delay)
+
+        self.loop.run_until_complete(asyncio.Task(xknx.telegrams.put(telegram)))
+        self.loop.run_until_complete(asyncio.Task(xknx.telegrams.put(None)))
+        with patch('logging.Logger.warning'), \
+                patch('xknx.core.telegram_queue.asyncio.sleep', sleep):
+            self.loop.run_until_complete(asyncio.Task(xknx.telegram_queue.run()))
+        self.assertEqual(sleeps, [BusLoadEstimator.telegram_duration(telegram) / 0.5])
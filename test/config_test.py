@@ -1,5 +1,8 @@
 """Unit test for Configuration logic."""
 import asyncio
+import os
+import shutil
+import tempfile
 import unittest
 from unittest.mock import patch
 
@@ -7,6 +10,8 @@ from xknx import XKNX
 from xknx.devices import (Action, BinarySensor, Climate, Cover, DateTime,
                           ExposeSensor, Light, Notification, Scene, Sensor,
                           Switch, DateTimeBroadcastType)
+from xknx.core import Config, ConfigDiff, ConfigWatcher
+from xknx.knx import DPTBinary
 from xknx.exceptions import XKNXException
 
 
@@ -23,12 +28,18 @@ class TestConfig(unittest.TestCase):
         """Tear down test class."""
         self.loop.close()
 
+    def read_config(self):
+        """Return XKNX object with devices of xknx.yaml, read without writing a compiled cache."""
+        xknx = XKNX(loop=self.loop)
+        xknx.config.read('xknx.yaml', use_cache=False)
+        return xknx
+
     #
     # XKNX Config
     #
     def test_config_light(self):
         """Test reading Light from config file."""
-        xknx = XKNX(config='xknx.yaml', loop=self.loop)
+        xknx = self.read_config()
         self.assertEqual(
             xknx.devices['Living-Room.Light_1'],
             Light(xknx,
@@ -38,7 +49,7 @@ class TestConfig(unittest.TestCase):
 
     def test_config_light_state(self):
         """Test reading Light with dimming address from config file."""
-        xknx = XKNX(config='xknx.yaml', loop=self.loop)
+        xknx = self.read_config()
         self.assertEqual(
             xknx.devices['Office.Light_1'],
             Light(xknx,
@@ -51,7 +62,7 @@ class TestConfig(unittest.TestCase):
 
     def test_config_light_color(self):
         """Test reading Light with with dimming and color address."""
-        xknx = XKNX(config='xknx.yaml', loop=self.loop)
+        xknx = self.read_config()
         self.assertEqual(
             xknx.devices['Diningroom.Light_1'],
             Light(xknx,
@@ -64,7 +75,7 @@ class TestConfig(unittest.TestCase):
 
     def test_config_switch(self):
         """Test reading Switch from config file."""
-        xknx = XKNX(config='xknx.yaml', loop=self.loop)
+        xknx = self.read_config()
         self.assertEqual(
             xknx.devices['Livingroom.Outlet_2'],
             Switch(xknx,
@@ -74,7 +85,7 @@ class TestConfig(unittest.TestCase):
 
     def test_config_cover(self):
         """Test reading Cover from config file."""
-        xknx = XKNX(config='xknx.yaml', loop=self.loop)
+        xknx = self.read_config()
         self.assertEqual(
             xknx.devices['Livingroom.Shutter_2'],
             Cover(xknx,
@@ -89,7 +100,7 @@ class TestConfig(unittest.TestCase):
 
     def test_config_cover_venetian(self):
         """Test reading Cover with angle from config file."""
-        xknx = XKNX(config='xknx.yaml', loop=self.loop)
+        xknx = self.read_config()
         self.assertEqual(
             xknx.devices['Children.Venetian'],
             Cover(xknx,
@@ -104,7 +115,7 @@ class TestConfig(unittest.TestCase):
 
     def test_config_cover_venetian_with_inverted_position(self):
         """Test reading Cover with angle from config file with inverted position/angle."""
-        xknx = XKNX(config='xknx.yaml', loop=self.loop)
+        xknx = self.read_config()
         self.assertEqual(
             xknx.devices['Children.Venetian2'],
             Cover(xknx,
@@ -121,7 +132,7 @@ class TestConfig(unittest.TestCase):
 
     def test_config_climate_temperature(self):
         """Test reading Climate object from config file."""
-        xknx = XKNX(config='xknx.yaml', loop=self.loop)
+        xknx = self.read_config()
         self.assertEqual(
             xknx.devices['Kitchen.Climate'],
             Climate(xknx,
@@ -131,7 +142,7 @@ class TestConfig(unittest.TestCase):
 
     def test_config_climate_target_temperature_and_setpoint_shift(self):
         """Test reading Climate object with target_temperature_address and setpoint shift from config file."""
-        xknx = XKNX(config='xknx.yaml', loop=self.loop)
+        xknx = self.read_config()
         self.assertEqual(
             xknx.devices['Children.Climate'],
             Climate(xknx,
@@ -147,7 +158,7 @@ class TestConfig(unittest.TestCase):
 
     def test_config_climate_operation_mode(self):
         """Test reading Climate object with operation mode in one group address from config file."""
-        xknx = XKNX(config='xknx.yaml', loop=self.loop)
+        xknx = self.read_config()
         self.assertEqual(
             xknx.devices['Office.Climate'],
             Climate(xknx,
@@ -158,7 +169,7 @@ class TestConfig(unittest.TestCase):
 
     def test_config_climate_operation_mode2(self):
         """Test reading Climate object with operation mode in different group addresses  from config file."""
-        xknx = XKNX(config='xknx.yaml', loop=self.loop)
+        xknx = self.read_config()
         self.assertEqual(
             xknx.devices['Attic.Climate'],
             Climate(xknx,
@@ -171,7 +182,7 @@ class TestConfig(unittest.TestCase):
 
     def test_config_climate_operation_mode_state(self):
         """Test reading Climate object with status address for operation mode."""
-        xknx = XKNX(config='xknx.yaml', loop=self.loop)
+        xknx = self.read_config()
         self.assertEqual(
             xknx.devices['Bath.Climate'],
             Climate(xknx,
@@ -183,7 +194,7 @@ class TestConfig(unittest.TestCase):
 
     def test_config_climate_controller_status_state(self):
         """Test reading Climate object with addresses for controller status."""
-        xknx = XKNX(config='xknx.yaml', loop=self.loop)
+        xknx = self.read_config()
         self.assertEqual(
             xknx.devices['Cellar.Climate'],
             Climate(xknx,
@@ -195,7 +206,7 @@ class TestConfig(unittest.TestCase):
 
     def test_config_datetime(self):
         """Test reading DateTime objects from config file."""
-        xknx = XKNX(config='xknx.yaml', loop=self.loop)
+        xknx = self.read_config()
         self.assertEqual(
             xknx.devices['General.Time'],
             DateTime(
@@ -223,7 +234,7 @@ class TestConfig(unittest.TestCase):
 
     def test_config_notification(self):
         """Test reading DateTime object from config file."""
-        xknx = XKNX(config='xknx.yaml', loop=self.loop)
+        xknx = self.read_config()
         self.assertEqual(
             xknx.devices['AlarmWindow'],
             Notification(
@@ -234,7 +245,7 @@ class TestConfig(unittest.TestCase):
 
     def test_config_binary_sensor(self):
         """Test reading BinarySensor from config file."""
-        xknx = XKNX(config='xknx.yaml', loop=self.loop)
+        xknx = self.read_config()
         self.assertEqual(
             xknx.devices['Livingroom.Switch_1'],
             BinarySensor(xknx,
@@ -252,7 +263,7 @@ class TestConfig(unittest.TestCase):
 
     def test_config_sensor_percent(self):
         """Test reading percent Sensor from config file."""
-        xknx = XKNX(config='xknx.yaml', loop=self.loop)
+        xknx = self.read_config()
         self.assertEqual(
             xknx.devices['Heating.Valve1'],
             Sensor(xknx,
@@ -263,7 +274,7 @@ class TestConfig(unittest.TestCase):
 
     def test_config_sensor_temperature_type(self):
         """Test reading temperature Sensor from config file."""
-        xknx = XKNX(config='xknx.yaml', loop=self.loop)
+        xknx = self.read_config()
         self.assertEqual(
             xknx.devices['Kitchen.Temperature'],
             Sensor(xknx,
@@ -274,7 +285,7 @@ class TestConfig(unittest.TestCase):
 
     def test_config_expose_sensor(self):
         """Test reading ExposeSensor from config file."""
-        xknx = XKNX(config='xknx.yaml', loop=self.loop)
+        xknx = self.read_config()
         self.assertEqual(
             xknx.devices['Outside.Temperature'],
             ExposeSensor(
@@ -286,7 +297,7 @@ class TestConfig(unittest.TestCase):
 
     def test_config_sensor_binary_device_class(self):
         """Test reading Sensor with device_class from config file."""
-        xknx = XKNX(config='xknx.yaml', loop=self.loop)
+        xknx = self.read_config()
         self.assertEqual(
             xknx.devices['DiningRoom.Motion.Sensor'],
             BinarySensor(xknx,
@@ -297,7 +308,7 @@ class TestConfig(unittest.TestCase):
 
     def test_config_sensor_binary_significant_bit(self):
         """Test reading Sensor with differing significant bit from config file."""
-        xknx = XKNX(config='xknx.yaml', loop=self.loop)
+        xknx = self.read_config()
         self.assertEqual(
             xknx.devices['Kitchen.Presence'],
             BinarySensor(xknx,
@@ -309,7 +320,7 @@ class TestConfig(unittest.TestCase):
 
     def test_config_scene(self):
         """Test reading Scene from config file."""
-        xknx = XKNX(config='xknx.yaml', loop=self.loop)
+        xknx = self.read_config()
         self.assertEqual(
             xknx.devices["Romantic"],
             Scene(
@@ -330,5 +341,120 @@ class TestConfig(unittest.TestCase):
         with patch('logging.Logger.error') as mock_err, \
                 patch('xknx.core.Config.parse_group_light') as mock_parse:
             mock_parse.side_effect = XKNXException()
-            XKNX(config='xknx.yaml', loop=self.loop)
+            self.read_config()
             self.assertEqual(mock_err.call_count, 1)
+
+    #
+    # Compiled config cache
+    #
+    def test_config_cache(self):
+        """Test writing compiled cache and reading config from cache without YAML parsing."""
+        with tempfile.TemporaryDirectory() as directory:
+            config_file = os.path.join(directory, 'xknx.yaml')
+            shutil.copy('xknx.yaml', config_file)
+            xknx = XKNX(config=config_file, loop=self.loop)
+            self.assertTrue(os.path.exists(os.path.join(directory, '.xknx.yaml.cache')))
+
+            with patch('yaml.load') as mock_load, \
+                    patch('xknx.knx.GroupAddress.ADDRESS_RE') as mock_re:
+                xknx2 = XKNX(config=config_file, loop=self.loop)
+                mock_load.assert_not_called()
+                mock_re.match.assert_not_called()
+            self.assertEqual(len(xknx2.devices), len(xknx.devices))
+            self.assertEqual(
+                xknx2.devices['Livingroom.Outlet_1'],
+                Switch(xknx2,
+                       'Livingroom.Outlet_1',
+                       group_address='1/3/1',
+                       device_updated_cb=xknx2.devices.device_updated))
+
+    def test_config_cache_invalidation(self):
+        """Test cache being used if only mtime changed and being invalidated if content changed."""
+        with tempfile.TemporaryDirectory() as directory:
+            config_file = os.path.join(directory, 'xknx.yaml')
+            with open(config_file, 'w') as filehandle:
+                filehandle.write("groups:\n    switch:\n        Outlet: {group_address: '1/3/1'}\n")
+            xknx = XKNX(config=config_file, loop=self.loop)
+            self.assertEqual(xknx.devices['Outlet'].switch.group_address.raw, 2817)
+
+            os.utime(config_file, (0, 0))
+            with patch('yaml.load') as mock_load:
+                XKNX(config=config_file, loop=self.loop)
+                mock_load.assert_not_called()
+
+            with open(config_file, 'w') as filehandle:
+                filehandle.write("groups:\n    switch:\n        Outlet: {group_address: '1/3/12'}\n")
+            os.utime(config_file, (0, 0))
+            xknx = XKNX(config=config_file, loop=self.loop)
+            self.assertEqual(xknx.devices['Outlet'].switch.group_address.raw, 2828)
+
+    def test_config_compile(self):
+        """Test converting group addresses to integers."""
+        self.assertEqual(
+            Config.compile({'groups': {'switch': {
+                'Outlet': {'group_address': '1/3/1', 'group_address_state': 'invalid', 'name': '1/3/1'}}}}),
+            {'groups': {'switch': {
+                'Outlet': {'group_address': 2817, 'group_address_state': 'invalid', 'name': '1/3/1'}}}})
+
+    def test_config_reload(self):
+        """Test reloading config, only touching changed devices and keeping state."""
+        with tempfile.TemporaryDirectory() as directory:
+            config_file = os.path.join(directory, 'xknx.yaml')
+            with open(config_file, 'w') as filehandle:
+                filehandle.write(
+                    "groups:\n    switch:\n"
+                    "        Outlet: {group_address: '1/3/1'}\n"
+                    "        Kitchen: {group_address: '1/3/2', group_address_state: '1/3/3'}\n"
+                    "        Removed: {group_address: '1/3/4'}\n")
+            xknx = XKNX(config=config_file, loop=self.loop)
+            outlet = xknx.devices['Outlet']
+            kitchen = xknx.devices['Kitchen']
+            removed = xknx.devices['Removed']
+            kitchen.switch.payload = DPTBinary(1)
+
+            with open(config_file, 'w') as filehandle:
+                filehandle.write(
+                    "groups:\n    switch:\n"
+                    "        Outlet: {group_address: '1/3/1'}\n"
+                    "        Kitchen: {group_address: '1/3/12', group_address_state: '1/3/3'}\n"
+                    "        Added: {group_address: '1/3/5'}\n")
+            xknx.started = True
+            with patch('xknx.core.ValueReader.send_group_read') as mock_read:
+                fut = asyncio.Future()
+                fut.set_result(None)
+                mock_read.return_value = fut
+                diff = self.loop.run_until_complete(asyncio.Task(xknx.config.reload()))
+                self.assertEqual(mock_read.call_count, 1)
+            xknx.started = False
+
+            self.assertEqual(diff, ConfigDiff(added=['Added'], removed=['Removed'], changed=['Kitchen']))
+            self.assertEqual(len(xknx.devices), 3)
+            self.assertIs(xknx.devices['Outlet'], outlet)
+            self.assertIsNot(xknx.devices['Kitchen'], kitchen)
+            self.assertEqual(xknx.devices['Kitchen'].switch.group_address.raw, 2828)
+            self.assertTrue(xknx.devices['Kitchen'].state)
+            self.assertNotIn(removed, list(xknx.devices))
+            self.assertEqual(
+                xknx.devices['Added'],
+                Switch(xknx, 'Added', group_address='1/3/5',
+                       device_updated_cb=xknx.devices.device_updated))
+
+    def test_config_watcher(self):
+        """Test ConfigWatcher reloading config only if file changed."""
+        with tempfile.TemporaryDirectory() as directory:
+            config_file = os.path.join(directory, 'xknx.yaml')
+            with open(config_file, 'w') as filehandle:
+                filehandle.write("groups:\n    switch:\n        Outlet: {group_address: '1/3/1'}\n")
+            xknx = XKNX(config=config_file, loop=self.loop)
+            watcher = ConfigWatcher(xknx)
+            self.loop.run_until_complete(asyncio.Task(watcher.start()))
+            self.assertIsNone(self.loop.run_until_complete(asyncio.Task(watcher.check())))
+
+            with open(config_file, 'w') as filehandle:
+                filehandle.write("groups:\n    switch:\n        Outlet2: {group_address: '1/3/1'}\n")
+            os.utime(config_file, ns=(0, 0))
+            diff = self.loop.run_until_complete(asyncio.Task(watcher.check()))
+            self.assertEqual(diff, ConfigDiff(added=['Outlet2'], removed=['Outlet'], changed=[]))
+            self.assertEqual(xknx.devices['Outlet2'].name, 'Outlet2')
+            self.loop.run_until_complete(asyncio.Task(watcher.stop()))
+            self.assertIsNone(watcher.run_task)
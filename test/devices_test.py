@@ -184,6 +184,64 @@ class TestDevices(unittest.TestCase):
             self.loop.run_until_complete(asyncio.Task(device.set_on()))
         self.assertTrue(light1.state)
 
+    def test_devices_by_type(self):
+        """Test get devices by type."""
+        xknx = XKNX(loop=self.loop)
+        devices = Devices()
+        light1 = Light(xknx, 'Living-Room.Light_1', group_address_switch='1/6/7')
+        switch1 = Switch(xknx, 'TestOutlet_1', group_address='1/2/3')
+        light2 = Light(xknx, 'Living-Room.Light_2', group_address_switch='1/6/8')
+        devices.add(light1)
+        devices.add(switch1)
+        devices.add(light2)
+        self.assertEqual(list(devices.devices_by_type(Light)), [light1, light2])
+        self.assertEqual(list(devices.devices_by_type(Switch)), [switch1])
+        self.assertEqual(len(list(devices.devices_by_type(Device))), 3)
+        self.assertEqual(list(devices.devices_by_type(BinarySensor)), [])
+
+    def test_remove(self):
+        """Test removing devices keeping lookup by name and type consistent."""
+        xknx = XKNX(loop=self.loop)
+        devices = Devices()
+        switch1 = Switch(xknx, 'TestOutlet', group_address='1/2/3')
+        switch2 = Switch(xknx, 'TestOutlet', group_address='1/2/4')
+        light1 = Light(xknx, 'Living-Room.Light_1', group_address_switch='1/6/7')
+        devices.add(switch1)
+        devices.add(switch2)
+        devices.add(light1)
+        self.assertIs(devices['TestOutlet'], switch1)
+
+        devices.remove(switch1)
+        self.assertIs(devices['TestOutlet'], switch2)
+        self.assertEqual(list(devices), [switch2, light1])
+        self.assertEqual(list(devices.devices_by_type(Switch)), [switch2])
+        self.assertEqual(switch1.device_updated_cbs, [])
+
+        devices.remove(light1)
+        with self.assertRaises(KeyError):
+            # pylint: disable=pointless-statement
+            devices['Living-Room.Light_1']
+        self.assertEqual(list(devices.devices_by_type(Light)), [])
+        with self.assertRaises(ValueError):
+            devices.remove(light1)
+        self.assertEqual(len(devices), 1)
+
+    def test_remove_identical(self):
+        """Test removing the given device object and not an equal twin."""
+        xknx = XKNX(loop=self.loop)
+        devices = Devices()
+        switch1 = Switch(xknx, 'TestOutlet', group_address='1/2/3')
+        switch2 = Switch(xknx, 'TestOutlet', group_address='1/2/3')
+        devices.add(switch1)
+        devices.add(switch2)
+        self.assertEqual(switch1, switch2)
+
+        devices.remove(switch2)
+        self.assertEqual(len(devices), 1)
+        self.assertIs(devices[0], switch1)
+        self.assertIs(devices['TestOutlet'], switch1)
+        self.assertIs(list(devices.devices_by_type(Switch))[0], switch1)
+
     def test_add_wrong_type(self):
         """Test if exception is raised when wrong type of devices is added."""
         xknx = XKNX(loop=self.loop)
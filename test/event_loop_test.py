@@ -0,0 +1,79 @@
+"""Unit test for running XKNX on an injected event loop."""
+import asyncio
+import sys
+import unittest
+
+from xknx import XKNX
+from xknx.core import ValueReader
+from xknx.core.event_loop import loop_kwargs
+from xknx.io import ConnectionConfig, ConnectionType, GatewaySimulator
+from xknx.knx import DPTBinary, GroupAddress, Telegram
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+class TestEventLoop(unittest.TestCase):
+    """Test class for running XKNX on an injected event loop."""
+
+    def setUp(self):
+        """Set up test class."""
+        # XKNX must not depend on the current event loop
+        asyncio.set_event_loop(None)
+
+    def tearDown(self):
+        """Tear down test class."""
+        asyncio.set_event_loop_policy(None)
+
+    def test_loop_kwargs(self):
+        """Test keyword arguments for binding asyncio primitives."""
+        loop = asyncio.new_event_loop()
+        if sys.version_info < (3, 10):
+            self.assertEqual(loop_kwargs(loop), {'loop': loop})
+        else:
+            self.assertEqual(loop_kwargs(loop), {})
+        loop.close()
+
+    def write_and_read(self, loop):
+        """Write and read group address via tunnel to GatewaySimulator running on loop."""
+        xknx = XKNX(loop=loop)
+        xknx.update_dispatcher.max_concurrency = 2
+        simulator = GatewaySimulator(xknx)
+
+        async def run():
+            """Connect, write, read and disconnect."""
+            await simulator.start()
+            (gateway_ip, gateway_port) = simulator.address
+            await xknx.start(connection_config=ConnectionConfig(
+                connection_type=ConnectionType.TUNNELING,
+                local_ip='127.0.0.1',
+                gateway_ip=gateway_ip,
+                gateway_port=gateway_port))
+            await xknx.telegrams.put(Telegram(GroupAddress('1/2/3'), payload=DPTBinary(1)))
+            await xknx.join()
+            telegram = await ValueReader(xknx, GroupAddress('1/2/3')).read()
+            await xknx.stop()
+            await simulator.stop()
+            return telegram
+
+        telegram = loop.run_until_complete(run())
+        self.assertEqual(telegram.payload, DPTBinary(1))
+
+    def test_injected_loop(self):
+        """Test XKNX using loop which is not the current event loop."""
+        loop = asyncio.new_event_loop()
+        try:
+            self.write_and_read(loop)
+        finally:
+            loop.close()
+
+    @unittest.skipIf(uvloop is None, "uvloop not installed")
+    def test_uvloop(self):
+        """Test XKNX using uvloop."""
+        loop = uvloop.new_event_loop()
+        try:
+            self.write_and_read(loop)
+        finally:
+            loop.close()
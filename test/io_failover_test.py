@@ -0,0 +1,170 @@
+"""Unit test for FailoverInterface objects."""
+import asyncio
+import unittest
+
+from xknx import XKNX
+from xknx.exceptions import XKNXException
+from xknx.io import (ConnectionConfig, ConnectionType, FailoverInterface,
+                     GatewaySimulator)
+from xknx.knx import DPTBinary, GroupAddress, Telegram
+
+
+class TestFailoverInterface(unittest.TestCase):
+    """Test class for FailoverInterface objects."""
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.xknx = XKNX(loop=self.loop)
+        self.simulators = [GatewaySimulator(self.xknx), GatewaySimulator(self.xknx)]
+        for simulator in self.simulators:
+            self.loop.run_until_complete(simulator.start())
+        self.addresses = [simulator.address for simulator in self.simulators]
+        self.received_telegrams = []
+        self.connection_lost = 0
+        self.failover = None
+
+    def tearDown(self):
+        """Tear down test class."""
+        if self.failover is not None:
+            self.loop.run_until_complete(self.failover.stop())
+        for simulator in self.simulators:
+            self.loop.run_until_complete(simulator.stop())
+        self.loop.close()
+
+    def connection_lost_callback(self):
+        """Count lost connections."""
+        self.connection_lost += 1
+
+    def start_failover(self, **kwargs):
+        """Start failover between tunnels to both simulators."""
+        self.failover = FailoverInterface(
+            self.xknx,
+            [ConnectionConfig(
+                connection_type=ConnectionType.TUNNELING,
+                local_ip='127.0.0.1',
+                gateway_ip=gateway_ip,
+                gateway_port=gateway_port) for gateway_ip, gateway_port in self.addresses],
+            telegram_received_callback=self.received_telegrams.append,
+            connection_lost_callback=self.connection_lost_callback,
+            **kwargs)
+        self.loop.run_until_complete(self.failover.start())
+
+    def send(self, address):
+        """Send telegram via failover interface."""
+        telegram = Telegram(GroupAddress(address), payload=DPTBinary(1))
+        self.loop.run_until_complete(self.failover.send_telegram(telegram))
+        return telegram
+
+    def receive(self):
+        """Send indication from every simulator and return group addresses received via failover interface."""
+        del self.received_telegrams[:]
+        for number, simulator in enumerate(self.simulators):
+            simulator.send_indication(Telegram(GroupAddress(number + 1), payload=DPTBinary(1)))
+        self.loop.run_until_complete(asyncio.sleep(0.05))
+        return [telegram.group_address for telegram in self.received_telegrams]
+
+    def test_send_via_first_healthy_endpoint(self):
+        """Test sending via first endpoint and switching if heartbeat failed."""
+        self.start_failover()
+        first, second = self.failover.endpoints
+        telegram1 = self.send('1/2/3')
+        self.assertIs(self.failover.active, first)
+        self.assertEqual(list(self.simulators[0].received_telegrams), [telegram1])
+
+        self.xknx.heartbeat_manager.failures[first.interface] = 1
+        telegram2 = self.send('1/2/4')
+        self.assertIs(self.failover.active, second)
+        self.assertEqual(list(self.simulators[1].received_telegrams), [telegram2])
+
+        # Back to preferred endpoint if healthy again
+        self.xknx.heartbeat_manager.failures[first.interface] = 0
+        self.send('1/2/5')
+        self.assertIs(self.failover.active, first)
+
+    def test_receive_from_active_endpoint_only(self):
+        """Test ignoring telegrams received via standby endpoints."""
+        self.start_failover()
+        self.assertEqual(self.receive(), [GroupAddress(1)])
+
+    def test_heartbeat_changed(self):
+        """Test receiving via standby endpoint while heartbeat of active endpoint fails."""
+        self.start_failover()
+        first, second = self.failover.endpoints
+        success = {'value': False}
+
+        async def connectionstate():
+            """Return configured result of probe."""
+            return success['value']
+        first.interface.connectionstate = connectionstate
+
+        self.loop.run_until_complete(self.xknx.heartbeat_manager.probe(first.interface))
+        self.assertIs(self.failover.active, second)
+        self.assertEqual(self.receive(), [GroupAddress(2)])
+
+        success['value'] = True
+        self.loop.run_until_complete(self.xknx.heartbeat_manager.probe(first.interface))
+        self.assertIs(self.failover.active, first)
+        self.assertEqual(self.receive(), [GroupAddress(1)])
+
+    def test_latency(self):
+        """Test degrading endpoint with high ACK latency."""
+        self.start_failover(max_latency_in_seconds=0.1, retry_interval_in_seconds=10)
+        first, second = self.failover.endpoints
+        self.failover.record_latency(first, 0.05)
+        self.assertIs(self.failover.select(), first)
+        self.failover.record_latency(first, 2)
+        self.assertIs(self.failover.select(), second)
+        self.assertFalse(self.failover.healthy(first))
+        self.assertTrue(self.failover.healthy(first, now=first.degraded_until))
+        self.assertIsNone(first.latency)
+
+    def test_all_endpoints_slow(self):
+        """Test sending via degraded endpoint with lowest latency if no healthy endpoint is left."""
+        self.start_failover(max_latency_in_seconds=0.1, retry_interval_in_seconds=10)
+        first, second = self.failover.endpoints
+        self.failover.record_latency(first, 2)
+        self.failover.record_latency(second, 1)
+        self.assertIs(self.failover.select(), second)
+        telegram = self.send('1/2/3')
+        self.assertIs(self.failover.active, second)
+        self.assertEqual(list(self.simulators[1].received_telegrams), [telegram])
+
+        # Degraded endpoint is used after losing the other one
+        second.interface.connection_lost_callback()
+        self.assertIs(self.failover.active, first)
+        self.assertEqual(self.connection_lost, 0)
+
+    def test_endpoint_lost(self):
+        """Test switching endpoint and reconnecting lost endpoint in background."""
+        self.start_failover(retry_interval_in_seconds=0.01)
+        first, second = self.failover.endpoints
+        first.interface.connection_lost_callback()
+        self.assertFalse(first.connected)
+        self.assertIs(self.failover.active, second)
+        self.assertEqual(self.connection_lost, 0)
+        self.assertEqual(self.receive(), [GroupAddress(2)])
+
+        self.loop.run_until_complete(first.reconnect_task)
+        self.assertTrue(first.connected)
+        self.assertIs(self.failover.active, first)
+        self.assertEqual(self.receive(), [GroupAddress(1)])
+
+        # Losing all endpoints is reported
+        first.interface.connection_lost_callback()
+        second.interface.connection_lost_callback()
+        self.assertEqual(self.connection_lost, 1)
+        with self.assertRaises(XKNXException):
+            self.send('1/2/3')
+        self.loop.run_until_complete(self.failover.reconnect())
+        self.assertIs(self.failover.active, first)
+        self.assertTrue(second.connected)
+
+    def test_no_endpoint_connected(self):
+        """Test starting without reachable endpoint."""
+        for simulator in self.simulators:
+            self.loop.run_until_complete(simulator.stop())
+        with self.assertRaises(XKNXException):
+            self.start_failover()
+        self.failover = None
@@ -0,0 +1,124 @@
+"""Unit test for GatewaySimulator objects."""
+import asyncio
+import unittest
+
+from xknx import XKNX
+from xknx.io import GatewaySimulator, Tunnel, UDPClient
+from xknx.knx import (DPTArray, DPTBinary, GroupAddress, PhysicalAddress,
+                      Telegram, TelegramType)
+from xknx.knxip import HPAI, KNXIPFrame, KNXIPServiceType
+
+
+class TestGatewaySimulator(unittest.TestCase):
+    """Test class for GatewaySimulator objects."""
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.xknx = XKNX(loop=self.loop)
+        self.simulator = GatewaySimulator(self.xknx)
+        self.loop.run_until_complete(asyncio.Task(self.simulator.start()))
+        self.received_telegrams = []
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.loop.run_until_complete(asyncio.Task(self.simulator.stop()))
+        self.loop.close()
+
+    def start_tunnel(self):
+        """Connect tunnel to simulator."""
+        (gateway_ip, gateway_port) = self.simulator.address
+        tunnel = Tunnel(
+            self.xknx,
+            PhysicalAddress('1.1.1'),
+            local_ip='127.0.0.1',
+            gateway_ip=gateway_ip,
+            gateway_port=gateway_port,
+            telegram_received_callback=self.received_telegrams.append)
+        tunnel.init_udp_client()
+        self.loop.run_until_complete(asyncio.Task(tunnel.start()))
+        return tunnel
+
+    def test_tunnel(self):
+        """Test connecting, sending, checking connection state and disconnecting."""
+        tunnel = self.start_tunnel()
+        self.assertEqual(tunnel.communication_channel, 1)
+        self.assertEqual(len(self.simulator.connections), 1)
+
+        telegram = Telegram(GroupAddress('1/2/3'), payload=DPTArray((0x12, 0x34)))
+        self.loop.run_until_complete(asyncio.Task(tunnel.send_telegram(telegram)))
+        self.assertEqual(tunnel.sequence_number, 1)
+        self.assertEqual(self.simulator.group_values[GroupAddress('1/2/3').raw], DPTArray((0x12, 0x34)))
+        self.assertEqual(list(self.simulator.received_telegrams), [telegram])
+
+        self.assertTrue(self.loop.run_until_complete(asyncio.Task(tunnel.connectionstate())))
+        self.loop.run_until_complete(asyncio.Task(tunnel.stop()))
+        self.assertEqual(self.simulator.connections, {})
+
+    def test_group_read(self):
+        """Test answering GROUP_READ of simulated device."""
+        self.simulator.set_value('1/2/3', DPTBinary(1))
+        tunnel = self.start_tunnel()
+        telegram = Telegram(GroupAddress('1/2/3'), TelegramType.GROUP_READ)
+        self.loop.run_until_complete(asyncio.Task(tunnel.send_telegram(telegram)))
+        self.loop.run_until_complete(asyncio.sleep(0.05))
+        self.assertEqual(len(self.received_telegrams), 1)
+        self.assertEqual(self.received_telegrams[0].telegramtype, TelegramType.GROUP_RESPONSE)
+        self.assertEqual(self.received_telegrams[0].group_address, GroupAddress('1/2/3'))
+        self.assertEqual(self.received_telegrams[0].payload, DPTBinary(1))
+
+        # No response for unknown group address
+        telegram = Telegram(GroupAddress('1/2/4'), TelegramType.GROUP_READ)
+        self.loop.run_until_complete(asyncio.Task(tunnel.send_telegram(telegram)))
+        self.loop.run_until_complete(asyncio.sleep(0.05))
+        self.assertEqual(len(self.received_telegrams), 1)
+
+    def test_unknown_channel(self):
+        """Test connection state request for unknown channel."""
+        tunnel = self.start_tunnel()
+        tunnel.communication_channel = 23
+        self.assertFalse(self.loop.run_until_complete(asyncio.Task(tunnel.connectionstate())))
+
+    def test_search(self):
+        """Test answering SEARCH_REQUEST."""
+        responses = []
+        udp_client = UDPClient(self.xknx, ('127.0.0.1', 0), self.simulator.address)
+        udp_client.register_callback(
+            lambda knxipframe, _: responses.append(knxipframe),
+            [KNXIPServiceType.SEARCH_RESPONSE])
+        self.loop.run_until_complete(asyncio.Task(udp_client.connect()))
+        (local_ip, local_port) = udp_client.getsockname()
+        search_request = KNXIPFrame(self.xknx)
+        search_request.init(KNXIPServiceType.SEARCH_REQUEST)
+        search_request.body.discovery_endpoint = HPAI(ip_addr=local_ip, port=local_port)
+        search_request.normalize()
+        udp_client.send(search_request)
+        self.loop.run_until_complete(asyncio.sleep(0.05))
+        self.loop.run_until_complete(asyncio.Task(udp_client.stop()))
+
+        self.assertEqual(len(responses), 1)
+        self.assertEqual(responses[0].body.control_endpoint.port, self.simulator.address[1])
+        self.assertEqual(responses[0].body.device_name, 'XKNX Gateway Simulator')
+
+    def test_latency_and_loss(self):
+        """Test delaying and dropping frames."""
+        self.simulator.latency = 0.01
+        tunnel = self.start_tunnel()
+        self.assertEqual(tunnel.communication_channel, 1)
+        self.simulator.loss = 1
+        self.assertFalse(self.loop.run_until_complete(asyncio.Task(tunnel.connectionstate())))
+        self.assertGreater(self.simulator.frames_dropped, 0)
+
+    def test_generate_load(self):
+        """Test generating indications with a given rate."""
+        self.start_tunnel()
+        start_time = self.loop.time()
+        self.loop.run_until_complete(asyncio.Task(
+            self.simulator.generate_load(rate=200, count=10, group_address='1/2/5')))
+        self.loop.run_until_complete(asyncio.sleep(0.05))
+        self.assertGreaterEqual(self.loop.time() - start_time, 0.045)
+        self.assertEqual(len(self.received_telegrams), 10)
+        self.assertEqual(self.received_telegrams[0].group_address, GroupAddress('1/2/5'))
+        self.assertEqual(self.received_telegrams[0].payload, DPTBinary(1))
+        self.assertEqual(self.simulator.connections[1].sequence_counter, 10)
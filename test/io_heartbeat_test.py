@@ -0,0 +1,111 @@
+"""Unit test for HeartbeatManager objects."""
+import asyncio
+import unittest
+
+from xknx import XKNX
+from xknx.core import Metrics
+from xknx.io import HeartbeatManager
+
+
+class FakeTunnel():
+    """Tunnel answering CONNECTIONSTATE requests with configured result."""
+
+    def __init__(self, success=True):
+        """Initialize FakeTunnel class."""
+        self.success = success
+        self.probes = 0
+        self.reconnects = 0
+        self.changes = []
+
+    async def connectionstate(self):
+        """Count probe and return configured result."""
+        self.probes += 1
+        return self.success
+
+    async def connection_lost(self):
+        """Count reconnect."""
+        self.reconnects += 1
+
+    def heartbeat_changed(self, healthy):
+        """Record change of heartbeat state."""
+        self.changes.append(healthy)
+
+
+class TestHeartbeatManager(unittest.TestCase):
+    """Test class for HeartbeatManager objects."""
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.xknx = XKNX(loop=self.loop)
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.loop.close()
+
+    def sleep(self, seconds):
+        """Run loop for seconds."""
+        self.loop.run_until_complete(asyncio.sleep(seconds))
+
+    def test_probe_all_tunnels_from_one_task(self):
+        """Test probing registered tunnels within interval."""
+        manager = HeartbeatManager(self.xknx, interval_in_seconds=0.05)
+        tunnel1 = FakeTunnel()
+        tunnel2 = FakeTunnel()
+        manager.register(tunnel1)
+        run_task = manager.run_task
+        manager.register(tunnel2)
+        self.assertIs(manager.run_task, run_task)
+        self.sleep(0.12)
+        self.assertEqual(tunnel1.probes, 2)
+        self.assertEqual(tunnel2.probes, 2)
+
+        self.loop.run_until_complete(manager.unregister(tunnel1))
+        self.assertIs(manager.run_task, run_task)
+        self.loop.run_until_complete(manager.unregister(tunnel2))
+        self.assertIsNone(manager.run_task)
+        self.assertTrue(run_task.cancelled())
+
+    def test_alive_postpones_probe(self):
+        """Test traffic postponing probes until maximum interval."""
+        manager = HeartbeatManager(self.xknx, interval_in_seconds=0.05, max_interval_in_seconds=0.2)
+        tunnel = FakeTunnel()
+        manager.register(tunnel)
+        for _ in range(8):
+            self.sleep(0.03)
+            manager.alive(tunnel)
+        self.assertEqual(tunnel.probes, 1)
+        self.loop.run_until_complete(manager.stop())
+
+    def test_failures(self):
+        """Test probing faster after failure and reconnecting after max_failures."""
+        manager = HeartbeatManager(
+            self.xknx, interval_in_seconds=0.2, retry_interval_in_seconds=0.01, max_failures=3)
+        tunnel = FakeTunnel(success=False)
+        manager.register(tunnel)
+        manager.next_probe[tunnel] = self.loop.time()
+        self.sleep(0.1)
+        self.assertEqual(tunnel.probes, 4)
+        self.assertEqual(tunnel.reconnects, 1)
+        self.assertEqual(manager.failures[tunnel], 0)
+        self.assertEqual(tunnel.changes, [False])
+        self.assertEqual(self.xknx.metrics.snapshot()['counters'][Metrics.HEARTBEAT_FAILURES][()], 4)
+        self.loop.run_until_complete(manager.stop())
+
+    def test_heartbeat_changed(self):
+        """Test notifying tunnel about first failed probe and recovery only."""
+        manager = HeartbeatManager(self.xknx, max_failures=3)
+        tunnel = FakeTunnel()
+        manager.register(tunnel)
+        self.loop.run_until_complete(manager.probe(tunnel))
+        self.assertEqual(tunnel.changes, [])
+        tunnel.success = False
+        self.loop.run_until_complete(manager.probe(tunnel))
+        self.loop.run_until_complete(manager.probe(tunnel))
+        self.assertEqual(tunnel.changes, [False])
+        tunnel.success = True
+        self.loop.run_until_complete(manager.probe(tunnel))
+        self.loop.run_until_complete(manager.probe(tunnel))
+        self.assertEqual(tunnel.changes, [False, True])
+        self.loop.run_until_complete(manager.stop())
@@ -0,0 +1,161 @@
+"""Unit test for reconnecting and buffering of KNXIPInterface objects."""
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from xknx import XKNX
+from xknx.exceptions import XKNXException
+from xknx.io import (ConnectionConfig, InterfaceState, KNXIPInterface,
+                     OutboundBuffer)
+from xknx.knx import DPTBinary, GroupAddress, Telegram, TelegramType
+
+
+class FakeInterface():
+    """Interface failing to send and to reconnect as configured."""
+
+    def __init__(self, reconnect_failures=0):
+        """Initialize FakeInterface class."""
+        self.connected = True
+        self.reconnect_failures = reconnect_failures
+        self.reconnects = 0
+        self.sent = []
+
+    async def send_telegram(self, telegram):
+        """Send telegram if connected."""
+        if not self.connected:
+            raise XKNXException("Could not send telegram to tunnel")
+        self.sent.append(telegram)
+
+    async def reconnect(self):
+        """Reconnect after configured number of failures."""
+        self.reconnects += 1
+        if self.reconnects <= self.reconnect_failures:
+            raise XKNXException("Could not establish connection")
+        self.connected = True
+
+
+def telegram(address, value=1, telegramtype=TelegramType.GROUP_WRITE):
+    """Return telegram to group address."""
+    return Telegram(GroupAddress(address), telegramtype, payload=DPTBinary(value))
+
+
+class TestOutboundBuffer(unittest.TestCase):
+    """Test class for OutboundBuffer objects."""
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.xknx = XKNX(loop=self.loop)
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.loop.close()
+
+    def test_bounded(self):
+        """Test dropping oldest telegram if buffer is full."""
+        buffer = OutboundBuffer(self.xknx, maxsize=2)
+        for address in (1, 2, 3):
+            buffer.put(telegram(address), timestamp=0)
+        self.assertEqual(len(buffer), 2)
+        self.assertEqual(buffer.dropped, 1)
+        self.assertEqual(buffer.get(now=0), (telegram(2), 0))
+        buffer.put_front(telegram(2), 0)
+        self.assertEqual(buffer.get(now=0), (telegram(2), 0))
+        self.assertEqual(buffer.get(now=0), (telegram(3), 0))
+        self.assertIsNone(buffer.get(now=0))
+
+    def test_ttl(self):
+        """Test dropping expired telegrams."""
+        buffer = OutboundBuffer(self.xknx, ttl_in_seconds=10)
+        buffer.put(telegram(1), timestamp=0)
+        buffer.put(telegram(2), timestamp=5)
+        self.assertEqual(buffer.get(now=12), (telegram(2), 5))
+        self.assertEqual(buffer.dropped, 1)
+
+    def test_coalesce(self):
+        """Test replacing buffered telegram of same type to same group address."""
+        buffer = OutboundBuffer(self.xknx, coalesce=True)
+        buffer.put(telegram(1, 0), timestamp=0)
+        buffer.put(telegram(2, 0), timestamp=0)
+        buffer.put(telegram(1, 1), timestamp=1)
+        buffer.put(telegram(1, 0, TelegramType.GROUP_READ), timestamp=1)
+        self.assertEqual(len(buffer), 3)
+        self.assertEqual(buffer.get(now=1), (telegram(2, 0), 0))
+        self.assertEqual(buffer.get(now=1), (telegram(1, 1), 1))
+        # telegram coalesced meanwhile is not put back
+        buffer.put(telegram(1, 0), timestamp=2)
+        buffer.put_front(telegram(1, 1), 1)
+        self.assertEqual(len(buffer), 2)
+
+
+class TestKNXIPInterface(unittest.TestCase):
+    """Test class for reconnecting KNXIPInterface objects."""
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.xknx = XKNX(loop=self.loop)
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.loop.close()
+
+    def create_interface(self, fake_interface):
+        """Return connected KNXIPInterface using fake_interface."""
+        knxip_interface = KNXIPInterface(
+            self.xknx, ConnectionConfig(backoff_initial_in_seconds=0.001, backoff_max_in_seconds=0.004))
+        knxip_interface.interface = fake_interface
+        knxip_interface.state = InterfaceState.CONNECTED
+        return knxip_interface
+
+    def test_backoff(self):
+        """Test jittered exponential backoff."""
+        knxip_interface = KNXIPInterface(
+            self.xknx, ConnectionConfig(backoff_initial_in_seconds=1, backoff_max_in_seconds=10))
+        self.assertEqual(knxip_interface.backoff(0), 0)
+        with patch('random.uniform', side_effect=lambda low, high: high):
+            self.assertEqual(
+                [knxip_interface.backoff(attempt) for attempt in range(1, 7)],
+                [1, 2, 4, 8, 10, 10])
+
+    def test_reconnect_and_drain(self):
+        """Test buffering telegrams while reconnecting in background and sending them afterwards."""
+        fake_interface = FakeInterface(reconnect_failures=2)
+        knxip_interface = self.create_interface(fake_interface)
+        self.xknx.bus_load.outbound_delay = lambda telegram: 0
+
+        fake_interface.connected = False
+        self.loop.run_until_complete(knxip_interface.send_telegram(telegram(1)))
+        self.assertEqual(knxip_interface.state, InterfaceState.DISCONNECTED)
+        # Sending does not wait for reconnect
+        self.loop.run_until_complete(knxip_interface.send_telegram(telegram(2)))
+        self.assertEqual(len(knxip_interface.buffer), 2)
+
+        self.loop.run_until_complete(knxip_interface.reconnect_task)
+        self.assertEqual(knxip_interface.state, InterfaceState.CONNECTED)
+        self.assertEqual(fake_interface.reconnects, 3)
+        self.assertEqual(fake_interface.sent, [telegram(1), telegram(2)])
+        self.assertEqual(self.xknx.metrics.snapshot()['counters']['xknx_reconnect_attempts_total'][()], 3)
+
+        self.loop.run_until_complete(knxip_interface.send_telegram(telegram(3)))
+        self.assertEqual(fake_interface.sent[-1], telegram(3))
+
+    def test_stop_while_reconnecting(self):
+        """Test cancelling reconnect on stop."""
+        fake_interface = FakeInterface(reconnect_failures=1000)
+        knxip_interface = self.create_interface(fake_interface)
+        fake_interface.connected = False
+
+        async def stop():
+            """Stop interface after some reconnect attempts."""
+            await asyncio.sleep(0.02)
+            await knxip_interface.stop()
+        fake_interface.stop = lambda: asyncio.sleep(0)
+        self.loop.run_until_complete(knxip_interface.send_telegram(telegram(1)))
+        reconnect_task = knxip_interface.reconnect_task
+        self.loop.run_until_complete(stop())
+        self.assertTrue(reconnect_task.cancelled())
+        self.assertEqual(knxip_interface.state, InterfaceState.STOPPED)
+        self.assertIsNone(knxip_interface.interface)
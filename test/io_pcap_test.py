@@ -0,0 +1,103 @@
+"""Unit test for reading and writing pcap files."""
+import asyncio
+import os
+import struct
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from xknx import XKNX
+from xknx.io import PcapReader, PcapWriter, UDPClient, read_knxip_frames
+from xknx.knx import GroupAddress
+from xknx.knxip import CEMIFrame, KNXIPServiceType
+
+
+class TestPcap(unittest.TestCase):
+    """Test class for PcapReader and PcapWriter objects."""
+
+    RAW_ROUTING_INDICATION = bytes((
+        0x06, 0x10, 0x05, 0x30, 0x00, 0x12, 0x29, 0x00,
+        0xbc, 0xd0, 0x12, 0x02, 0x01, 0x51, 0x02, 0x00,
+        0x40, 0xf0))
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        filehandle, self.filename = tempfile.mkstemp(suffix='.pcap')
+        os.close(filehandle)
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.loop.close()
+        os.remove(self.filename)
+
+    def test_write_read(self):
+        """Test writing datagrams and reading them again."""
+        xknx = XKNX(loop=self.loop)
+        writer = PcapWriter(xknx, self.filename)
+        writer.write(self.RAW_ROUTING_INDICATION,
+                     ('192.168.1.10', 3671), ('224.0.23.12', 3671),
+                     timestamp=1500000000.5)
+        writer.write(b'other', ('192.168.1.10', 1234), ('192.168.1.11', 53))
+        writer.close()
+
+        datagrams = list(PcapReader(self.filename))
+        self.assertEqual(len(datagrams), 1)
+        self.assertAlmostEqual(datagrams[0].timestamp, 1500000000.5)
+        self.assertEqual(datagrams[0].src_addr, ('192.168.1.10', 3671))
+        self.assertEqual(datagrams[0].dst_addr, ('224.0.23.12', 3671))
+        self.assertEqual(datagrams[0].payload, self.RAW_ROUTING_INDICATION)
+
+        frames = list(read_knxip_frames(xknx, self.filename))
+        self.assertEqual(len(frames), 1)
+        knxipframe = frames[0][1]
+        self.assertTrue(isinstance(knxipframe.body, CEMIFrame))
+        self.assertEqual(knxipframe.body.dst_addr, GroupAddress(337))
+
+    def test_write_via_udp_client(self):
+        """Test capturing traffic of UDPClient with PcapWriter as recorder."""
+        xknx = XKNX(loop=self.loop)
+        xknx.recorder = PcapWriter(xknx, self.filename)
+        udp_client = UDPClient(xknx, ("192.168.1.1", 0), ("192.168.1.2", 3671))
+        udp_client.transport = Mock()
+        udp_client.transport.get_extra_info.return_value = ('192.168.1.1', 50000)
+        udp_client.data_received_callback(self.RAW_ROUTING_INDICATION)
+        xknx.recorder.close()
+
+        frames = list(read_knxip_frames(xknx, self.filename))
+        self.assertEqual(len(frames), 1)
+        datagram, knxipframe = frames[0]
+        self.assertEqual(datagram.src_addr, ('192.168.1.2', 3671))
+        self.assertEqual(datagram.dst_addr, ('192.168.1.1', 50000))
+        self.assertEqual(knxipframe.header.service_type_ident, KNXIPServiceType.ROUTING_INDICATION)
+
+    def test_read_pcapng_ethernet(self):
+        """Test reading pcapng file with ethernet link type and VLAN tag."""
+        def block(block_type, body):
+            """Build pcapng block."""
+            body += b'\x00' * (-len(body) % 4)
+            length = 12 + len(body)
+            return struct.pack('<II', block_type, length) + body + struct.pack('<I', length)
+
+        udp = struct.pack('!HHHH', 3671, 3671, 8 + len(self.RAW_ROUTING_INDICATION), 0) + \
+            self.RAW_ROUTING_INDICATION
+        ipv4 = struct.pack('!BBHHHBBH4s4s', 0x45, 0, 20 + len(udp), 0, 0, 64, 17, 0,
+                           bytes((192, 168, 1, 10)), bytes((224, 0, 23, 12))) + udp
+        ethernet = b'\x01\x00\x5e\x00\x17\x0c' + b'\x00\x11\x22\x33\x44\x55' + \
+            b'\x81\x00\x00\x05' + b'\x08\x00' + ipv4
+        # if_tsresol = 10^-3
+        options = struct.pack('<HHB3x', 9, 1, 3) + struct.pack('<HH', 0, 0)
+        with open(self.filename, 'wb') as filehandle:
+            filehandle.write(block(0x0A0D0D0A, struct.pack('<IHHq', 0x1A2B3C4D, 1, 0, -1)))
+            filehandle.write(block(0x00000001, struct.pack('<HHI', 1, 0, 65535) + options))
+            filehandle.write(block(0x00000005, b'statistics'))
+            filehandle.write(block(0x00000006, struct.pack(
+                '<IIIII', 0, 1500000000500 >> 32, 1500000000500 & 0xFFFFFFFF,
+                len(ethernet), len(ethernet)) + ethernet))
+
+        datagrams = list(PcapReader(self.filename))
+        self.assertEqual(len(datagrams), 1)
+        self.assertAlmostEqual(datagrams[0].timestamp, 1500000000.5)
+        self.assertEqual(datagrams[0].src_addr, ('192.168.1.10', 3671))
+        self.assertEqual(datagrams[0].payload, self.RAW_ROUTING_INDICATION)
@@ -0,0 +1,124 @@
+"""Unit test for recording and replaying KNX/IP frames."""
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from xknx import XKNX
+from xknx.exceptions import XKNXException
+from xknx.io import Recorder, Replay, ReplayInterface, UDPClient
+from xknx.knx import (DPTArray, GroupAddress, Telegram, TelegramDirection,
+                      TelegramType)
+from xknx.knxip import KNXIPFrame, KNXIPServiceType
+
+
+class TestRecorder(unittest.TestCase):
+    """Test class for Recorder, Replay and ReplayInterface objects."""
+
+    RAW_ROUTING_INDICATION = bytes((
+        0x06, 0x10, 0x05, 0x30, 0x00, 0x12, 0x29, 0x00,
+        0xbc, 0xd0, 0x12, 0x02, 0x01, 0x51, 0x02, 0x00,
+        0x40, 0xf0))
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        filehandle, self.filename = tempfile.mkstemp(suffix='.xknxrec')
+        os.close(filehandle)
+        os.remove(self.filename)
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.loop.close()
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
+
+    def test_record_udp_client(self):
+        """Test recording received and sent datagrams of UDPClient."""
+        xknx = XKNX(loop=self.loop)
+        xknx.recorder = Recorder(xknx, self.filename)
+        udp_client = UDPClient(xknx, ("192.168.1.1", 0), ("192.168.1.2", 1234))
+        udp_client.transport = Mock()
+
+        udp_client.data_received_callback(self.RAW_ROUTING_INDICATION)
+
+        knxipframe = KNXIPFrame(xknx)
+        knxipframe.init(KNXIPServiceType.ROUTING_INDICATION)
+        knxipframe.body.src_addr = xknx.own_address
+        knxipframe.body.telegram = Telegram(GroupAddress('1/2/3'), payload=DPTArray((0x01,)))
+        knxipframe.normalize()
+        udp_client.send(knxipframe)
+        xknx.recorder.close()
+
+        frames = list(Replay(self.filename))
+        self.assertEqual(len(frames), 2)
+        self.assertEqual(frames[0].direction, TelegramDirection.INCOMING)
+        self.assertEqual(frames[0].raw, self.RAW_ROUTING_INDICATION)
+        self.assertEqual(frames[1].direction, TelegramDirection.OUTGOING)
+        self.assertEqual(frames[1].raw, bytes(knxipframe.to_knx()))
+        self.assertLessEqual(frames[0].timestamp, frames[1].timestamp)
+
+    def test_append(self):
+        """Test appending to existing log and ignoring truncated record."""
+        xknx = XKNX(loop=self.loop)
+        recorder = Recorder(xknx, self.filename)
+        recorder.record_received(self.RAW_ROUTING_INDICATION)
+        recorder.close()
+        recorder = Recorder(xknx, self.filename)
+        recorder.record_sent(self.RAW_ROUTING_INDICATION)
+        recorder.close()
+        with open(self.filename, 'ab') as filehandle:
+            filehandle.write(Recorder.RECORD_HEADER.pack(0, 1, 100) + b'\x00')
+
+        frames = list(Replay(self.filename))
+        self.assertEqual(
+            [frame.direction for frame in frames],
+            [TelegramDirection.INCOMING, TelegramDirection.OUTGOING])
+
+    def test_invalid_file(self):
+        """Test reading a file not written by Recorder."""
+        with open(self.filename, 'wb') as filehandle:
+            filehandle.write(b'no recording')
+        with self.assertRaises(XKNXException):
+            list(Replay(self.filename))
+
+    def test_replay_interface(self):
+        """Test feeding recorded frames into XKNX as fast as possible."""
+        xknx = XKNX(loop=self.loop)
+        recorder = Recorder(xknx, self.filename)
+        for _ in range(3):
+            recorder.record_received(self.RAW_ROUTING_INDICATION)
+        recorder.record_sent(self.RAW_ROUTING_INDICATION)
+        recorder.close()
+
+        replay_interface = ReplayInterface(xknx, self.filename, speed=None)
+        self.loop.run_until_complete(asyncio.Task(replay_interface.start()))
+        self.loop.run_until_complete(asyncio.Task(replay_interface.join()))
+
+        self.assertEqual(replay_interface.frames_replayed, 3)
+        self.assertEqual(xknx.telegrams.qsize(), 3)
+        telegram = xknx.telegrams.get_nowait()
+        self.assertEqual(telegram.group_address, GroupAddress(337))
+        self.assertEqual(telegram.telegramtype, TelegramType.GROUP_RESPONSE)
+        self.assertEqual(telegram.direction, TelegramDirection.INCOMING)
+        self.assertEqual(telegram.payload, DPTArray(0xf0))
+
+    def test_replay_interface_speed(self):
+        """Test replaying frames with original timing scaled by speed."""
+        xknx = XKNX(loop=self.loop)
+        recorder = Recorder(xknx, self.filename)
+        with patch('time.monotonic') as mock_monotonic:
+            mock_monotonic.return_value = 100.0
+            recorder.record_received(self.RAW_ROUTING_INDICATION)
+            mock_monotonic.return_value = 110.0
+            recorder.record_received(self.RAW_ROUTING_INDICATION)
+        recorder.close()
+
+        replay_interface = ReplayInterface(xknx, self.filename, speed=1000)
+        start_time = self.loop.time()
+        self.loop.run_until_complete(asyncio.Task(replay_interface.start()))
+        self.loop.run_until_complete(asyncio.Task(replay_interface.join()))
+        self.assertGreaterEqual(self.loop.time() - start_time, 0.009)
+        self.assertEqual(xknx.telegrams.qsize(), 2)
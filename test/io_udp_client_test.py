@@ -0,0 +1,128 @@
+"""Unit test for UDPClient objects."""
+import asyncio
+import socket
+import unittest
+from unittest.mock import patch
+
+from xknx import XKNX
+from xknx.io import UDPClient
+from xknx.knx import DPTBinary, GroupAddress, Telegram
+from xknx.knxip import KNXIPFrame, KNXIPServiceType
+
+ROUTING_INDICATION = bytes((0x06, 0x10, 0x05, 0x30, 0x00, 0x12, 0x29, 0x00,
+                            0xbc, 0xd0, 0x12, 0x02, 0x01, 0x51, 0x02, 0x00,
+                            0x40, 0xf0))
+
+
+class TestUDPClient(unittest.TestCase):
+    """Test class for UDPClient objects."""
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.xknx = XKNX(loop=self.loop)
+        self.sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sender.bind(('127.0.0.1', 0))
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.sender.close()
+        self.loop.close()
+
+    def connect(self, receive_batch_size, send_batching=False):
+        """Connect UDPClient to sender socket and return it with the list of received frames."""
+        received = []
+        udp_client = UDPClient(self.xknx, ('127.0.0.1', 0), self.sender.getsockname(),
+                               receive_batch_size=receive_batch_size,
+                               send_batching=send_batching)
+        udp_client.register_callback(
+            lambda knxipframe, _: received.append(knxipframe),
+            [KNXIPServiceType.ROUTING_INDICATION])
+        self.loop.run_until_complete(asyncio.Task(udp_client.connect()))
+        return udp_client, received
+
+    def test_data_received_batch(self):
+        """Test processing of a batch of datagrams."""
+        udp_client = UDPClient(self.xknx, ('127.0.0.1', 0), ('127.0.0.1', 1234))
+        received = []
+        udp_client.register_callback(lambda knxipframe, _: received.append(knxipframe))
+        with patch('logging.Logger.exception') as mock_exception:
+            udp_client.data_received_batch([ROUTING_INDICATION, ROUTING_INDICATION[:-2], ROUTING_INDICATION])
+            mock_exception.assert_called_once()
+        self.assertEqual(len(received), 2)
+
+    def test_batch_receive(self):
+        """Test reading several datagrams within one wakeup of the event loop."""
+        udp_client, received = self.connect(receive_batch_size=3)
+        self.assertIsInstance(udp_client.transport, UDPClient.BatchTransport)
+        batches = []
+        data_received_batch = udp_client.transport.data_received_batch_callback
+
+        def record_batch(raws):
+            """Record size of batch and process it."""
+            batches.append(len(raws))
+            data_received_batch(raws)
+        udp_client.transport.data_received_batch_callback = record_batch
+
+        for _ in range(5):
+            self.sender.sendto(ROUTING_INDICATION, udp_client.getsockname())
+        self.loop.run_until_complete(asyncio.sleep(0.05))
+        self.assertEqual(len(received), 5)
+        self.assertEqual(batches, [3, 2])
+
+        self.loop.run_until_complete(asyncio.Task(udp_client.stop()))
+        self.assertEqual(udp_client.transport.sock.fileno(), -1)
+
+    def test_batch_send(self):
+        """Test sending via BatchTransport."""
+        udp_client, _ = self.connect(receive_batch_size=10)
+        self.assertEqual(udp_client.getremote(), self.sender.getsockname())
+        udp_client.transport.sendto(ROUTING_INDICATION)
+        self.assertEqual(self.sender.recv(100), ROUTING_INDICATION)
+        self.loop.run_until_complete(asyncio.Task(udp_client.stop()))
+
+    def test_batch_receive_not_supported(self):
+        """Test falling back to asyncio datagram transport if event loop does not support add_reader()."""
+        with patch.object(self.loop, 'add_reader', side_effect=NotImplementedError):
+            udp_client, received = self.connect(receive_batch_size=10)
+        self.assertNotIsInstance(udp_client.transport, UDPClient.BatchTransport)
+        self.sender.sendto(ROUTING_INDICATION, udp_client.getsockname())
+        self.loop.run_until_complete(asyncio.sleep(0.05))
+        self.assertEqual(len(received), 1)
+        self.loop.run_until_complete(asyncio.Task(udp_client.stop()))
+
+    def routing_indication(self, group_address):
+        """Return KNXIPFrame with ROUTING_INDICATION to group address."""
+        knxipframe = KNXIPFrame(self.xknx)
+        knxipframe.init(KNXIPServiceType.ROUTING_INDICATION)
+        knxipframe.body.telegram = Telegram(GroupAddress(group_address), payload=DPTBinary(1))
+        knxipframe.normalize()
+        return knxipframe
+
+    def test_send_batching(self):
+        """Test flushing frames sent within one iteration of the event loop together and in order."""
+        self.sender.setblocking(False)
+        for receive_batch_size in (None, 10):
+            with self.subTest(receive_batch_size=receive_batch_size):
+                udp_client, _ = self.connect(receive_batch_size, send_batching=True)
+                knxipframes = [self.routing_indication(number) for number in range(1, 4)]
+                for knxipframe in knxipframes:
+                    udp_client.send(knxipframe)
+                with self.assertRaises(BlockingIOError):
+                    self.sender.recv(100)
+
+                self.loop.run_until_complete(asyncio.sleep(0))
+                for knxipframe in knxipframes:
+                    self.assertEqual(self.sender.recv(100), bytes(knxipframe.to_knx()))
+                with self.assertRaises(BlockingIOError):
+                    self.sender.recv(100)
+                self.loop.run_until_complete(asyncio.Task(udp_client.stop()))
+
+    def test_send_batching_flush_on_stop(self):
+        """Test sending queued frames when stopping."""
+        udp_client, _ = self.connect(None, send_batching=True)
+        knxipframe = self.routing_indication(1)
+        udp_client.send(knxipframe)
+        self.loop.run_until_complete(asyncio.Task(udp_client.stop()))
+        self.assertEqual(self.sender.recv(100), bytes(knxipframe.to_knx()))
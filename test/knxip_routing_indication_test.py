@@ -4,7 +4,8 @@ import unittest
 
 from xknx import XKNX
 from xknx.knx import (DPTArray, DPTBinary, DPTTemperature, DPTTime,
-                      GroupAddress, PhysicalAddress, Telegram, TelegramType)
+                      GroupAddress, PhysicalAddress, Telegram,
+                      TelegramPriority, TelegramType)
 from xknx.knxip import CEMIFrame, KNXIPFrame, KNXIPServiceType
 
 
@@ -274,3 +275,27 @@ class Test_KNXIP(unittest.TestCase):
         knxipframe2.init(KNXIPServiceType.ROUTING_INDICATION)
         knxipframe2.from_knx(knxipframe.to_knx())
         self.assertEqual(knxipframe2.body.telegram, telegram)
+
+    def test_priority(self):
+        """Test encoding priority of telegram into CEMI flags and parsing it back."""
+        xknx = XKNX(loop=self.loop)
+        control_fields = {TelegramPriority.SYSTEM: 0xb0,
+                          TelegramPriority.ALARM: 0xb8,
+                          TelegramPriority.NORMAL: 0xb4,
+                          TelegramPriority.LOW: 0xbc}
+        self.assertEqual(set(control_fields), set(TelegramPriority))
+        self.assertEqual(Telegram().priority, TelegramPriority.LOW)
+        for priority, control_field in control_fields.items():
+            telegram = Telegram(GroupAddress(337), payload=DPTBinary(1), priority=priority)
+            knxipframe = KNXIPFrame(xknx)
+            knxipframe.init(KNXIPServiceType.ROUTING_INDICATION)
+            knxipframe.body.src_addr = PhysicalAddress("1.3.1")
+            knxipframe.body.telegram = telegram
+            knxipframe.normalize()
+            raw = knxipframe.to_knx()
+            self.assertEqual(raw[8], control_field)
+
+            knxipframe2 = KNXIPFrame(xknx)
+            knxipframe2.from_knx(raw)
+            self.assertEqual(knxipframe2.body.telegram.priority, priority)
+            self.assertEqual(knxipframe2.body.telegram, telegram)
@@ -0,0 +1,141 @@
+"""Unit test for KNXProjImporter objects."""
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+import zipfile
+
+import yaml
+
+from xknx import XKNX
+from xknx.core import Config, KNXProjImporter, ProjectGroupAddress
+from xknx.core.knxproj import parse_dpt
+from xknx.devices import Notification, Sensor, Switch
+from xknx.exceptions import XKNXException
+from xknx.knx import GroupAddress
+
+INSTALLATION_HEADER = (
+    '<?xml version="1.0" encoding="utf-8"?>\n'
+    '<KNX xmlns="http://knx.org/xml/project/14" CreatedBy="ETS5" ToolVersion="5.6">'
+    '<Project Id="P-0123"><Installations><Installation Name="">'
+    '<Topology><Area Id="P-0123-0_A-1" Address="1"><Line Id="P-0123-0_L-1" Address="1">'
+    '<DeviceInstance Id="P-0123-0_DI-1" Address="1" /></Line></Area></Topology>'
+    '<GroupAddresses><GroupRanges>'
+    '<GroupRange Id="P-0123-0_GR-1" RangeStart="1" RangeEnd="2047" Name="Main">')
+INSTALLATION_FOOTER = '</GroupRange></GroupRanges></GroupAddresses></Installation></Installations></Project></KNX>'
+
+
+def group_address_element(number, address, name, dpt=None):
+    """Return XML of group address."""
+    return '<GroupAddress Id="P-0123-0_GA-{0}" Address="{1}" Name="{2}"{3} />'.format(
+        number, address, name, ' DatapointType="{0}"'.format(dpt) if dpt else '')
+
+
+class TestKNXProjImporter(unittest.TestCase):
+    """Test class for KNXProjImporter objects."""
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.directory.cleanup()
+        self.loop.close()
+
+    def write_project(self, group_addresses):
+        """Write .knxproj with group addresses."""
+        filename = os.path.join(self.directory.name, 'test.knxproj')
+        with zipfile.ZipFile(filename, 'w', zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr('knx_master.xml', '<KNX />')
+            archive.writestr('P-0123/project.xml', '<KNX />')
+            archive.writestr(
+                'P-0123/0.xml',
+                INSTALLATION_HEADER + ''.join(group_addresses) + INSTALLATION_FOOTER)
+        return filename
+
+    def test_parse_dpt(self):
+        """Test parsing DatapointType attribute."""
+        self.assertEqual(parse_dpt('DPST-9-1'), (9, 1))
+        self.assertEqual(parse_dpt('DPT-5'), (5, None))
+        self.assertEqual(parse_dpt('DPST-1-1 DPST-1-8'), (1, 1))
+        self.assertIsNone(parse_dpt(''))
+        self.assertIsNone(parse_dpt(None))
+
+    def test_group_addresses(self):
+        """Test reading group addresses of project."""
+        filename = self.write_project([
+            group_address_element(1, 2305, 'Kitchen Light', 'DPST-1-1'),
+            group_address_element(2, 2306, 'Kitchen Temperature', 'DPST-9-1'),
+            group_address_element(3, 2307, 'Without DPT')])
+        self.assertEqual(
+            list(KNXProjImporter.group_addresses(filename)),
+            [ProjectGroupAddress(2305, 'Kitchen Light', (1, 1), ''),
+             ProjectGroupAddress(2306, 'Kitchen Temperature', (9, 1), ''),
+             ProjectGroupAddress(2307, 'Without DPT', None, '')])
+
+    def test_generate_config(self):
+        """Test generating xknx.yaml structure and adding devices."""
+        filename = self.write_project([
+            group_address_element(1, 2305, 'Kitchen Light', 'DPST-1-1'),
+            group_address_element(2, 2306, 'Kitchen Temperature', 'DPST-9-1'),
+            group_address_element(3, 2307, 'Kitchen Light', 'DPST-1-1'),
+            group_address_element(4, 2308, 'Display', 'DPST-16-1'),
+            group_address_element(5, 2309, 'Time', 'DPST-10-1'),
+            group_address_element(6, 2310, 'Without DPT')])
+        xknx = XKNX(loop=self.loop)
+        importer = KNXProjImporter(xknx)
+        self.assertEqual(
+            importer.generate_config(filename),
+            {'groups': {
+                'switch': {'Kitchen Light': {'group_address': '1/1/1'},
+                           'Kitchen Light (1/1/3)': {'group_address': '1/1/3'}},
+                'sensor': {'Kitchen Temperature': {'value_type': 'temperature', 'group_address': '1/1/2'}},
+                'notification': {'Display': {'group_address': '1/1/4'}}}})
+
+        config_file = os.path.join(self.directory.name, 'xknx.yaml')
+        importer.write_config(filename, config_file)
+        with open(config_file) as filehandle:
+            self.assertEqual(yaml.safe_load(filehandle), importer.generate_config(filename))
+
+        importer.read(filename)
+        self.assertEqual(len(xknx.devices), 4)
+        self.assertEqual(len(xknx.config.definitions), 4)
+        self.assertEqual(xknx.config.definitions['Kitchen Light'], ('switch', {'group_address': 2305}))
+        self.assertEqual(
+            xknx.devices['Kitchen Light'],
+            Switch(xknx, 'Kitchen Light', group_address='1/1/1',
+                   device_updated_cb=xknx.devices.device_updated))
+        self.assertEqual(
+            xknx.devices['Kitchen Temperature'],
+            Sensor(xknx, 'Kitchen Temperature', group_address='1/1/2', value_type='temperature',
+                   device_updated_cb=xknx.devices.device_updated))
+        self.assertEqual(
+            xknx.devices['Display'],
+            Notification(xknx, 'Display', group_address='1/1/4',
+                         device_updated_cb=xknx.devices.device_updated))
+
+    def test_large_project(self):
+        """Test importing project with 30000 group addresses within seconds."""
+        filename = self.write_project(
+            group_address_element(number, number + 1, 'GA {0}'.format(number), 'DPST-1-1')
+            for number in range(30000))
+        xknx = XKNX(loop=self.loop)
+        start_time = time.monotonic()
+        doc = KNXProjImporter(xknx).generate_config(filename, compiled=True)
+        self.assertLess(time.monotonic() - start_time, 5)
+        self.assertEqual(len(doc['groups']['switch']), 30000)
+        self.assertEqual(doc['groups']['switch']['GA 29999'], {'group_address': 30000})
+        self.assertEqual(Config.compile(doc), doc)
+        self.assertEqual(GroupAddress(30000), GroupAddress('14/5/48'))
+
+    def test_no_installation(self):
+        """Test error for archives without installation."""
+        filename = os.path.join(self.directory.name, 'protected.knxproj')
+        with zipfile.ZipFile(filename, 'w') as archive:
+            archive.writestr('P-0123.zip', b'')
+        with self.assertRaises(XKNXException):
+            list(KNXProjImporter.group_addresses(filename))
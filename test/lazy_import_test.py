@@ -0,0 +1,42 @@
+"""Unit test for importing objects of packages on first access."""
+import subprocess
+import sys
+import unittest
+
+import xknx.devices
+import xknx.io
+from xknx.lazy_import import lazy_getattr
+
+
+class TestLazyImport(unittest.TestCase):
+    """Test class for lazy imports."""
+
+    def test_lazy_getattr(self):
+        """Test importing name on first access and caching it within namespace."""
+        namespace = {}
+        getattr_ = lazy_getattr('xknx.io', namespace, {'PcapReader': '.pcap'})
+        from xknx.io.pcap import PcapReader
+        self.assertIs(getattr_('PcapReader'), PcapReader)
+        self.assertIs(namespace['PcapReader'], PcapReader)
+        with self.assertRaises(AttributeError):
+            getattr_('Unknown')
+
+    def test_package_attributes(self):
+        """Test lazy names being accessible as package attributes."""
+        from xknx.devices.light import Light
+        from xknx.io.gateway_scanner import GatewayScanner
+        self.assertIs(xknx.devices.Light, Light)
+        self.assertIs(xknx.io.GatewayScanner, GatewayScanner)
+        with self.assertRaises(AttributeError):
+            # pylint: disable=pointless-statement,no-member
+            xknx.devices.Unknown
+
+    @unittest.skipIf(sys.version_info < (3, 7), "module __getattr__ requires Python 3.7")
+    def test_import_xknx(self):
+        """Test optional and heavy modules not being loaded by import xknx."""
+        modules = subprocess.check_output([
+            sys.executable, '-c',
+            'import sys, xknx; xknx.XKNX(); print(" ".join(sys.modules))']).decode().split()
+        for module in ('yaml', 'netifaces', 'zipfile', 'xknx.devices.light',
+                       'xknx.io.gateway_scanner', 'xknx.core.sharded_consumer'):
+            self.assertNotIn(module, modules)
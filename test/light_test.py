@@ -330,7 +330,8 @@ class TestLight(unittest.TestCase):
 
     def test_has_group_address(self):
         """Test has_group_address."""
-        xknx = XKNX(config='xknx.yaml', loop=self.loop)
+        xknx = XKNX(loop=self.loop)
+        xknx.config.read('xknx.yaml', use_cache=False)
         light = Light(
             xknx,
             'Office.Light_1',
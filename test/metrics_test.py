@@ -0,0 +1,148 @@
+"""Unit test for Metrics objects."""
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from xknx import XKNX
+from xknx.core import Histogram, Metrics, MetricsExporter
+from xknx.io import UDPClient
+from xknx.knx import DPTBinary, GroupAddress, Telegram, TelegramDirection
+
+
+class TestMetrics(unittest.TestCase):
+    """Test class for Metrics objects."""
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.loop.close()
+
+    def test_counter(self):
+        """Test increasing counters with and without labels."""
+        metrics = Metrics()
+        metrics.inc('counter')
+        metrics.inc('counter', amount=2)
+        metrics.inc('counter_labels', {'service_type': 'a'})
+        metrics.inc('counter_labels', {'service_type': 'b'})
+        metrics.inc('counter_labels', {'service_type': 'a'})
+        self.assertEqual(
+            metrics.snapshot()['counters'],
+            {'counter': {(): 3},
+             'counter_labels': {(('service_type', 'a'),): 2,
+                                (('service_type', 'b'),): 1}})
+
+    def test_gauge(self):
+        """Test setting gauges and gauge callbacks."""
+        metrics = Metrics()
+        metrics.set_gauge('gauge', 5)
+        metrics.register_gauge_callback(
+            'gauge_cb', lambda: [({'direction': 'incoming'}, 7)])
+        self.assertEqual(
+            metrics.snapshot()['gauges'],
+            {'gauge': {(): 5},
+             'gauge_cb': {(('direction', 'incoming'),): 7}})
+        metrics.unregister_gauge_callback('gauge_cb')
+        self.assertEqual(metrics.snapshot()['gauges'], {'gauge': {(): 5}})
+
+    def test_histogram(self):
+        """Test histogram buckets."""
+        histogram = Histogram(buckets=(0.1, 1))
+        histogram.observe(0.05)
+        histogram.observe(0.1)
+        histogram.observe(0.5)
+        histogram.observe(2)
+        self.assertEqual(
+            histogram.snapshot(),
+            {'buckets': [(0.1, 2), (1, 3), ('+Inf', 4)],
+             'sum': 2.65,
+             'count': 4})
+
+    def test_to_prometheus(self):
+        """Test Prometheus text format."""
+        metrics = Metrics()
+        metrics.inc('xknx_counter', {'service_type': 'routing_indication'})
+        metrics.set_gauge('xknx_gauge', 3)
+        metrics.observe('xknx_latency', 0.5, buckets=(1,))
+        self.assertEqual(
+            metrics.to_prometheus(),
+            '# TYPE xknx_counter counter\n'
+            'xknx_counter{service_type="routing_indication"} 1\n'
+            '# TYPE xknx_gauge gauge\n'
+            'xknx_gauge 3\n'
+            '# TYPE xknx_latency histogram\n'
+            'xknx_latency_bucket{le="1"} 1\n'
+            'xknx_latency_bucket{le="+Inf"} 1\n'
+            'xknx_latency_sum 0.5\n'
+            'xknx_latency_count 1\n')
+
+    def test_frames_received_and_parse_errors(self):
+        """Test counting of received frames and parse errors within UDPClient."""
+        xknx = XKNX(loop=self.loop)
+        udp_client = UDPClient(xknx, ("192.168.1.1", 0), ("192.168.1.2", 1234))
+        raw = bytes((0x06, 0x10, 0x05, 0x30, 0x00, 0x12, 0x29, 0x00,
+                     0xbc, 0xd0, 0x12, 0x02, 0x01, 0x51, 0x02, 0x00,
+                     0x40, 0xf0))
+        udp_client.data_received_callback(raw)
+        with patch('logging.Logger.exception'):
+            udp_client.data_received_callback(raw[:-2])
+        counters = xknx.metrics.snapshot()['counters']
+        self.assertEqual(
+            counters[Metrics.FRAMES_RECEIVED],
+            {(('service_type', 'routing_indication'),): 1})
+        self.assertEqual(counters[Metrics.PARSE_ERRORS], {(): 1})
+
+    def test_telegram_queue_metrics(self):
+        """Test queue depth, dispatch latency and processed telegrams of TelegramQueue."""
+        xknx = XKNX(loop=self.loop)
+        telegram = Telegram(
+            direction=TelegramDirection.INCOMING,
+            payload=DPTBinary(1),
+            group_address=GroupAddress("1/2/3"))
+        self.loop.run_until_complete(asyncio.Task(xknx.telegrams.put(telegram)))
+        self.loop.run_until_complete(asyncio.Task(xknx.telegrams.put(Telegram())))
+        self.loop.run_until_complete(asyncio.Task(xknx.telegrams.put(Telegram())))
+        self.assertEqual(
+            xknx.metrics.snapshot()['gauges'][Metrics.TELEGRAM_QUEUE_DEPTH],
+            {(('direction', 'incoming'),): 1,
+             (('direction', 'outgoing'),): 2})
+
+        self.loop.run_until_complete(asyncio.Task(xknx.telegram_queue.process_all_telegrams()))
+        snapshot = xknx.metrics.snapshot()
+        self.assertEqual(
+            snapshot['gauges'][Metrics.TELEGRAM_QUEUE_DEPTH],
+            {(('direction', 'incoming'),): 0,
+             (('direction', 'outgoing'),): 0})
+        self.assertEqual(
+            snapshot['counters'][Metrics.TELEGRAMS_PROCESSED],
+            {(('direction', 'incoming'), ('telegramtype', 'group_write')): 1,
+             (('direction', 'outgoing'), ('telegramtype', 'group_write')): 2})
+        self.assertEqual(
+            snapshot['histograms'][Metrics.DISPATCH_LATENCY][(('direction', 'outgoing'),)]['count'],
+            2)
+
+    def test_exporter(self):
+        """Test serving metrics via HTTP."""
+        xknx = XKNX(loop=self.loop)
+        xknx.metrics.inc('xknx_test_total')
+        exporter = MetricsExporter(xknx, port=0)
+        self.loop.run_until_complete(asyncio.Task(exporter.start()))
+        port = exporter.server.sockets[0].getsockname()[1]
+
+        async def request(path):
+            """Send HTTP request and return response."""
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write('GET {} HTTP/1.0\r\nHost: localhost\r\n\r\n'.format(path).encode())
+            response = await reader.read()
+            writer.close()
+            return response.decode()
+
+        response = self.loop.run_until_complete(asyncio.Task(request('/metrics')))
+        self.assertTrue(response.startswith('HTTP/1.0 200 OK'))
+        self.assertIn('xknx_test_total 1\n', response)
+        response = self.loop.run_until_complete(asyncio.Task(request('/other')))
+        self.assertTrue(response.startswith('HTTP/1.0 404 Not Found'))
+        self.loop.run_until_complete(asyncio.Task(exporter.stop()))
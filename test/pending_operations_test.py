@@ -0,0 +1,91 @@
+"""Unit test for PendingOperations objects."""
+import asyncio
+import unittest
+
+from xknx import XKNX
+from xknx.core import Metrics, PendingOperations, ValueReader
+from xknx.knx import (DPTBinary, GroupAddress, Telegram, TelegramDirection,
+                      TelegramType)
+
+
+class TestPendingOperations(unittest.TestCase):
+    """Test class for PendingOperations objects."""
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.xknx = XKNX(loop=self.loop)
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.loop.close()
+
+    def test_resolve(self):
+        """Test passing response to all operations waiting for key."""
+        pending_operations = PendingOperations(self.xknx)
+        future1 = pending_operations.add('key', 1)
+        future2 = pending_operations.add('key', 1)
+        other = pending_operations.add('other', 1)
+        self.assertEqual(len(pending_operations), 3)
+        self.assertIn('key', pending_operations)
+
+        self.assertTrue(pending_operations.resolve('key', 'response'))
+        self.assertFalse(pending_operations.resolve('key', 'response'))
+        self.assertEqual(future1.result(), 'response')
+        self.assertEqual(future2.result(), 'response')
+        self.assertFalse(other.done())
+        self.assertEqual(len(pending_operations), 1)
+
+        pending_operations.cancel('other', other)
+        self.assertTrue(other.cancelled())
+        self.assertEqual(len(pending_operations), 0)
+
+    def test_expire_in_batches(self):
+        """Test expiring operations of same bucket with one timer."""
+        pending_operations = PendingOperations(self.xknx, resolution_in_seconds=0.05)
+        futures = [pending_operations.add(number, 0.01) for number in range(100)]
+        later = pending_operations.add('later', 0.2)
+        # pylint: disable=protected-access
+        self.assertLessEqual(len(pending_operations._buckets), 3)
+
+        self.loop.run_until_complete(asyncio.wait(futures))
+        self.assertTrue(all(future.result() is None for future in futures))
+        self.assertFalse(later.done())
+        self.assertEqual(len(pending_operations), 1)
+
+        self.loop.run_until_complete(later)
+        self.assertIsNone(later.result())
+        self.assertEqual(len(pending_operations), 0)
+        self.assertIsNone(pending_operations._timer_handle)  # pylint: disable=protected-access
+
+    def test_earlier_timeout_reschedules_timer(self):
+        """Test operation with shorter timeout not waiting for timer of longer one."""
+        pending_operations = PendingOperations(self.xknx, resolution_in_seconds=0.01)
+        later = pending_operations.add('later', 10)
+        sooner = pending_operations.add('sooner', 0.02)
+        self.loop.run_until_complete(asyncio.wait_for(sooner, 1))
+        self.assertIsNone(sooner.result())
+        self.assertFalse(later.done())
+        pending_operations.cancel('later', later)
+
+    def test_value_reader(self):
+        """Test ValueReader receiving response via telegram queue."""
+        telegram = Telegram(GroupAddress('1/2/3'), TelegramType.GROUP_RESPONSE,
+                            TelegramDirection.INCOMING, DPTBinary(1))
+
+        async def respond():
+            """Process response after group read was sent."""
+            while ValueReader.pending_key(GroupAddress('1/2/3')) not in self.xknx.pending_operations:
+                await asyncio.sleep(0)
+            await self.xknx.telegram_queue.process_telegram(telegram)
+
+        value_reader = ValueReader(self.xknx, GroupAddress('1/2/3'))
+        self.loop.create_task(respond())
+        self.assertEqual(self.loop.run_until_complete(value_reader.read()), telegram)
+        self.assertTrue(value_reader.success)
+
+        value_reader = ValueReader(self.xknx, GroupAddress('1/2/4'), timeout_in_seconds=0)
+        self.assertIsNone(self.loop.run_until_complete(value_reader.read()))
+        self.assertEqual(
+            self.xknx.metrics.snapshot()['counters'][Metrics.VALUE_READER_TIMEOUTS][()], 1)
@@ -96,3 +96,50 @@ class TestRemoteValue(unittest.TestCase):
         self.assertNotEqual(remote_value4, remote_value1)
         self.assertEqual(remote_value1, remote_value5)
         self.assertEqual(remote_value5, remote_value1)
+
+    def test_value_cached(self):
+        """Test if payload is only decoded once until it changes."""
+        xknx = XKNX(loop=self.loop)
+        remote_value = RemoteValue(xknx, group_address=GroupAddress('1/1/1'))
+        with patch('xknx.devices.RemoteValue.payload_valid') as patch_valid, \
+                patch('xknx.devices.RemoteValue.from_knx') as patch_from_knx:
+            patch_valid.return_value = True
+            patch_from_knx.return_value = 42
+
+            self.assertEqual(remote_value.value, None)
+            patch_from_knx.assert_not_called()
+
+            telegram = Telegram(
+                GroupAddress('1/1/1'),
+                payload=DPTArray((0x01, 0x02)))
+            self.loop.run_until_complete(asyncio.Task(remote_value.process(telegram)))
+            self.assertEqual(remote_value.value, 42)
+            self.assertEqual(remote_value.value, 42)
+            self.assertEqual(patch_from_knx.call_count, 1)
+
+            # Same payload again does not invalidate cache
+            self.loop.run_until_complete(asyncio.Task(remote_value.process(telegram)))
+            self.assertEqual(remote_value.value, 42)
+            self.assertEqual(patch_from_knx.call_count, 1)
+
+            patch_from_knx.return_value = 23
+            remote_value.payload = DPTArray((0x03, 0x04))
+            self.assertEqual(remote_value.value, 23)
+            self.assertEqual(patch_from_knx.call_count, 2)
+
+    def test_value_cache_invalidated_by_set(self):
+        """Test if cached value is invalidated after setting new value."""
+        xknx = XKNX(loop=self.loop)
+        remote_value = RemoteValue(xknx, group_address=GroupAddress('1/1/1'))
+        with patch('xknx.devices.RemoteValue.to_knx') as patch_to_knx, \
+                patch('xknx.devices.RemoteValue.from_knx') as patch_from_knx:
+            patch_to_knx.return_value = DPTArray((0x01,))
+            patch_from_knx.return_value = 1
+            self.loop.run_until_complete(asyncio.Task(remote_value.set(1)))
+            self.assertEqual(remote_value.value, 1)
+
+            patch_to_knx.return_value = DPTArray((0x02,))
+            patch_from_knx.return_value = 2
+            self.loop.run_until_complete(asyncio.Task(remote_value.set(2)))
+            self.assertEqual(remote_value.value, 2)
+            self.assertEqual(patch_from_knx.call_count, 2)
@@ -0,0 +1,145 @@
+"""Unit test for XKNXRunner objects."""
+import asyncio
+import queue
+import socket
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+import unittest
+
+from xknx import XKNXRunner
+from xknx.devices import Switch
+from xknx.exceptions import XKNXException
+from xknx.io import ConnectionConfig, ConnectionType, GatewaySimulator
+from xknx.knx import (AddressFilter, DPTBinary, GroupAddress, Telegram,
+                      TelegramDirection, TelegramType)
+
+
+class TestXKNXRunner(unittest.TestCase):
+    """Test class for XKNXRunner objects."""
+
+    def setUp(self):
+        """Set up test class."""
+        self.runner = XKNXRunner(timeout_in_seconds=5)
+        self.runner.start(connect=False)
+        self.simulator = GatewaySimulator(self.runner.xknx)
+        self.runner.submit(self.simulator.start).result()
+        (gateway_ip, gateway_port) = self.simulator.address
+        self.runner.submit(
+            self.runner.xknx.start,
+            connection_config=ConnectionConfig(
+                connection_type=ConnectionType.TUNNELING,
+                local_ip='127.0.0.1',
+                gateway_ip=gateway_ip,
+                gateway_port=gateway_port)).result()
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.runner.stop()
+
+    def test_runs_in_background_thread(self):
+        """Test XKNX using own loop within own thread."""
+        self.assertIsNot(self.runner.thread, threading.current_thread())
+        self.assertTrue(self.runner.thread.is_alive())
+        self.assertIs(self.runner.xknx.loop, self.runner.loop)
+        self.assertTrue(self.runner.xknx.started)
+
+    def test_set_and_read(self):
+        """Test writing and reading group address from foreign thread."""
+        self.runner.set('1/2/3', DPTBinary(1))
+        self.runner.submit(self.runner.xknx.join).result()
+        telegram = self.runner.read('1/2/3')
+        self.assertEqual(telegram.group_address, GroupAddress('1/2/3'))
+        self.assertEqual(telegram.telegramtype, TelegramType.GROUP_RESPONSE)
+        self.assertEqual(telegram.payload, DPTBinary(1))
+
+        future = self.runner.read_future('1/2/4')
+        self.assertIsNone(future.result(5))
+
+    def test_sync(self):
+        """Test syncing device state from foreign thread."""
+        self.simulator.set_value('1/2/5', DPTBinary(1))
+
+        async def add_switch():
+            """Add switch within loop."""
+            self.runner.xknx.devices.add(
+                Switch(self.runner.xknx, 'TestSwitch', group_address='1/2/5'))
+        self.runner.submit(add_switch).result()
+        self.runner.sync('TestSwitch')
+        self.assertTrue(self.runner.xknx.devices['TestSwitch'].state)
+
+    def test_subscribe(self):
+        """Test receiving telegrams within foreign thread."""
+        subscription = self.runner.subscribe(address_filters=[AddressFilter('1/2/*')])
+        telegram = Telegram(GroupAddress('1/2/6'), payload=DPTBinary(1))
+        self.runner.loop.call_soon_threadsafe(self.simulator.send_indication, telegram)
+        received = subscription.get(timeout=5)
+        self.assertEqual(received.group_address, GroupAddress('1/2/6'))
+        self.assertEqual(received.direction, TelegramDirection.INCOMING)
+        subscription.close()
+        self.assertIsNone(subscription.callback)
+
+    def test_subscription_bounded(self):
+        """Test dropping oldest telegrams if subscription buffer is full."""
+        subscription = self.runner.subscribe(maxsize=2)
+        for number in range(3):
+            telegram = Telegram(GroupAddress(number + 1), direction=TelegramDirection.INCOMING)
+            asyncio.run_coroutine_threadsafe(
+                subscription.telegram_received(telegram), self.runner.loop).result()
+        self.assertEqual(subscription.dropped, 1)
+        self.assertEqual(subscription.get().group_address, GroupAddress(2))
+        self.assertEqual(subscription.get().group_address, GroupAddress(3))
+        with self.assertRaises(queue.Empty):
+            subscription.get(timeout=0)
+
+    def test_loop_factory(self):
+        """Test running XKNX on loop created by loop_factory."""
+        loops = []
+
+        def loop_factory():
+            """Create and record loop."""
+            loops.append(asyncio.new_event_loop())
+            return loops[-1]
+        runner = XKNXRunner(loop_factory=loop_factory)
+        runner.start(connect=False)
+        self.assertEqual(len(loops), 1)
+        self.assertIs(runner.loop, loops[0])
+        self.assertIs(runner.xknx.loop, loops[0])
+        runner.stop()
+
+    def test_start_timeout(self):
+        """Test stopping event loop and thread if connecting timed out."""
+        gateway = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        gateway.bind(('127.0.0.1', 0))
+        runner = XKNXRunner(timeout_in_seconds=0.2)
+        try:
+            with self.assertRaises(FutureTimeoutError):
+                runner.start(connection_config=ConnectionConfig(
+                    connection_type=ConnectionType.TUNNELING,
+                    local_ip='127.0.0.1',
+                    gateway_ip='127.0.0.1',
+                    gateway_port=gateway.getsockname()[1]))
+        finally:
+            gateway.close()
+        self.assertIsNone(runner.thread)
+        self.assertTrue(runner.loop.is_closed())
+
+    def test_stop_timeout(self):
+        """Test stopping event loop and thread even if stopping XKNX timed out."""
+        async def stop_hanging():
+            """Never finish stopping."""
+            await asyncio.sleep(10)
+        self.runner.xknx.stop = stop_hanging
+        thread = self.runner.thread
+        with self.assertRaises(FutureTimeoutError):
+            self.runner.stop(timeout=0.2)
+        self.assertIsNone(self.runner.thread)
+        thread.join(1)
+        self.assertFalse(thread.is_alive())
+        self.assertTrue(self.runner.loop.is_closed())
+        # Loop is closed, XKNX must not try to stop itself again when garbage collected
+        self.runner.xknx.started = False
+
+    def test_start_twice(self):
+        """Test starting runner twice."""
+        with self.assertRaises(XKNXException):
+            self.runner.start()
@@ -0,0 +1,112 @@
+"""Unit test for ShardedTelegramConsumer objects."""
+import asyncio
+import os
+import unittest
+from unittest.mock import patch
+
+from xknx import XKNX
+from xknx.core import ShardedTelegramConsumer
+from xknx.core.sharded_consumer import decode_telegram, encode_telegram
+from xknx.knx import (AddressFilter, DPTArray, DPTBinary, GroupAddress,
+                      Telegram, TelegramDirection, TelegramPriority,
+                      TelegramType)
+
+
+def worker_callback(telegram):
+    """Return group address, payload and pid of worker process."""
+    if telegram.payload is None:
+        raise ValueError("no payload")
+    return str(telegram.group_address), telegram.payload.value, os.getpid()
+
+
+class TestShardedTelegramConsumer(unittest.TestCase):
+    """Test class for ShardedTelegramConsumer objects."""
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.loop.close()
+
+    def test_encode_decode(self):
+        """Test compact serialization of telegrams."""
+        for telegram in (
+                Telegram(GroupAddress('1/2/3'), payload=DPTBinary(1)),
+                Telegram(GroupAddress('31/7/255'), payload=DPTArray((0x0c, 0x65)),
+                         direction=TelegramDirection.INCOMING, priority=TelegramPriority.ALARM),
+                Telegram(GroupAddress('0/0/1'), TelegramType.GROUP_READ)):
+            raw = encode_telegram(telegram)
+            self.assertEqual(decode_telegram(raw), telegram)
+        self.assertEqual(len(encode_telegram(Telegram(GroupAddress('1/2/3'), payload=DPTBinary(1)))), 7)
+
+    def test_process_in_workers(self):
+        """Test processing telegrams within worker processes, preserving order per group address."""
+        xknx = XKNX(loop=self.loop)
+        results = []
+
+        async def result_cb(telegram, result, exception):
+            """Collect results."""
+            results.append((telegram, result, exception))
+
+        consumer = ShardedTelegramConsumer(
+            xknx, worker_callback, workers=2,
+            address_filters=[AddressFilter('1/*/*')], result_cb=result_cb)
+        self.loop.run_until_complete(asyncio.Task(consumer.start()))
+        telegrams = [Telegram(GroupAddress('1/0/{0}'.format(number % 2 + 1)),
+                              direction=TelegramDirection.INCOMING,
+                              payload=DPTArray((number,)))
+                     for number in range(10)]
+        telegrams.append(Telegram(GroupAddress('1/0/1'), TelegramType.GROUP_READ,
+                                  TelegramDirection.INCOMING))
+        telegrams.append(Telegram(GroupAddress('2/0/1'), direction=TelegramDirection.INCOMING,
+                                  payload=DPTBinary(1)))
+        for telegram in telegrams:
+            self.loop.run_until_complete(asyncio.Task(xknx.telegrams.put(telegram)))
+        self.loop.run_until_complete(asyncio.Task(xknx.telegram_queue.process_all_telegrams()))
+        self.loop.run_until_complete(asyncio.Task(consumer.stop()))
+
+        # Telegram for 2/0/1 filtered
+        self.assertEqual(len(results), 11)
+        exceptions = [exception for _, _, exception in results if exception is not None]
+        self.assertEqual(len(exceptions), 1)
+        self.assertIsInstance(exceptions[0], ValueError)
+
+        values = {}
+        pids = {}
+        for telegram, result, exception in results:
+            if exception is None:
+                values.setdefault(result[0], []).append(result[1][0])
+                pids.setdefault(result[0], set()).add(result[2])
+        self.assertEqual(values, {'1/0/1': [0, 2, 4, 6, 8], '1/0/2': [1, 3, 5, 7, 9]})
+        # Each group address processed by one worker, shards in different processes
+        self.assertEqual([len(pid) for pid in pids.values()], [1, 1])
+        self.assertNotEqual(pids['1/0/1'], pids['1/0/2'])
+        self.assertNotIn(os.getpid(), pids['1/0/1'])
+        self.assertNotIn(consumer.telegram_received,
+                         [cb.callback for cb in xknx.telegram_queue.telegram_received_cbs])
+
+    def test_result_cb_exception(self):
+        """Test logging exceptions of result_cb and passing later results nevertheless."""
+        xknx = XKNX(loop=self.loop)
+        results = []
+
+        async def result_cb(telegram, result, exception):
+            """Collect results and fail."""
+            results.append(result)
+            raise RuntimeError("broken callback")
+
+        consumer = ShardedTelegramConsumer(xknx, worker_callback, workers=1, result_cb=result_cb)
+        self.loop.run_until_complete(asyncio.Task(consumer.start()))
+        for number in range(3):
+            self.loop.run_until_complete(asyncio.Task(xknx.telegrams.put(
+                Telegram(GroupAddress(number + 1), direction=TelegramDirection.INCOMING,
+                         payload=DPTBinary(1)))))
+        with patch('logging.Logger.exception') as mock_exception:
+            self.loop.run_until_complete(asyncio.Task(xknx.telegram_queue.process_all_telegrams()))
+            self.loop.run_until_complete(asyncio.Task(consumer.stop()))
+            self.assertEqual(mock_exception.call_count, 3)
+        self.assertEqual([result[0] for result in results], ['0/0/1', '0/0/2', '0/0/3'])
+        self.assertEqual(consumer.executors, [])
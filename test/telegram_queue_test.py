@@ -0,0 +1,73 @@
+"""Unit test for TelegramQueue objects."""
+import asyncio
+import unittest
+
+from xknx import XKNX
+from xknx.knx import (DPTBinary, GroupAddress, Telegram, TelegramDirection,
+                      TelegramPriority, TelegramType)
+
+
+class TestTelegramQueue(unittest.TestCase):
+    """Test class for TelegramQueue objects."""
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.loop.close()
+
+    def test_priority_order(self):
+        """Test outgoing telegrams by priority, FIFO within same priority, stop request last."""
+        xknx = XKNX(loop=self.loop)
+        read = Telegram(GroupAddress('1/1/1'), TelegramType.GROUP_READ)
+        write1 = Telegram(GroupAddress('1/2/1'), payload=DPTBinary(1))
+        write2 = Telegram(GroupAddress('1/2/2'), payload=DPTBinary(0))
+        alarm = Telegram(GroupAddress('1/3/1'), payload=DPTBinary(1), priority=TelegramPriority.ALARM)
+        system = Telegram(GroupAddress('1/3/2'), payload=DPTBinary(1), priority=TelegramPriority.SYSTEM)
+        incoming = Telegram(GroupAddress('1/4/1'), direction=TelegramDirection.INCOMING,
+                            payload=DPTBinary(1))
+
+        for telegram in (read, write1, None, incoming, write2, alarm, system):
+            xknx.telegrams.put_nowait(telegram)
+        self.assertEqual(xknx.telegrams.qsize(), 7)
+        self.assertEqual(xknx.telegrams.depth[TelegramDirection.OUTGOING], 5)
+
+        self.assertEqual(
+            [xknx.telegrams.get_nowait() for _ in range(7)],
+            [incoming, system, alarm, read, write1, write2, None])
+        self.assertTrue(xknx.telegrams.empty())
+        self.assertEqual(xknx.telegrams.depth[TelegramDirection.OUTGOING], 0)
+
+    def test_arrival_order_across_directions(self):
+        """Test incoming and outgoing telegrams in order of arrival, only outgoing telegrams reordered by priority."""
+        xknx = XKNX(loop=self.loop)
+        write = Telegram(GroupAddress('1/2/1'), payload=DPTBinary(1))
+        alarm = Telegram(GroupAddress('1/3/1'), payload=DPTBinary(1), priority=TelegramPriority.ALARM)
+        read = Telegram(GroupAddress('1/1/1'), TelegramType.GROUP_READ)
+        incoming1 = Telegram(GroupAddress('1/4/1'), direction=TelegramDirection.INCOMING, payload=DPTBinary(1))
+        incoming2 = Telegram(GroupAddress('1/4/2'), direction=TelegramDirection.INCOMING, payload=DPTBinary(0))
+
+        for telegram in (write, incoming1, alarm, incoming2, read):
+            xknx.telegrams.put_nowait(telegram)
+        self.assertEqual(xknx.telegrams.depth[TelegramDirection.INCOMING], 2)
+        self.assertEqual(
+            [xknx.telegrams.get_nowait() for _ in range(5)],
+            [incoming1, alarm, write, incoming2, read])
+        self.assertEqual(xknx.telegrams.depth[TelegramDirection.INCOMING], 0)
+
+    def test_incoming_do_not_starve_outgoing(self):
+        """Test outgoing telegram is processed before incoming telegrams queued after it."""
+        xknx = XKNX(loop=self.loop)
+        read = Telegram(GroupAddress('1/1/1'), TelegramType.GROUP_READ)
+        xknx.telegrams.put_nowait(read)
+        incoming = [Telegram(GroupAddress(number), direction=TelegramDirection.INCOMING, payload=DPTBinary(1))
+                    for number in range(1, 4)]
+        for telegram in incoming:
+            xknx.telegrams.put_nowait(telegram)
+        self.assertEqual(xknx.telegrams.qsize(), 4)
+        self.assertEqual([xknx.telegrams.get_nowait() for _ in range(4)], [read] + incoming)
+        with self.assertRaises(asyncio.QueueEmpty):
+            xknx.telegrams.get_nowait()
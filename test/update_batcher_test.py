@@ -0,0 +1,114 @@
+"""Unit test for UpdateBatcher objects."""
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from xknx import XKNX
+from xknx.core import UpdateBatcher
+from xknx.devices import Switch
+
+
+class TestUpdateBatcher(unittest.TestCase):
+    """Test class for UpdateBatcher objects."""
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.loop.close()
+
+    def test_batch(self):
+        """Test if devices updated within window are passed in one batch."""
+        xknx = XKNX(loop=self.loop)
+        switch1 = Switch(xknx, 'TestOutlet1', group_address='1/2/3')
+        switch2 = Switch(xknx, 'TestOutlet2', group_address='1/2/4')
+        xknx.devices.add(switch1)
+        xknx.devices.add(switch2)
+        batches = []
+
+        async def batch_updated_cb(devices):
+            """Collect batches."""
+            batches.append(devices)
+
+        UpdateBatcher(xknx, batch_updated_cb, window_in_seconds=0.01)
+
+        self.loop.run_until_complete(asyncio.Task(switch1.set_on()))
+        self.loop.run_until_complete(asyncio.Task(switch2.set_on()))
+        self.loop.run_until_complete(asyncio.Task(switch1.set_off()))
+        self.assertEqual(batches, [])
+
+        self.loop.run_until_complete(asyncio.sleep(0.02))
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(len(batches[0]), 2)
+        self.assertIs(batches[0][0], switch1)
+        self.assertIs(batches[0][1], switch2)
+
+        self.loop.run_until_complete(asyncio.Task(switch2.set_off()))
+        self.loop.run_until_complete(asyncio.sleep(0.02))
+        self.assertEqual(len(batches), 2)
+        self.assertEqual(len(batches[1]), 1)
+        self.assertIs(batches[1][0], switch2)
+
+    def test_stop(self):
+        """Test if stop flushes pending devices and unregisters batcher."""
+        xknx = XKNX(loop=self.loop)
+        switch = Switch(xknx, 'TestOutlet', group_address='1/2/3')
+        xknx.devices.add(switch)
+        batches = []
+
+        async def batch_updated_cb(devices):
+            """Collect batches."""
+            batches.append(devices)
+
+        update_batcher = UpdateBatcher(xknx, batch_updated_cb, window_in_seconds=10)
+        self.loop.run_until_complete(asyncio.Task(switch.set_on()))
+        self.loop.run_until_complete(asyncio.Task(update_batcher.stop()))
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(xknx.devices.device_updated_cbs, [])
+
+        self.loop.run_until_complete(asyncio.Task(switch.set_off()))
+        self.loop.run_until_complete(asyncio.sleep(0.02))
+        self.assertEqual(len(batches), 1)
+
+    def test_batch_callback_exception(self):
+        """Test if exceptions of batch callback are logged."""
+        xknx = XKNX(loop=self.loop)
+        switch = Switch(xknx, 'TestOutlet', group_address='1/2/3')
+        xknx.devices.add(switch)
+
+        async def batch_updated_cb(devices):
+            """Fail."""
+            raise ValueError("broken callback")
+
+        update_batcher = UpdateBatcher(xknx, batch_updated_cb, window_in_seconds=0.01)
+        with patch('logging.Logger.error') as mock_error:
+            self.loop.run_until_complete(asyncio.Task(switch.set_on()))
+            self.loop.run_until_complete(asyncio.sleep(0.02))
+            self.assertEqual(mock_error.call_count, 1)
+            self.assertIsInstance(mock_error.call_args[1]['exc_info'], ValueError)
+        self.assertIsNone(update_batcher._flush_task)  # pylint: disable=protected-access
+
+    def test_stop_cancels_flush(self):
+        """Test if stop cancels running flush task."""
+        xknx = XKNX(loop=self.loop)
+        switch = Switch(xknx, 'TestOutlet', group_address='1/2/3')
+        xknx.devices.add(switch)
+        batches = []
+
+        async def batch_updated_cb(devices):
+            """Collect batches slowly."""
+            await asyncio.sleep(10)
+            batches.append(devices)
+
+        update_batcher = UpdateBatcher(xknx, batch_updated_cb, window_in_seconds=0.01)
+        self.loop.run_until_complete(asyncio.Task(switch.set_on()))
+        self.loop.run_until_complete(asyncio.sleep(0.02))
+        flush_task = update_batcher._flush_task  # pylint: disable=protected-access
+        self.assertFalse(flush_task.done())
+        self.loop.run_until_complete(asyncio.Task(update_batcher.stop()))
+        self.loop.run_until_complete(asyncio.sleep(0))
+        self.assertTrue(flush_task.cancelled())
+        self.assertEqual(batches, [])
@@ -0,0 +1,151 @@
+"""Unit test for UpdateDispatcher objects."""
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from xknx import XKNX
+from xknx.core import UpdateDispatcher
+from xknx.devices import Switch
+
+
+class TestUpdateDispatcher(unittest.TestCase):
+    """Test class for UpdateDispatcher objects."""
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.loop.close()
+
+    def test_dispatch_sequential(self):
+        """Test if callbacks are called one after another in default mode."""
+        xknx = XKNX(loop=self.loop)
+        switch = Switch(xknx, 'TestOutlet', group_address='1/2/3')
+        events = []
+
+        async def callback1(device):
+            """Slow callback."""
+            events.append(('start1', device))
+            await asyncio.sleep(0.01)
+            events.append(('end1', device))
+
+        async def callback2(device):
+            """Fast callback."""
+            events.append(('start2', device))
+
+        dispatcher = UpdateDispatcher(xknx)
+        self.loop.run_until_complete(asyncio.Task(
+            dispatcher.dispatch([callback1, callback2], switch)))
+        self.assertEqual(
+            events,
+            [('start1', switch), ('end1', switch), ('start2', switch)])
+
+    def test_dispatch_concurrent(self):
+        """Test if slow callback does not delay other callbacks in concurrent mode."""
+        xknx = XKNX(loop=self.loop)
+        switch = Switch(xknx, 'TestOutlet', group_address='1/2/3')
+        events = []
+
+        async def callback1(device):
+            """Slow callback."""
+            events.append('start1')
+            await asyncio.sleep(0.01)
+            events.append('end1')
+
+        async def callback2(device):
+            """Fast callback."""
+            events.append('start2')
+
+        dispatcher = UpdateDispatcher(xknx, concurrent=True)
+        self.loop.run_until_complete(asyncio.Task(
+            dispatcher.dispatch([callback1, callback2], switch)))
+        self.assertEqual(events, ['start1', 'start2', 'end1'])
+
+    def test_dispatch_max_concurrency(self):
+        """Test if number of concurrently running callbacks is limited."""
+        xknx = XKNX(loop=self.loop)
+        switch = Switch(xknx, 'TestOutlet', group_address='1/2/3')
+        running = []
+        max_running = []
+
+        async def callback(device):
+            """Callback counting concurrently running callbacks."""
+            running.append(device)
+            max_running.append(len(running))
+            await asyncio.sleep(0.001)
+            running.pop()
+
+        dispatcher = UpdateDispatcher(xknx, concurrent=True, max_concurrency=2)
+        self.loop.run_until_complete(asyncio.Task(
+            dispatcher.dispatch([callback] * 5, switch)))
+        self.assertEqual(len(max_running), 5)
+        self.assertEqual(max(max_running), 2)
+
+    def test_dispatch_timeout(self):
+        """Test if callback is aborted after timeout."""
+        xknx = XKNX(loop=self.loop)
+        switch = Switch(xknx, 'TestOutlet', group_address='1/2/3')
+        events = []
+
+        async def callback(device):
+            """Callback never finishing in time."""
+            await asyncio.sleep(10)
+            events.append(device)
+
+        dispatcher = UpdateDispatcher(xknx, timeout_in_seconds=0.01)
+        with patch('logging.Logger.warning') as mock_warn:
+            self.loop.run_until_complete(asyncio.Task(
+                dispatcher.dispatch([callback], switch)))
+            mock_warn.assert_called_with(
+                "Device updated callback %s for %s timed out after %s seconds",
+                callback, 'TestOutlet', 0.01)
+        self.assertEqual(events, [])
+
+    def test_dispatch_slow_callback(self):
+        """Test if slow callbacks are logged."""
+        xknx = XKNX(loop=self.loop)
+        switch = Switch(xknx, 'TestOutlet', group_address='1/2/3')
+
+        async def callback(device):
+            """Slow callback."""
+            await asyncio.sleep(0.02)
+
+        dispatcher = UpdateDispatcher(xknx, slow_callback_threshold=0.01)
+        with patch('logging.Logger.warning') as mock_warn:
+            self.loop.run_until_complete(asyncio.Task(
+                dispatcher.dispatch([callback], switch)))
+            self.assertEqual(mock_warn.call_count, 1)
+            self.assertEqual(
+                mock_warn.call_args[0][0],
+                "Device updated callback %s for %s took %.3f seconds")
+
+    def test_device_after_update_uses_dispatcher(self):
+        """Test if Device.after_update and Devices.device_updated use dispatcher of XKNX."""
+        xknx = XKNX(loop=self.loop)
+        xknx.update_dispatcher.concurrent = True
+        switch = Switch(xknx, 'TestOutlet', group_address='1/2/3')
+        xknx.devices.add(switch)
+        events = []
+
+        async def device_cb(device):
+            """Slow device callback."""
+            events.append('device_start')
+            await asyncio.sleep(0.01)
+            events.append('device_end')
+
+        async def devices_cb(device):
+            """Callback registered at devices."""
+            events.append('devices')
+
+        async def other_device_cb(device):
+            """Fast device callback."""
+            events.append('other')
+
+        switch.register_device_updated_cb(device_cb)
+        switch.register_device_updated_cb(other_device_cb)
+        xknx.devices.register_device_updated_cb(devices_cb)
+        self.loop.run_until_complete(asyncio.Task(switch.after_update()))
+        self.assertEqual(events, ['devices', 'device_start', 'other', 'device_end'])
@@ -1,3 +1,9 @@
 """XKNX is a Python 3 library for KNX/IP protocol."""
 # flake8: noqa
 from .xknx import XKNX
+from .lazy_import import lazy_getattr
+
+__getattr__ = lazy_getattr(__name__, globals(), {
+    'XKNXRunner': '.runner',
+    'Subscription': '.runner',
+})
@@ -1,6 +1,22 @@
 """Module for the automations and business logic of XKNX."""
 # flake8: noqa
+from xknx.lazy_import import lazy_getattr
+
 from .stateupdater import StateUpdater
 from .telegram_queue import TelegramQueue
-from .config import Config
+from .config import Config, ConfigDiff
 from .value_reader import ValueReader
+from .update_dispatcher import UpdateDispatcher
+from .metrics import Metrics, Histogram
+from .bus_load import BusLoadEstimator
+from .pending_operations import PendingOperations
+
+# Imported on first access
+__getattr__ = lazy_getattr(__name__, globals(), {
+    'ConfigWatcher': '.config_watcher',
+    'UpdateBatcher': '.update_batcher',
+    'MetricsExporter': '.metrics_exporter',
+    'ShardedTelegramConsumer': '.sharded_consumer',
+    'KNXProjImporter': '.knxproj',
+    'ProjectGroupAddress': '.knxproj',
+})
@@ -0,0 +1,116 @@
+"""
+Module for estimating the load of the KNX TP1 bus and pacing outgoing telegrams.
+
+The estimator sums up the time each observed telegram occupies the bus, assuming TP1 timing:
+
+* 9600 bit/s,
+* 13 bit times per character (start bit, 8 data bits, parity, stop bit and 2 bit times pause),
+* 50 bit times of line idle before each frame and
+* 15 bit times pause followed by an acknowledge character after each frame.
+
+Utilization is the fraction of the sliding window occupied by incoming and outgoing telegrams.
+TelegramQueue asks outbound_delay() how long to wait after each outgoing telegram: the delay is
+chosen so that outgoing telegrams only use the share of the target utilization not used by
+incoming telegrams.
+"""
+from collections import deque
+
+from xknx.knx import DPTArray, TelegramDirection
+
+from .metrics import Metrics
+
+
+class BusLoadEstimator:
+    """Class for estimating bus load and calculating delays between outgoing telegrams."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    BIT_TIME = 1 / 9600
+    BITS_PER_CHARACTER = 13
+    IDLE_BITS_BEFORE_FRAME = 50
+    BITS_BEFORE_ACK = 15
+    # Control field, source, destination, length/routing, TPCI/APCI (2 bytes), checksum
+    STANDARD_FRAME_LENGTH = 9
+
+    def __init__(self,
+                 xknx,
+                 target_utilization=0.5,
+                 window_in_seconds=10,
+                 min_rate=2,
+                 max_rate=50):
+        """
+        Initialize BusLoadEstimator class.
+
+        target_utilization: fraction of bus time (0..1) which should not be exceeded.
+        min_rate/max_rate: bounds of outgoing telegrams per second.
+        """
+        # pylint: disable=too-many-arguments
+        self.xknx = xknx
+        self.target_utilization = target_utilization
+        self.window_in_seconds = window_in_seconds
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.observations = {direction: deque() for direction in TelegramDirection}
+        self.busy_time = {direction: 0 for direction in TelegramDirection}
+        self.xknx.metrics.register_gauge_callback(Metrics.BUS_LOAD, self.bus_load)
+
+    @classmethod
+    def frame_length(cls, telegram):
+        """Return length of TP1 frame of telegram in bytes."""
+        if isinstance(telegram.payload, DPTArray):
+            return cls.STANDARD_FRAME_LENGTH + len(telegram.payload.value)
+        # Payload of DPTBinary is encoded within APCI
+        return cls.STANDARD_FRAME_LENGTH
+
+    @classmethod
+    def telegram_duration(cls, telegram):
+        """Return time in seconds telegram occupies TP1 bus, including idle time and acknowledge."""
+        bits = cls.IDLE_BITS_BEFORE_FRAME \
+            + cls.frame_length(telegram) * cls.BITS_PER_CHARACTER \
+            + cls.BITS_BEFORE_ACK \
+            + cls.BITS_PER_CHARACTER
+        return bits * cls.BIT_TIME
+
+    def record(self, telegram, timestamp=None):
+        """Add telegram to observations."""
+        if timestamp is None:
+            timestamp = self.xknx.loop.time()
+        duration = self.telegram_duration(telegram)
+        self.observations[telegram.direction].append((timestamp, duration))
+        self.busy_time[telegram.direction] += duration
+        self._expire(telegram.direction, timestamp)
+
+    def _expire(self, direction, now):
+        """Remove observations older than window."""
+        observations = self.observations[direction]
+        while observations and observations[0][0] < now - self.window_in_seconds:
+            _, duration = observations.popleft()
+            self.busy_time[direction] -= duration
+        if not observations:
+            # Avoid accumulating floating point errors
+            self.busy_time[direction] = 0
+
+    def utilization(self, direction=None, now=None):
+        """Return fraction of bus time used within window, optionally limited to one direction."""
+        if now is None:
+            now = self.xknx.loop.time()
+        directions = TelegramDirection if direction is None else (direction,)
+        busy_time = 0
+        for _direction in directions:
+            self._expire(_direction, now)
+            busy_time += self.busy_time[_direction]
+        return busy_time / self.window_in_seconds
+
+    def outbound_delay(self, telegram, now=None):
+        """Return seconds to wait after sending telegram for keeping utilization below target."""
+        available = self.target_utilization - \
+            self.utilization(TelegramDirection.INCOMING, now)
+        if available <= 0:
+            return 1 / self.min_rate
+        delay = self.telegram_duration(telegram) / available
+        return min(max(delay, 1 / self.max_rate), 1 / self.min_rate)
+
+    def bus_load(self):
+        """Return utilization per direction. Callback for metrics."""
+        return [({'direction': direction.name.lower()}, self.utilization(direction))
+                for direction in TelegramDirection]
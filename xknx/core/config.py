@@ -3,33 +3,199 @@ Module for reading configfiles (xknx.yaml).
 
 * it will parse the given file
 * and add the found devices to the devies vector of XKNX.
-"""
 
-import yaml
+The parsed configuration is stored within a compiled cache next to the config file
+(e.g. .xknx.yaml.cache). Group addresses are stored as integers within the cache.
+A warm start neither parses YAML nor group address strings. The cache is used if
+modification time and size of the config file are unchanged or if its content has the same hash.
+
+reload() applies changes of the config file to running XKNX. Devices are compared by name
+and definition, only added, removed or changed devices are touched.
+"""
+import hashlib
+import marshal
+import os
+from collections import namedtuple
 
-from xknx.devices import (BinarySensor, Climate, Cover, DateTime, ExposeSensor,
-                          Light, Notification, Scene, Sensor, Switch)
 from xknx.exceptions import XKNXException
-from xknx.knx import PhysicalAddress
+from xknx.knx import GroupAddress, PhysicalAddress
+
+ConfigDiff = namedtuple('ConfigDiff', ['added', 'removed', 'changed'])
 
 
 class Config:
     """Class for parsing xknx.yaml."""
 
+    CACHE_VERSION = 1
+
     def __init__(self, xknx):
         """Initialize Config class."""
         self.xknx = xknx
+        self.file = None
+        # Definition of devices created from config: name -> (group, config entry)
+        self.definitions = {}
 
-    def read(self, file='xknx.yaml'):
+    def read(self, file='xknx.yaml', use_cache=True):
         """Read config."""
         self.xknx.logger.debug("Reading %s", file)
+        self.file = file
         try:
-            with open(file, 'r') as filehandle:
-                doc = yaml.load(filehandle)
-                self.parse_general(doc)
-                self.parse_groups(doc)
+            doc = self.load(file, use_cache)
         except FileNotFoundError as ex:
             self.xknx.logger.error("Error while reading %s: %s", file, ex)
+            return
+        self.parse_general(doc)
+        self.parse_groups(doc)
+
+    def load(self, file, use_cache=True):
+        """Return parsed config, from compiled cache if valid."""
+        with open(file, 'rb') as filehandle:
+            stat = os.fstat(filehandle.fileno())
+            mtime = (stat.st_mtime_ns, stat.st_size)
+            cache_file = self.cache_file(file)
+            if use_cache:
+                cache = self.read_cache(cache_file)
+                if cache is not None and cache['mtime'] == mtime:
+                    return cache['doc']
+            content = filehandle.read()
+        digest = hashlib.sha256(content).hexdigest()
+        if use_cache and cache is not None and cache['hash'] == digest:
+            self.write_cache(cache_file, mtime, digest, cache['doc'])
+            return cache['doc']
+        import yaml
+        # Use LibYAML bindings if available
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        doc = self.compile(yaml.load(content, Loader=loader))
+        if use_cache:
+            self.write_cache(cache_file, mtime, digest, doc)
+        return doc
+
+    async def reload(self, file=None, use_cache=True):
+        """
+        Apply changes of config file to devices of XKNX and return ConfigDiff.
+
+        Devices with unchanged definition are kept as they are. Changed devices are
+        replaced, taking over the state of remote values with unchanged state addresses.
+        Only state addresses not known before are read from the KNX bus.
+        """
+        file = file or self.file
+        self.xknx.logger.debug("Reloading %s", file)
+        doc = self.load(file, use_cache)
+        self.file = file
+        definitions = {name: (group, entry)
+                       for group, entries in doc["groups"].items()
+                       for name, entry in entries.items()}
+        diff = ConfigDiff(
+            added=[name for name in definitions if name not in self.definitions],
+            removed=[name for name in self.definitions if name not in definitions],
+            changed=[name for name in definitions
+                     if name in self.definitions and self.definitions[name] != definitions[name]])
+
+        previous_devices = {}
+        for name in diff.removed + diff.changed:
+            del self.definitions[name]
+            try:
+                device = self.xknx.devices[name]
+            except KeyError:
+                continue
+            self.xknx.devices.remove(device)
+            device.shutdown()
+            previous_devices[name] = device
+
+        groups = {}
+        for name in diff.added + diff.changed:
+            group, entry = definitions[name]
+            groups.setdefault(group, {})[name] = entry
+        self.parse_general(doc)
+        self.parse_groups({"groups": groups})
+
+        state_addresses = []
+        for name in diff.added + diff.changed:
+            try:
+                device = self.xknx.devices[name]
+            except KeyError:
+                continue
+            known_addresses = set()
+            if name in previous_devices:
+                self.transfer_state(previous_devices[name], device)
+                known_addresses = {group_address.raw for group_address
+                                   in previous_devices[name].state_addresses()}
+            state_addresses.extend(group_address for group_address in device.state_addresses()
+                                   if group_address.raw not in known_addresses)
+        if self.xknx.started:
+            from .value_reader import ValueReader
+            for group_address in state_addresses:
+                await ValueReader(self.xknx, group_address).send_group_read()
+        self.xknx.logger.debug(
+            "Reloaded %s: %s added, %s removed, %s changed",
+            file, len(diff.added), len(diff.removed), len(diff.changed))
+        return diff
+
+    @staticmethod
+    def transfer_state(previous_device, device):
+        """Copy payload of remote values of previous device having same type and state addresses."""
+        from xknx.devices import RemoteValue
+        for key, remote_value in device.__dict__.items():
+            if not isinstance(remote_value, RemoteValue):
+                continue
+            previous = previous_device.__dict__.get(key)
+            if type(previous) is type(remote_value) and \
+                    previous.state_addresses() == remote_value.state_addresses():
+                remote_value.payload = previous.payload
+
+    @staticmethod
+    def cache_file(file):
+        """Return path of compiled cache of config file."""
+        directory, filename = os.path.split(file)
+        return os.path.join(directory, '.{0}.cache'.format(filename))
+
+    def read_cache(self, cache_file):
+        """Return content of compiled cache or None if not existing or not readable."""
+        try:
+            with open(cache_file, 'rb') as filehandle:
+                cache = marshal.load(filehandle)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if not isinstance(cache, dict) or cache.get('version') != self.CACHE_VERSION:
+            return None
+        return cache
+
+    def write_cache(self, cache_file, mtime, digest, doc):
+        """Write compiled cache. Cache is skipped if not writable or doc not serializable."""
+        cache = {'version': self.CACHE_VERSION, 'mtime': mtime, 'hash': digest, 'doc': doc}
+        temp_file = '{0}.{1}.tmp'.format(cache_file, os.getpid())
+        try:
+            with open(temp_file, 'wb') as filehandle:
+                marshal.dump(cache, filehandle)
+            os.replace(temp_file, cache_file)
+        except (OSError, ValueError) as ex:
+            self.xknx.logger.debug("Could not write config cache %s: %s", cache_file, ex)
+            try:
+                os.remove(temp_file)
+            except OSError:
+                pass
+
+    @classmethod
+    def compile(cls, doc):
+        """Return doc with group addresses converted to integers."""
+        if isinstance(doc, dict):
+            return {key: cls.compile_group_address(value)
+                    if isinstance(key, str) and key.startswith('group_address')
+                    else cls.compile(value)
+                    for key, value in doc.items()}
+        if isinstance(doc, list):
+            return [cls.compile(value) for value in doc]
+        return doc
+
+    @staticmethod
+    def compile_group_address(value):
+        """Return raw value of group address or value if not parseable."""
+        if not isinstance(value, str):
+            return value
+        try:
+            return GroupAddress(value).raw
+        except XKNXException:
+            return value
 
     def parse_general(self, doc):
         """Parse the general section of xknx.yaml."""
@@ -45,6 +211,8 @@ class Config:
 
     def parse_group(self, doc, group):
         """Parse a group entry of xknx.yaml."""
+        self.definitions.update(
+            (name, (group, entry)) for name, entry in doc["groups"][group].items())
         try:
             if group.startswith("light"):
                 self.parse_group_light(doc["groups"][group])
@@ -71,6 +239,7 @@ class Config:
 
     def parse_group_light(self, entries):
         """Parse a light section of xknx.yaml."""
+        from xknx.devices import Light
         for entry in entries:
             light = Light.from_config(
                 self.xknx,
@@ -80,6 +249,7 @@ class Config:
 
     def parse_group_switch(self, entries):
         """Parse a switch section of xknx.yaml."""
+        from xknx.devices import Switch
         for entry in entries:
             switch = Switch.from_config(
                 self.xknx,
@@ -89,6 +259,7 @@ class Config:
 
     def parse_group_binary_sensor(self, entries):
         """Parse a binary_sensor section of xknx.yaml."""
+        from xknx.devices import BinarySensor
         for entry in entries:
             binary_sensor = BinarySensor.from_config(
                 self.xknx,
@@ -98,6 +269,7 @@ class Config:
 
     def parse_group_cover(self, entries):
         """Parse a cover section of xknx.yaml."""
+        from xknx.devices import Cover
         for entry in entries:
             cover = Cover.from_config(
                 self.xknx,
@@ -107,6 +279,7 @@ class Config:
 
     def parse_group_climate(self, entries):
         """Parse a climate section of xknx.yaml."""
+        from xknx.devices import Climate
         for entry in entries:
             climate = Climate.from_config(
                 self.xknx,
@@ -116,6 +289,7 @@ class Config:
 
     def parse_group_datetime(self, entries):
         """Parse a datetime section of xknx.yaml."""
+        from xknx.devices import DateTime
         for entry in entries:
             datetime = DateTime.from_config(
                 self.xknx,
@@ -125,6 +299,7 @@ class Config:
 
     def parse_group_sensor(self, entries):
         """Parse a sensor section of xknx.yaml."""
+        from xknx.devices import Sensor
         for entry in entries:
             sensor = Sensor.from_config(
                 self.xknx,
@@ -134,6 +309,7 @@ class Config:
 
     def parse_group_expose_sensor(self, entries):
         """Parse a exposed sensor section of xknx.yaml."""
+        from xknx.devices import ExposeSensor
         for entry in entries:
             expose_sensor = ExposeSensor.from_config(
                 self.xknx,
@@ -143,6 +319,7 @@ class Config:
 
     def parse_group_notification(self, entries):
         """Parse a sensor section of xknx.yaml."""
+        from xknx.devices import Notification
         for entry in entries:
             notification = Notification.from_config(
                 self.xknx,
@@ -152,6 +329,7 @@ class Config:
 
     def parse_group_scene(self, entries):
         """Parse a scene section of xknx.yaml."""
+        from xknx.devices import Scene
         for entry in entries:
             scene = Scene.from_config(
                 self.xknx,
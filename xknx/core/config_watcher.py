@@ -0,0 +1,65 @@
+"""
+Module for reloading xknx.yaml when it was changed.
+
+ConfigWatcher polls modification time and size of the config file and calls
+Config.reload() of XKNX if one of them changed.
+"""
+import asyncio
+import os
+
+
+class ConfigWatcher():
+    """Class for watching config file and reloading devices on change."""
+
+    def __init__(self,
+                 xknx,
+                 file=None,
+                 interval_in_seconds=2):
+        """Initialize ConfigWatcher class."""
+        self.xknx = xknx
+        self.file = file
+        self.interval_in_seconds = interval_in_seconds
+        self.run_task = None
+        self._stat = None
+
+    def file_stat(self):
+        """Return (modification time, size) of config file or None if not existing."""
+        try:
+            stat = os.stat(self.file or self.xknx.config.file)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    async def start(self):
+        """Start ConfigWatcher."""
+        self._stat = self.file_stat()
+        self.run_task = self.xknx.loop.create_task(
+            self.run())
+
+    async def stop(self):
+        """Stop ConfigWatcher."""
+        if self.run_task is not None:
+            self.run_task.cancel()
+            try:
+                await self.run_task
+            except asyncio.CancelledError:
+                pass
+            self.run_task = None
+
+    async def run(self):
+        """Endless loop for checking config file."""
+        while True:
+            await asyncio.sleep(self.interval_in_seconds)
+            await self.check()
+
+    async def check(self):
+        """Reload config if file was changed since last check. Return ConfigDiff or None."""
+        stat = self.file_stat()
+        if stat is None or stat == self._stat:
+            return None
+        self._stat = stat
+        try:
+            return await self.xknx.config.reload(self.file)
+        except Exception as ex:  # pylint: disable=broad-except
+            self.xknx.logger.error("Error while reloading config file: %s", ex)
+            return None
@@ -0,0 +1,17 @@
+"""
+Module for binding asyncio primitives to the event loop of XKNX.
+
+The event loop is injected via XKNX(loop=...), e.g. a uvloop loop or the loop of a background
+thread which is not the current event loop of the thread constructing XKNX. Up to Python 3.9
+asyncio primitives (Event, Queue, Semaphore) bind to the current event loop when created unless
+a loop is passed. Python 3.10 removed the loop parameter, primitives bind to the running loop
+when first used.
+"""
+import sys
+
+LOOP_PARAMETER = sys.version_info < (3, 10)
+
+
+def loop_kwargs(loop):
+    """Return keyword arguments for binding asyncio primitive to loop."""
+    return {'loop': loop} if LOOP_PARAMETER else {}
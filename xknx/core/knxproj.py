@@ -0,0 +1,165 @@
+"""
+Module for importing group addresses from ETS project files (.knxproj).
+
+A .knxproj file is a ZIP archive. The installation data of a project is stored within
+P-XXXX/0.xml, containing GroupAddress elements like
+
+    <GroupAddress Id="P-0123-0_GA-1" Address="2305" Name="Kitchen Light" DatapointType="DPST-1-1" />
+
+The XML is parsed with iterparse directly from the archive. Every element is dropped from
+the tree as soon as it was parsed, so memory usage does not grow with the size of the project.
+
+From the group addresses a device configuration in the format of xknx.yaml can be generated:
+
+* DPT 1 as switch,
+* DPT 5, 7, 9, 12, 13 and 14 as sensor with matching value_type,
+* DPT 16 as notification.
+
+Group addresses with other or without DPT are skipped.
+"""
+import re
+import zipfile
+from collections import namedtuple
+from xml.etree.ElementTree import iterparse
+
+from xknx.exceptions import XKNXException
+from xknx.knx import GroupAddress
+
+ProjectGroupAddress = namedtuple(
+    'ProjectGroupAddress', ['address', 'name', 'dpt', 'description'])
+
+INSTALLATION_RE = re.compile(r'^P-[0-9A-F]{4}/\d+\.xml$', re.IGNORECASE)
+DPT_RE = re.compile(r'DPS?T-(?P<main>\d+)(-(?P<sub>\d+))?')
+
+
+def parse_dpt(datapoint_type):
+    """Return (main, sub) of first DPT within DatapointType attribute, sub may be None."""
+    if not datapoint_type:
+        return None
+    match = DPT_RE.search(datapoint_type)
+    if match is None:
+        return None
+    sub = match.group('sub')
+    return int(match.group('main')), int(sub) if sub is not None else None
+
+
+def local_name(tag):
+    """Return tag without XML namespace."""
+    return tag.rsplit('}', 1)[-1]
+
+
+class KNXProjImporter:
+    """Class for importing group addresses from ETS project files."""
+
+    SENSOR_VALUE_TYPES = {
+        (5, 1): 'percent',
+        (5, 10): 'pulse',
+        (9, 1): 'temperature',
+        (9, 4): 'illuminance',
+        (9, 5): 'speed_ms',
+        (9, 7): 'humidity',
+        (14, 19): 'electric_current',
+        (14, 27): 'electric_potential',
+        (14, 33): 'frequency',
+        (14, 56): 'power',
+    }
+
+    SENSOR_VALUE_TYPES_MAIN = {
+        7: '2byte_unsigned',
+        9: 'DPT-9',
+        12: '4byte_unsigned',
+        13: '4byte_signed',
+        14: '4byte_float',
+    }
+
+    def __init__(self, xknx):
+        """Initialize KNXProjImporter class."""
+        self.xknx = xknx
+
+    @staticmethod
+    def group_addresses(filename):
+        """Yield ProjectGroupAddress for each group address of project."""
+        with zipfile.ZipFile(filename) as archive:
+            members = [name for name in archive.namelist() if INSTALLATION_RE.match(name)]
+            if not members:
+                if any(name.upper().startswith('P-') and name.endswith('.zip')
+                       for name in archive.namelist()):
+                    raise XKNXException(
+                        "Password protected project not supported: {0}".format(filename))
+                raise XKNXException("No installation found within project: {0}".format(filename))
+            for member in members:
+                with archive.open(member) as xml_file:
+                    yield from KNXProjImporter._parse_installation(xml_file)
+
+    @staticmethod
+    def _parse_installation(xml_file):
+        """Yield group addresses of installation XML, dropping every parsed element."""
+        stack = []
+        for event, element in iterparse(xml_file, events=('start', 'end')):
+            if event == 'start':
+                stack.append(element)
+                continue
+            stack.pop()
+            if local_name(element.tag) == 'GroupAddress':
+                address = element.get('Address')
+                if address is not None:
+                    yield ProjectGroupAddress(
+                        int(address),
+                        element.get('Name', ''),
+                        parse_dpt(element.get('DatapointType')),
+                        element.get('Description', ''))
+            if stack:
+                stack[-1].remove(element)
+
+    def device_group(self, dpt):
+        """Return (group, device config) for DPT or (None, None) if not supported."""
+        if dpt is None:
+            return None, None
+        main, sub = dpt
+        if main == 1:
+            return 'switch', {}
+        if main == 16:
+            return 'notification', {}
+        value_type = self.SENSOR_VALUE_TYPES.get(dpt) or self.SENSOR_VALUE_TYPES_MAIN.get(main)
+        if value_type is None and sub is None and main == 5:
+            value_type = 'percent'
+        if value_type is None:
+            return None, None
+        return 'sensor', {'value_type': value_type}
+
+    def generate_config(self, filename, compiled=False):
+        """
+        Return device configuration in the structure of xknx.yaml.
+
+        If compiled is True, group addresses are stored as integers, as within the compiled config cache.
+        """
+        groups = {}
+        names = set()
+        skipped = 0
+        for group_address in self.group_addresses(filename):
+            group, config = self.device_group(group_address.dpt)
+            if group is None:
+                skipped += 1
+                continue
+            address = group_address.address if compiled \
+                else str(GroupAddress(group_address.address))
+            name = group_address.name or str(GroupAddress(group_address.address))
+            if name in names:
+                name = '{0} ({1})'.format(name, GroupAddress(group_address.address))
+            names.add(name)
+            config['group_address'] = address
+            groups.setdefault(group, {})[name] = config
+        self.xknx.logger.debug(
+            "Imported %s devices from %s, skipped %s group addresses", len(names), filename, skipped)
+        return {'groups': groups}
+
+    def write_config(self, filename, config_file):
+        """Write device configuration of project to config_file (xknx.yaml)."""
+        import yaml
+        with open(config_file, 'w') as filehandle:
+            yaml.safe_dump(self.generate_config(filename), filehandle,
+                           default_flow_style=False, allow_unicode=True)
+
+    def read(self, filename):
+        """Add devices of project to XKNX, tracked by its config for Config.reload()."""
+        self.xknx.config.parse_groups(self.generate_config(filename, compiled=True))
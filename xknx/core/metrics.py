@@ -0,0 +1,159 @@
+"""
+Module for collecting metrics about the telegram flow within XKNX.
+
+Metrics are identified by name and an optional set of labels (e.g. the service type of a KNX/IP frame).
+
+* Counters are increased with inc(), e.g. for the number of received frames.
+* Gauges are either set with set_gauge() or evaluated by callbacks on snapshot, e.g. the depth of the telegram queue.
+* Histograms collect observations within buckets, e.g. for latencies.
+
+snapshot() returns all metrics as dict, to_prometheus() in Prometheus text exposition format.
+"""
+from bisect import bisect_left
+
+
+class Histogram:
+    """Class for collecting observations within buckets."""
+
+    DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+                       0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+    def __init__(self, buckets=None):
+        """Initialize Histogram class."""
+        self.buckets = tuple(sorted(buckets or self.DEFAULT_BUCKETS))
+        # Last entry counts observations greater than the largest bucket.
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value):
+        """Add observation."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self):
+        """Return list of (upper bound, cumulative count) tuples. Last upper bound is '+Inf'."""
+        result = []
+        cumulative = 0
+        for upper_bound, count in zip(self.buckets + ('+Inf',), self.counts):
+            cumulative += count
+            result.append((upper_bound, cumulative))
+        return result
+
+    def snapshot(self):
+        """Return histogram as dict."""
+        return {
+            'buckets': self.cumulative_counts(),
+            'sum': self.sum,
+            'count': self.count}
+
+
+class Metrics:
+    """Class for collecting counters, gauges and histograms."""
+
+    # Names of metrics collected within XKNX.
+    FRAMES_RECEIVED = 'xknx_knxip_frames_received_total'
+    FRAMES_SENT = 'xknx_knxip_frames_sent_total'
+    PARSE_ERRORS = 'xknx_knxip_parse_errors_total'
+    TELEGRAMS_PROCESSED = 'xknx_telegrams_processed_total'
+    TELEGRAM_QUEUE_DEPTH = 'xknx_telegram_queue_depth'
+    DISPATCH_LATENCY = 'xknx_telegram_dispatch_seconds'
+    TUNNEL_ACK_RTT = 'xknx_tunnel_ack_rtt_seconds'
+    VALUE_READER_TIMEOUTS = 'xknx_value_reader_timeouts_total'
+    HEARTBEAT_FAILURES = 'xknx_heartbeat_failures_total'
+    RECONNECT_ATTEMPTS = 'xknx_reconnect_attempts_total'
+    SLOW_DEVICE_UPDATED_CALLBACKS = 'xknx_device_updated_callbacks_slow_total'
+    DEVICE_UPDATED_CALLBACK_TIMEOUTS = 'xknx_device_updated_callbacks_timeout_total'
+    BUS_LOAD = 'xknx_bus_load_ratio'
+
+    def __init__(self):
+        """Initialize Metrics class."""
+        self.counters = {}
+        self.gauges = {}
+        self.gauge_callbacks = {}
+        self.histograms = {}
+
+    @staticmethod
+    def _labels_key(labels):
+        """Return hashable representation of labels dict."""
+        if not labels:
+            return ()
+        return tuple(sorted(labels.items()))
+
+    def inc(self, name, labels=None, amount=1):
+        """Increase counter."""
+        counter = self.counters.setdefault(name, {})
+        key = self._labels_key(labels)
+        counter[key] = counter.get(key, 0) + amount
+
+    def set_gauge(self, name, value, labels=None):
+        """Set gauge to value."""
+        self.gauges.setdefault(name, {})[self._labels_key(labels)] = value
+
+    def register_gauge_callback(self, name, callback):
+        """Register callback for evaluating a gauge. Callback returns a list of (labels, value) tuples."""
+        self.gauge_callbacks[name] = callback
+
+    def unregister_gauge_callback(self, name):
+        """Unregister callback for evaluating a gauge."""
+        self.gauge_callbacks.pop(name, None)
+
+    def observe(self, name, value, labels=None, buckets=None):
+        """Add observation to histogram."""
+        histograms = self.histograms.setdefault(name, {})
+        key = self._labels_key(labels)
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = Histogram(buckets)
+            histograms[key] = histogram
+        histogram.observe(value)
+
+    def _evaluate_gauges(self):
+        """Return gauges including the values of gauge callbacks."""
+        gauges = {name: dict(values) for name, values in self.gauges.items()}
+        for name, callback in self.gauge_callbacks.items():
+            values = gauges.setdefault(name, {})
+            for labels, value in callback():
+                values[self._labels_key(labels)] = value
+        return gauges
+
+    def snapshot(self):
+        """Return dict of all metrics. Labels are represented as tuple of (key, value) tuples."""
+        return {
+            'counters': {name: dict(values) for name, values in self.counters.items()},
+            'gauges': self._evaluate_gauges(),
+            'histograms': {
+                name: {key: histogram.snapshot() for key, histogram in values.items()}
+                for name, values in self.histograms.items()}}
+
+    @staticmethod
+    def _format_labels(key, extra=()):
+        """Format labels in Prometheus text format."""
+        labels = key + tuple(extra)
+        if not labels:
+            return ''
+        return '{' + ','.join(
+            '{0}="{1}"'.format(label, str(value).replace('\\', '\\\\').replace('"', '\\"'))
+            for label, value in labels) + '}'
+
+    def to_prometheus(self):
+        """Return all metrics in Prometheus text exposition format."""
+        lines = []
+        for name, values in sorted(self.counters.items()):
+            lines.append('# TYPE {0} counter'.format(name))
+            for key, value in sorted(values.items()):
+                lines.append('{0}{1} {2}'.format(name, self._format_labels(key), value))
+        for name, values in sorted(self._evaluate_gauges().items()):
+            lines.append('# TYPE {0} gauge'.format(name))
+            for key, value in sorted(values.items()):
+                lines.append('{0}{1} {2}'.format(name, self._format_labels(key), value))
+        for name, values in sorted(self.histograms.items()):
+            lines.append('# TYPE {0} histogram'.format(name))
+            for key, histogram in sorted(values.items()):
+                for upper_bound, count in histogram.cumulative_counts():
+                    lines.append('{0}_bucket{1} {2}'.format(
+                        name, self._format_labels(key, (('le', upper_bound),)), count))
+                lines.append('{0}_sum{1} {2}'.format(name, self._format_labels(key), histogram.sum))
+                lines.append('{0}_count{1} {2}'.format(name, self._format_labels(key), histogram.count))
+        return '\n'.join(lines) + '\n'
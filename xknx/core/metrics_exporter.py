@@ -0,0 +1,63 @@
+"""
+Module for exposing the metrics of XKNX via HTTP in Prometheus text format.
+
+The exporter is a minimal HTTP server based on asyncio streams. It answers
+GET requests on /metrics and is bound to localhost by default.
+"""
+import asyncio
+
+
+class MetricsExporter:
+    """Class for serving metrics in Prometheus text format via HTTP."""
+
+    CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+    def __init__(self, xknx, host='127.0.0.1', port=9271, path='/metrics'):
+        """Initialize MetricsExporter class."""
+        # pylint: disable=too-many-arguments
+        self.xknx = xknx
+        self.host = host
+        self.port = port
+        self.path = path
+        self.server = None
+
+    async def start(self):
+        """Start HTTP server."""
+        self.server = await asyncio.start_server(
+            self.handle_request, self.host, self.port)
+        self.xknx.logger.debug("Serving metrics on http://%s:%s%s", self.host, self.port, self.path)
+
+    async def stop(self):
+        """Stop HTTP server."""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+    async def handle_request(self, reader, writer):
+        """Answer a single HTTP request."""
+        try:
+            request_line = await reader.readline()
+            # Skip headers
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+            parts = request_line.decode('latin-1').split()
+            if len(parts) < 2 or parts[0] != 'GET':
+                self._write_response(writer, '405 Method Not Allowed', 'Method not allowed\n')
+            elif parts[1].split('?')[0] != self.path:
+                self._write_response(writer, '404 Not Found', 'Not found\n')
+            else:
+                self._write_response(writer, '200 OK', self.xknx.metrics.to_prometheus())
+            await writer.drain()
+        finally:
+            writer.close()
+
+    def _write_response(self, writer, status, body):
+        """Write HTTP response."""
+        encoded_body = body.encode('utf-8')
+        writer.write(
+            'HTTP/1.0 {0}\r\nContent-Type: {1}\r\nContent-Length: {2}\r\n\r\n'.format(
+                status, self.CONTENT_TYPE, len(encoded_body)).encode('latin-1'))
+        writer.write(encoded_body)
@@ -0,0 +1,91 @@
+"""
+Module for keeping track of operations waiting for a response, e.g. a KNX/IP response frame or a group response.
+
+Pending operations are keyed by the response they expect, so a received response is matched in O(1):
+
+* KNX/IP responses by UDP client, service type, communication channel and sequence counter,
+* group responses by group address.
+
+Timeouts are kept within a timer wheel: operations are put into buckets of resolution_in_seconds.
+A single timer of the event loop expires all operations of due buckets at once instead of one
+call_later handle per operation. Operations therefore time out up to resolution_in_seconds late.
+"""
+import heapq
+import math
+
+
+class PendingOperations:
+    """Class for pending operations, waiting for response or timeout."""
+
+    def __init__(self, xknx, resolution_in_seconds=0.05):
+        """Initialize PendingOperations class."""
+        self.xknx = xknx
+        self.resolution_in_seconds = resolution_in_seconds
+        self._pending = {}
+        self._buckets = {}
+        self._ticks = []
+        self._timer_handle = None
+        self._timer_tick = None
+
+    def __len__(self):
+        """Return number of pending operations."""
+        return sum(len(futures) for futures in self._pending.values())
+
+    def __contains__(self, key):
+        """Return if an operation is waiting for response with key."""
+        return key in self._pending
+
+    def add(self, key, timeout_in_seconds):
+        """Add operation waiting for response with key. Returns future resolving to the response or None on timeout."""
+        future = self.xknx.loop.create_future()
+        self._pending.setdefault(key, []).append(future)
+        tick = math.ceil((self.xknx.loop.time() + timeout_in_seconds) / self.resolution_in_seconds)
+        bucket = self._buckets.get(tick)
+        if bucket is None:
+            bucket = self._buckets[tick] = []
+            heapq.heappush(self._ticks, tick)
+        bucket.append((key, future))
+        if self._timer_tick is None or tick < self._timer_tick:
+            self._schedule(tick)
+        return future
+
+    def resolve(self, key, response):
+        """Pass response to all operations waiting for key. Returns True if there was one."""
+        futures = self._pending.pop(key, None)
+        if futures is None:
+            return False
+        for future in futures:
+            if not future.done():
+                future.set_result(response)
+        return True
+
+    def cancel(self, key, future):
+        """Remove operation, e.g. after response was received. The bucket entry is dropped on expiry."""
+        futures = self._pending.get(key)
+        if futures is not None and future in futures:
+            futures.remove(future)
+            if not futures:
+                del self._pending[key]
+        if not future.done():
+            future.cancel()
+
+    def _schedule(self, tick):
+        """Schedule timer for expiring bucket of tick."""
+        if self._timer_handle is not None:
+            self._timer_handle.cancel()
+        self._timer_tick = tick
+        self._timer_handle = self.xknx.loop.call_at(tick * self.resolution_in_seconds, self._expire)
+
+    def _expire(self):
+        """Expire operations of all due buckets. Callback of timer."""
+        self._timer_handle = None
+        self._timer_tick = None
+        now = self.xknx.loop.time()
+        while self._ticks and self._ticks[0] * self.resolution_in_seconds <= now:
+            for key, future in self._buckets.pop(heapq.heappop(self._ticks)):
+                if future.done():
+                    continue
+                future.set_result(None)
+                self.cancel(key, future)
+        if self._ticks:
+            self._schedule(self._ticks[0])
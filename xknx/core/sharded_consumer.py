@@ -0,0 +1,187 @@
+"""
+Module for processing received telegrams within worker processes.
+
+ShardedTelegramConsumer registers at TelegramQueue like any telegram received callback,
+but instead of running the (CPU-bound) callback within the event loop it
+
+* serializes the telegram into a compact byte string,
+* chooses a shard by group address and
+* runs the callback within the single worker process of that shard.
+
+As every shard processes its telegrams one after another, the order of telegrams per
+group address is preserved. Results and exceptions of the callback are passed back to
+result_cb within the event loop.
+
+The callback has to be picklable, i.e. a function defined at module level:
+
+    def store(telegram):
+        database.insert(str(telegram.group_address), telegram.payload)
+
+    consumer = ShardedTelegramConsumer(xknx, store, workers=4)
+    await consumer.start()
+"""
+import asyncio
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from xknx.knx import (DPTArray, DPTBinary, GroupAddress, Telegram,
+                      TelegramDirection, TelegramPriority, TelegramType)
+
+from .event_loop import loop_kwargs
+
+TELEGRAM_HEADER = struct.Struct('>HBBBB')
+
+PAYLOAD_NONE = 0
+PAYLOAD_BINARY = 1
+PAYLOAD_ARRAY = 2
+
+
+def encode_telegram(telegram):
+    """Serialize telegram into compact byte string."""
+    payload = b''
+    if isinstance(telegram.payload, DPTBinary):
+        payload_type = PAYLOAD_BINARY
+        payload = bytes((telegram.payload.value,))
+    elif isinstance(telegram.payload, DPTArray):
+        payload_type = PAYLOAD_ARRAY
+        payload = bytes(telegram.payload.value)
+    else:
+        payload_type = PAYLOAD_NONE
+    return TELEGRAM_HEADER.pack(
+        telegram.group_address.raw,
+        telegram.telegramtype.value,
+        telegram.direction.value,
+        telegram.priority.value,
+        payload_type) + payload
+
+
+def decode_telegram(raw):
+    """Deserialize telegram from byte string created by encode_telegram."""
+    (group_address, telegramtype, direction, priority, payload_type) = \
+        TELEGRAM_HEADER.unpack_from(raw)
+    payload = raw[TELEGRAM_HEADER.size:]
+    if payload_type == PAYLOAD_BINARY:
+        payload = DPTBinary(payload[0])
+    elif payload_type == PAYLOAD_ARRAY:
+        payload = DPTArray(tuple(payload))
+    else:
+        payload = None
+    return Telegram(
+        GroupAddress(group_address),
+        TelegramType(telegramtype),
+        TelegramDirection(direction),
+        payload,
+        TelegramPriority(priority))
+
+
+def _run_callback(callback, raw):
+    """Decode telegram and run callback. Executed within worker process."""
+    return callback(decode_telegram(raw))
+
+
+class ShardedTelegramConsumer:
+    """Class for running telegram received callbacks within worker processes, sharded by group address."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self,
+                 xknx,
+                 callback,
+                 workers=None,
+                 address_filters=None,
+                 result_cb=None,
+                 max_pending=1000,
+                 mp_context=None):
+        """
+        Initialize ShardedTelegramConsumer class.
+
+        callback: picklable function called with the telegram within a worker process.
+        result_cb: async function called with telegram, result and exception within the event loop.
+        max_pending: number of telegrams being processed before TelegramQueue waits for workers.
+        """
+        # pylint: disable=too-many-arguments
+        self.xknx = xknx
+        self.callback = callback
+        self.workers = workers or os.cpu_count() or 1
+        self.address_filters = address_filters
+        self.result_cb = result_cb
+        self.max_pending = max_pending
+        self.mp_context = mp_context
+        self.executors = []
+        self.pending = set()
+        # Last task collecting a result per shard, for passing results to result_cb in order
+        self._last_collect = []
+        self._semaphore = None
+        self._telegram_received_cb = None
+
+    async def start(self):
+        """Start worker processes and register at TelegramQueue."""
+        kwargs = {} if self.mp_context is None else {'mp_context': self.mp_context}
+        self.executors = [ProcessPoolExecutor(max_workers=1, **kwargs)
+                          for _ in range(self.workers)]
+        self._last_collect = [None] * self.workers
+        self._semaphore = asyncio.Semaphore(self.max_pending, **loop_kwargs(self.xknx.loop))
+        self._telegram_received_cb = self.xknx.telegram_queue.register_telegram_received_cb(
+            self.telegram_received, self.address_filters)
+
+    async def stop(self):
+        """Unregister from TelegramQueue, wait for pending telegrams and stop worker processes."""
+        if self._telegram_received_cb is not None:
+            self.xknx.telegram_queue.unregister_telegram_received_cb(self._telegram_received_cb)
+            self._telegram_received_cb = None
+        await self.join()
+        # Waiting for worker processes to exit blocks, keep it off the event loop
+        await asyncio.gather(*[
+            self.xknx.loop.run_in_executor(None, partial(executor.shutdown, wait=True))
+            for executor in self.executors])
+        self.executors = []
+
+    async def join(self):
+        """Wait until all pending telegrams were processed."""
+        if self.pending:
+            await asyncio.wait(list(self.pending))
+
+    def shard(self, group_address):
+        """Return index of shard processing telegrams of group address."""
+        return group_address.raw % self.workers
+
+    async def telegram_received(self, telegram):
+        """Pass telegram to worker process. Callback from TelegramQueue."""
+        await self._semaphore.acquire()
+        shard = self.shard(telegram.group_address)
+        future = asyncio.wrap_future(
+            self.executors[shard].submit(_run_callback, self.callback, encode_telegram(telegram)),
+            loop=self.xknx.loop)
+        task = self.xknx.loop.create_task(
+            self._collect(telegram, future, self._last_collect[shard]))
+        self._last_collect[shard] = task
+        self.pending.add(task)
+        task.add_done_callback(self.pending.discard)
+        return False
+
+    async def _collect(self, telegram, future, previous):
+        """Wait for result of worker process and pass it to result_cb, after the previous result of the shard."""
+        result = None
+        exception = None
+        try:
+            result = await future
+        except Exception as ex:  # pylint: disable=broad-except
+            exception = ex
+            if self.result_cb is None:
+                self.xknx.logger.error(
+                    "Error while processing telegram %s within worker process: %s", telegram, ex)
+        finally:
+            self._semaphore.release()
+        if previous is not None:
+            await asyncio.wait([previous])
+        if self.result_cb is None:
+            return
+        try:
+            await self.result_cb(telegram, result, exception)
+        except asyncio.CancelledError:
+            raise
+        except Exception:  # pylint: disable=broad-except
+            # Nobody awaits the task, exceptions would only be reported as never retrieved
+            self.xknx.logger.exception("Result callback %s for telegram %s failed", self.result_cb, telegram)
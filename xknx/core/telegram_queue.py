@@ -6,12 +6,24 @@ When a device wants to sends a telegram to the KNX bus, it has to queue it to th
 The underlaying KNXIPInterface will poll the queue and send the packets to the correct KNX/IP abstraction (Tunneling or Routing).
 
 You may register callbacks to be notified if a telegram was pushed to the queue.
+
+Telegrams are processed in order of arrival, regardless of their direction. Only outgoing telegrams
+are reordered among each other: the next outgoing telegram is the one of highest priority, in order
+of queuing within the same priority. It is processed as soon as no incoming telegram queued before it
+is waiting, so neither direction can starve the other.
 """
 import asyncio
+import heapq
+from collections import Counter, deque
+from itertools import count
 
-from xknx.knx import TelegramDirection
+from xknx.knx import TelegramDirection, TelegramType
 from xknx.exceptions import XKNXException
 
+from .event_loop import loop_kwargs
+from .metrics import Metrics
+from .value_reader import ValueReader
+
 
 class TelegramQueue():
     """Class for telegram queue."""
@@ -35,11 +47,67 @@ class TelegramQueue():
                     return True
             return False
 
+    class Queue(asyncio.Queue):
+        """Queue for telegrams, ordering outgoing telegrams by priority and keeping track of the number of queued telegrams per direction."""
+
+        def _init(self, maxsize):
+            """Initialize queue."""
+            # pylint: disable=attribute-defined-outside-init
+            # Incoming telegrams as (sequence, telegram) in order of arrival
+            self._incoming = deque()
+            # Outgoing telegrams as heap of (priority, sequence, telegram)
+            self._outgoing = []
+            # Number of None items (stopping queue), returned after all telegrams
+            self._stop_requests = 0
+            self._counter = count()
+            self.depth = Counter()
+
+        def qsize(self):
+            """Return number of queued items."""
+            return len(self._incoming) + len(self._outgoing) + self._stop_requests
+
+        def empty(self):
+            """Return True if queue is empty."""
+            return self.qsize() == 0
+
+        def _put(self, item):
+            """Put item into queue."""
+            if item is None:
+                self._stop_requests += 1
+                return
+            sequence = next(self._counter)
+            if item.direction == TelegramDirection.INCOMING:
+                self._incoming.append((sequence, item))
+            else:
+                heapq.heappush(self._outgoing, (item.priority.value, sequence, item))
+            self.depth[item.direction] += 1
+
+        def _get(self):
+            """Get incoming or outgoing telegram, whichever was queued first. None if only stop requests are left."""
+            if self._incoming and \
+                    (not self._outgoing or self._incoming[0][0] < self._outgoing[0][1]):
+                _, item = self._incoming.popleft()
+            elif self._outgoing:
+                _, _, item = heapq.heappop(self._outgoing)
+            else:
+                self._stop_requests -= 1
+                return None
+            self.depth[item.direction] -= 1
+            return item
+
     def __init__(self, xknx):
         """Initialize TelegramQueue class."""
         self.xknx = xknx
         self.telegram_received_cbs = []
-        self.queue_stopped = asyncio.Event()
+        self.queue_stopped = asyncio.Event(**loop_kwargs(xknx.loop))
+        self.xknx.metrics.register_gauge_callback(
+            Metrics.TELEGRAM_QUEUE_DEPTH, self.queue_depth)
+
+    def queue_depth(self):
+        """Return number of queued telegrams per direction. Callback for metrics."""
+        depth = getattr(self.xknx.telegrams, 'depth', {})
+        return [({'direction': direction.name.lower()}, depth.get(direction, 0))
+                for direction in TelegramDirection]
 
     def register_telegram_received_cb(self, telegram_received_cb, address_filters=None):
         """Register callback for a telegram beeing received from KNX bus."""
@@ -68,8 +136,8 @@ class TelegramQueue():
             self.xknx.telegrams.task_done()
 
             if telegram.direction == TelegramDirection.OUTGOING:
-                # limit rate to knx bus to 20 per second
-                await asyncio.sleep(1/20)
+                # limit rate to knx bus according to estimated bus load
+                await asyncio.sleep(self.xknx.bus_load.outbound_delay(telegram))
 
         self.queue_stopped.set()
 
@@ -90,6 +158,8 @@ class TelegramQueue():
     async def process_telegram(self, telegram):
         """Process telegram."""
         self.xknx.telegram_logger.debug(telegram)
+        start_time = self.xknx.loop.time()
+        self.xknx.bus_load.record(telegram, start_time)
         try:
             if telegram.direction == TelegramDirection.INCOMING:
                 await self.process_telegram_incoming(telegram)
@@ -97,6 +167,11 @@ class TelegramQueue():
                 await self.process_telegram_outgoing(telegram)
         except XKNXException as ex:
             self.xknx.logger.error("Error while processing telegram %s", ex)
+        labels = {'direction': telegram.direction.name.lower()}
+        self.xknx.metrics.observe(
+            Metrics.DISPATCH_LATENCY, self.xknx.loop.time() - start_time, labels)
+        labels['telegramtype'] = telegram.telegramtype.name.lower()
+        self.xknx.metrics.inc(Metrics.TELEGRAMS_PROCESSED, labels)
 
     async def process_telegram_outgoing(self, telegram):
         """Process outgoing telegram."""
@@ -108,6 +183,10 @@ class TelegramQueue():
     async def process_telegram_incoming(self, telegram):
         """Process incoming telegram."""
         processed = False
+        if telegram.telegramtype in (TelegramType.GROUP_WRITE, TelegramType.GROUP_RESPONSE):
+            # Telegram is answer to ValueReader, which processes it on its own
+            processed = self.xknx.pending_operations.resolve(
+                ValueReader.pending_key(telegram.group_address), telegram)
         for telegram_received_cb in self.telegram_received_cbs:
             if telegram_received_cb.is_within_filter(telegram):
                 ret = await telegram_received_cb.callback(telegram)
@@ -0,0 +1,67 @@
+"""
+Module for batching device updated notifications.
+
+The UpdateBatcher registers itself as device updated callback within the devices vector of XKNX.
+Devices updated within a short window are collected and passed to the registered batch callback
+with one call. A scene recall changing hundreds of devices will then lead to only few callback calls.
+"""
+from collections import OrderedDict
+
+
+class UpdateBatcher:
+    """Class for collecting updated devices and notifying them in batches."""
+
+    def __init__(self, xknx, batch_updated_cb, window_in_seconds=0.05):
+        """Initialize UpdateBatcher class and register at devices vector."""
+        self.xknx = xknx
+        self.batch_updated_cb = batch_updated_cb
+        self.window_in_seconds = window_in_seconds
+        # Devices are not necessarily hashable, keyed by id() instead.
+        self._pending = OrderedDict()
+        self._flush_handle = None
+        self._flush_task = None
+        self.xknx.devices.register_device_updated_cb(self.device_updated)
+
+    async def device_updated(self, device):
+        """Collect updated device. Callback from devices vector."""
+        self._pending[id(device)] = device
+        if self._flush_handle is None:
+            self._flush_handle = self.xknx.loop.call_later(
+                self.window_in_seconds, self._flush_later)
+
+    def _flush_later(self):
+        """Start flush task. Callback from timer."""
+        self._flush_handle = None
+        self._flush_task = self.xknx.loop.create_task(self._flush_pending())
+        self._flush_task.add_done_callback(self._flush_done)
+
+    def _flush_done(self, task):
+        """Log exception of batch callback. Callback from flush task."""
+        if task is self._flush_task:
+            self._flush_task = None
+        if not task.cancelled() and task.exception() is not None:
+            self.xknx.logger.error(
+                "Error within batch callback %s", self.batch_updated_cb, exc_info=task.exception())
+
+    async def flush(self):
+        """Pass all collected devices to batch callback. Cancels scheduled or running flush."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self._flush_pending()
+
+    async def _flush_pending(self):
+        """Pass collected devices to batch callback."""
+        if not self._pending:
+            return
+        devices = list(self._pending.values())
+        self._pending = OrderedDict()
+        await self.batch_updated_cb(devices)
+
+    async def stop(self):
+        """Unregister from devices vector and flush pending devices."""
+        self.xknx.devices.unregister_device_updated_cb(self.device_updated)
+        await self.flush()
@@ -0,0 +1,89 @@
+"""
+Module for notifying registered callbacks about updated devices.
+
+The UpdateDispatcher is used by Device.after_update and Devices.device_updated. It may
+
+* call the callbacks one after another (default) or concurrently,
+* limit the number of concurrently running callbacks,
+* abort callbacks which did not finish within a given timeout and
+* log and count callbacks which took longer than a given threshold.
+"""
+import asyncio
+
+from .event_loop import loop_kwargs
+from .metrics import Metrics
+
+
+class UpdateDispatcher:
+    """Class for notifying registered callbacks about updated devices."""
+
+    def __init__(self,
+                 xknx,
+                 concurrent=False,
+                 max_concurrency=None,
+                 timeout_in_seconds=None,
+                 slow_callback_threshold=0.1):
+        """Initialize UpdateDispatcher class."""
+        # pylint: disable=too-many-arguments
+        self.xknx = xknx
+        self.concurrent = concurrent
+        self.timeout_in_seconds = timeout_in_seconds
+        self.slow_callback_threshold = slow_callback_threshold
+        self._max_concurrency = None
+        self._semaphore = None
+        self.max_concurrency = max_concurrency
+
+    @property
+    def max_concurrency(self):
+        """Return maximum number of concurrently running callbacks."""
+        return self._max_concurrency
+
+    @max_concurrency.setter
+    def max_concurrency(self, max_concurrency):
+        """Set maximum number of concurrently running callbacks. None for no limit."""
+        self._max_concurrency = max_concurrency
+        self._semaphore = None \
+            if max_concurrency is None \
+            else asyncio.Semaphore(max_concurrency, **loop_kwargs(self.xknx.loop))
+
+    async def dispatch(self, callbacks, device):
+        """Call all callbacks with device as parameter."""
+        if not callbacks:
+            return
+        if self.concurrent and len(callbacks) > 1:
+            await asyncio.gather(*[
+                self._run_callback(callback, device)
+                for callback in callbacks])
+        else:
+            for callback in list(callbacks):
+                await self._run_callback(callback, device)
+
+    async def _run_callback(self, callback, device):
+        """Run callback within limits of concurrency and timeout."""
+        if self._semaphore is None:
+            await self._run_callback_with_timeout(callback, device)
+        else:
+            async with self._semaphore:
+                await self._run_callback_with_timeout(callback, device)
+
+    async def _run_callback_with_timeout(self, callback, device):
+        """Run callback, abort after timeout and report slow callbacks."""
+        start_time = self.xknx.loop.time()
+        try:
+            if self.timeout_in_seconds is None:
+                await callback(device)
+            else:
+                await asyncio.wait_for(callback(device), self.timeout_in_seconds)
+        except asyncio.TimeoutError:
+            self.xknx.metrics.inc(Metrics.DEVICE_UPDATED_CALLBACK_TIMEOUTS)
+            self.xknx.logger.warning(
+                "Device updated callback %s for %s timed out after %s seconds",
+                callback, device.name, self.timeout_in_seconds)
+            return
+        duration = self.xknx.loop.time() - start_time
+        if self.slow_callback_threshold is not None and \
+                duration > self.slow_callback_threshold:
+            self.xknx.metrics.inc(Metrics.SLOW_DEVICE_UPDATED_CALLBACKS)
+            self.xknx.logger.warning(
+                "Device updated callback %s for %s took %.3f seconds",
+                callback, device.name, duration)
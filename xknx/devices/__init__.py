@@ -1,28 +1,38 @@
 """Module for handling devices like Lights, Switches or Covers."""
 # flake8: noqa
+from xknx.lazy_import import lazy_getattr
+
 from .device import Device
 from .devices import Devices
-from .action import Action, ActionBase, ActionCallback
-from .cover import Cover
-from .travelcalculator import TravelCalculator, TravelStatus
-from .climate import Climate
-from .light import Light
-from .switch import Switch
-from .datetime import DateTime, DateTimeBroadcastType
-from .sensor import Sensor
-from .expose_sensor import ExposeSensor
-from .binary_sensor import BinarySensor, BinarySensorState
-from .notification import Notification
-from .scene import Scene
 
-from .remote_value import RemoteValue
-from .remote_value_sensor import RemoteValueSensor
-from .remote_value_color_rgb import RemoteValueColorRGB
-from .remote_value_switch import RemoteValueSwitch
-from .remote_value_1count import RemoteValue1Count
-from .remote_value_step import RemoteValueStep
-from .remote_value_updown import RemoteValueUpDown
-from .remote_value_scene_number import RemoteValueSceneNumber
-from .remote_value_temp import RemoteValueTemp
-from .remote_value_scaling import RemoteValueScaling
-from. remote_value_dpt_value_1_ucount import RemoteValueDptValue1Ucount
+# Imported on first access
+__getattr__ = lazy_getattr(__name__, globals(), {
+    'Action': '.action',
+    'ActionBase': '.action',
+    'ActionCallback': '.action',
+    'Cover': '.cover',
+    'TravelCalculator': '.travelcalculator',
+    'TravelStatus': '.travelcalculator',
+    'Climate': '.climate',
+    'Light': '.light',
+    'Switch': '.switch',
+    'DateTime': '.datetime',
+    'DateTimeBroadcastType': '.datetime',
+    'Sensor': '.sensor',
+    'ExposeSensor': '.expose_sensor',
+    'BinarySensor': '.binary_sensor',
+    'BinarySensorState': '.binary_sensor',
+    'Notification': '.notification',
+    'Scene': '.scene',
+    'RemoteValue': '.remote_value',
+    'RemoteValueSensor': '.remote_value_sensor',
+    'RemoteValueColorRGB': '.remote_value_color_rgb',
+    'RemoteValueSwitch': '.remote_value_switch',
+    'RemoteValue1Count': '.remote_value_1count',
+    'RemoteValueStep': '.remote_value_step',
+    'RemoteValueUpDown': '.remote_value_updown',
+    'RemoteValueSceneNumber': '.remote_value_scene_number',
+    'RemoteValueTemp': '.remote_value_temp',
+    'RemoteValueScaling': '.remote_value_scaling',
+    'RemoteValueDptValue1Ucount': '.remote_value_dpt_value_1_ucount',
+})
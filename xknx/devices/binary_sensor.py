@@ -7,12 +7,15 @@ A binary sensor can be:
 * A reed sensor for detecting of a window/door is opened or closed.
 
 A BinarySensor may also have Actions attached which are executed after state was changed.
+
+Actions and the reset of the state (reset_after) are executed within separate tasks
+managed by the BinarySensor, processing of incoming telegrams is not blocked by them.
 """
 import asyncio
 import time
 from enum import Enum
 
-from xknx.exceptions import CouldNotParseTelegram
+from xknx.exceptions import CouldNotParseTelegram, XKNXException
 from xknx.knx import DPTBinary, GroupAddress
 
 from .action import Action
@@ -64,6 +67,9 @@ class BinarySensor(Device):
         self.count_set_on = 0
         self.count_set_off = 0
 
+        self._reset_task = None
+        self._action_tasks = set()
+
     @classmethod
     def from_config(cls, xknx, name, config):
         """Initialize object from configuration structure."""
@@ -104,7 +110,25 @@ class BinarySensor(Device):
 
             for action in self.actions:
                 if action.test_if_applicable(self.state, counter):
-                    await action.execute()
+                    self._schedule_action(action)
+
+    def _schedule_action(self, action):
+        """Execute action within a separate task."""
+        task = self.xknx.loop.create_task(self._execute_action(action))
+        self._action_tasks.add(task)
+        task.add_done_callback(self._action_tasks.discard)
+
+    async def _execute_action(self, action):
+        """Execute action and log errors."""
+        try:
+            await action.execute()
+        except XKNXException as ex:
+            self.xknx.logger.error("Error while executing action %s: %s", action, ex)
+        except asyncio.CancelledError:
+            raise
+        except Exception:  # pylint: disable=broad-except
+            # Nobody awaits the task, exceptions would only be reported as never retrieved
+            self.xknx.logger.exception("Unexpected error while executing action %s", action)
 
     def bump_and_get_counter(self, state):
         """Bump counter and return the number of times a state was set to the same value within CONTEXT_TIMEOUT."""
@@ -138,14 +162,42 @@ class BinarySensor(Device):
         if not isinstance(telegram.payload, DPTBinary):
             raise CouldNotParseTelegram("invalid payload", payload=telegram.payload, device_name=self.name)
 
+        self._cancel_reset()
         bit_masq = 1 << (self.significant_bit-1)
         if telegram.payload.value & bit_masq == 0:
             await self._set_internal_state(BinarySensorState.OFF)
         else:
             await self._set_internal_state(BinarySensorState.ON)
             if self.reset_after is not None:
-                await asyncio.sleep(self.reset_after/1000)
-                await self._set_internal_state(BinarySensorState.OFF)
+                self._reset_task = self.xknx.loop.create_task(
+                    self._reset_state(self.reset_after/1000))
+
+    async def _reset_state(self, wait_seconds):
+        """Set state to OFF after wait_seconds. Started after state was set to ON."""
+        await asyncio.sleep(wait_seconds)
+        # Reset is running, a new telegram must not cancel it any more.
+        self._reset_task = None
+        try:
+            await self._set_internal_state(BinarySensorState.OFF)
+        except XKNXException as ex:
+            self.xknx.logger.error("Error while resetting state of %s: %s", self.name, ex)
+        except asyncio.CancelledError:
+            raise
+        except Exception:  # pylint: disable=broad-except
+            # Nobody awaits the task, exceptions would only be reported as never retrieved
+            self.xknx.logger.exception("Unexpected error while resetting state of %s", self.name)
+
+    def _cancel_reset(self):
+        """Cancel pending reset of state."""
+        if self._reset_task is not None:
+            self._reset_task.cancel()
+            self._reset_task = None
+
+    def shutdown(self):
+        """Cancel pending reset and running actions."""
+        self._cancel_reset()
+        for task in list(self._action_tasks):
+            task.cancel()
 
     def is_on(self):
         """Return if binary sensor is 'on'."""
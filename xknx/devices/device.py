@@ -28,9 +28,7 @@ class Device:
 
     async def after_update(self):
         """Execute callbacks after internal state has been changed."""
-        for device_updated_cb in self.device_updated_cbs:
-            # pylint: disable=not-callable
-            await device_updated_cb(self)
+        await self.xknx.update_dispatcher.dispatch(self.device_updated_cbs, self)
 
     async def sync(self, wait_for_result=True):
         """Read state of device from KNX bus."""
@@ -91,6 +89,10 @@ class Device:
         # The dafault is, that devices dont answer to group reads
         pass
 
+    def shutdown(self):
+        """Cancel pending tasks of device. May be overwritten in derived classes."""
+        pass
+
     def get_name(self):
         """Return name of device."""
         return self.name
@@ -2,17 +2,32 @@
 Module for handling a vector/array of devices.
 
 More or less an array with devices. Adds some search functionality to find devices.
+
+Devices are indexed by name and by type, lookups by name are done in constant time.
+If several devices share a name, the first added device is returned.
 """
 from .device import Device
 
 
+def remove_identical(devices, device):
+    """Remove device object from list. Devices compare equal by their attributes, so list.remove() could remove a twin."""
+    for index, other in enumerate(devices):
+        if other is device:
+            del devices[index]
+            return
+    raise ValueError("Device not within devices")
+
+
 class Devices:
     """Class for handling a vector/array of devices."""
 
-    def __init__(self):
+    def __init__(self, update_dispatcher=None):
         """Initialize Devices class."""
         self.__devices = []
+        self.__devices_by_name = {}
+        self.__devices_by_type = {}
         self.device_updated_cbs = []
+        self.update_dispatcher = update_dispatcher
 
     def register_device_updated_cb(self, device_updated_cb):
         """Register callback for devices beeing updated."""
@@ -32,11 +47,18 @@ class Devices:
             if device.has_group_address(group_address):
                 yield device
 
+    def devices_by_type(self, device_type):
+        """Return device(s) of given type, including derived types."""
+        for indexed_type, devices in list(self.__devices_by_type.items()):
+            if issubclass(indexed_type, device_type):
+                yield from devices
+
     def __getitem__(self, key):
         """Return device by name or by index."""
-        for device in self.__devices:
-            if device.name == key:
-                return device
+        try:
+            return self.__devices_by_name[key]
+        except (KeyError, TypeError):
+            pass
         if isinstance(key, int):
             return self.__devices[key]
         raise KeyError
@@ -51,9 +73,29 @@ class Devices:
             raise TypeError()
         device.register_device_updated_cb(self.device_updated)
         self.__devices.append(device)
+        self.__devices_by_name.setdefault(device.name, device)
+        self.__devices_by_type.setdefault(type(device), []).append(device)
+
+    def remove(self, device):
+        """Remove device from devices vector."""
+        remove_identical(self.__devices, device)
+        device.unregister_device_updated_cb(self.device_updated)
+        devices_of_type = self.__devices_by_type[type(device)]
+        remove_identical(devices_of_type, device)
+        if not devices_of_type:
+            del self.__devices_by_type[type(device)]
+        if self.__devices_by_name.get(device.name) is device:
+            del self.__devices_by_name[device.name]
+            for other in self.__devices:
+                if other.name == device.name:
+                    self.__devices_by_name[device.name] = other
+                    break
 
     async def device_updated(self, device):
         """Call all registered device updated callbacks of device."""
+        if self.update_dispatcher is not None:
+            await self.update_dispatcher.dispatch(self.device_updated_cbs, device)
+            return
         for device_updated_cb in self.device_updated_cbs:
             await device_updated_cb(device)
 
@@ -12,6 +12,9 @@ from xknx.knx import GroupAddress, Telegram, TelegramType
 class RemoteValue():
     """Class for managing remote knx value."""
 
+    # Attributes not taken into account when comparing two remote values.
+    _EQ_IGNORED_KEYS = ("after_update_cb", "_value")
+
     def __init__(self,
                  xknx,
                  group_address=None,
@@ -31,7 +34,19 @@ class RemoteValue():
         self.after_update_cb = after_update_cb
         self.device_name = "Unknown" \
             if device_name is None else device_name
-        self.payload = None
+        self._payload = None
+        self._value = None
+
+    @property
+    def payload(self):
+        """Return current payload."""
+        return self._payload
+
+    @payload.setter
+    def payload(self, payload):
+        """Set payload and invalidate cached value."""
+        self._payload = payload
+        self._value = None
 
     @property
     def initialized(self):
@@ -86,10 +101,10 @@ class RemoteValue():
 
     @property
     def value(self):
-        """Return current value ."""
-        if self.payload is None:
-            return None
-        return self.from_knx(self.payload)
+        """Return current value. Decoded value is cached until payload changes."""
+        if self._value is None and self._payload is not None:
+            self._value = self.from_knx(self._payload)
+        return self._value
 
     async def send(self, response=False):
         """Send payload as telegram to KNX bus."""
@@ -137,14 +152,14 @@ class RemoteValue():
     def __eq__(self, other):
         """Equal operator."""
         for key, value in self.__dict__.items():
-            if key == "after_update_cb":
+            if key in self._EQ_IGNORED_KEYS:
                 continue
             if key not in other.__dict__:
                 return False
             if other.__dict__[key] != value:
                 return False
         for key, value in other.__dict__.items():
-            if key == "after_update_cb":
+            if key in self._EQ_IGNORED_KEYS:
                 continue
             if key not in self.__dict__:
                 return False
@@ -7,9 +7,11 @@ This package contains all objects managing Tunneling and Routing Connections..
 - Tunelling uses UDP packets and builds a static TUnnel with KNX/IP device.
 """
 # flake8: noqa
+from xknx.lazy_import import lazy_getattr
+
 from .request_response import RequestResponse
-from .knxip_interface import KNXIPInterface, ConnectionType, ConnectionConfig
-from .gateway_scanner import GatewayScanner
+from .knxip_interface import KNXIPInterface, ConnectionType, ConnectionConfig, InterfaceState
+from .outbound_buffer import OutboundBuffer
 from .routing import Routing
 from .tunnel import Tunnel
 from .disconnect import Disconnect
@@ -18,3 +20,20 @@ from .connect import Connect
 from .tunnelling import Tunnelling
 from .const import DEFAULT_MCAST_GRP, DEFAULT_MCAST_PORT
 from .udp_client import UDPClient
+from .heartbeat import HeartbeatManager
+
+# Imported on first access
+__getattr__ = lazy_getattr(__name__, globals(), {
+    'GatewayScanner': '.gateway_scanner',
+    'FailoverInterface': '.failover',
+    'FailoverEndpoint': '.failover',
+    'Recorder': '.recorder',
+    'RecordedFrame': '.recorder',
+    'Replay': '.recorder',
+    'ReplayInterface': '.recorder',
+    'PcapReader': '.pcap',
+    'PcapWriter': '.pcap',
+    'CapturedDatagram': '.pcap',
+    'read_knxip_frames': '.pcap',
+    'GatewaySimulator': '.gateway_simulator',
+})
@@ -0,0 +1,247 @@
+"""
+Abstraction for using several KNX/IP devices of one installation, e.g. two tunnelling interfaces and a router.
+
+FailoverInterface connects all endpoints given by an ordered list of ConnectionConfig objects
+(TUNNELING or ROUTING). Telegrams are sent and received via the first healthy endpoint. An endpoint
+is unhealthy
+
+* if it could not be connected, sending failed or its heartbeat reported a lost connection,
+  (it is reconnected in background every retry_interval_in_seconds),
+* while its last heartbeat probe failed or
+* for retry_interval_in_seconds after its ACK latency exceeded max_latency_in_seconds.
+
+An endpoint which is only degraded by its latency is still used if no healthy endpoint is left,
+the one with the lowest latency first.
+
+The active endpoint is chosen again for every telegram sent and whenever an endpoint is lost
+or reconnected or its heartbeat fails or recovers, so switching takes at most one heartbeat
+interval or one failed send. Only telegrams received via the active endpoint are passed on.
+A telegram whose sending failed is sent again via the next endpoint.
+If no endpoint is left, connection_lost_callback is called and KNXIPInterface buffers
+telegrams until reconnect() succeeds.
+"""
+import asyncio
+
+from xknx.exceptions import XKNXException
+
+from .routing import Routing
+from .tunnel import Tunnel
+
+
+class FailoverEndpoint():
+    """Class for keeping state of one endpoint of FailoverInterface."""
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, connection_config):
+        """Initialize FailoverEndpoint class."""
+        self.connection_config = connection_config
+        self.interface = None
+        self.connected = False
+        self.latency = None
+        self.degraded_until = None
+        self.reconnect_task = None
+
+    def __str__(self):
+        """Return object as readable string."""
+        return '<FailoverEndpoint {0} gateway="{1}:{2}" />'.format(
+            self.connection_config.connection_type.name,
+            self.connection_config.gateway_ip,
+            self.connection_config.gateway_port)
+
+
+class FailoverInterface():
+    """Class for sending and receiving telegrams via the first healthy of several KNX/IP devices."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    # Weight of the latest ACK latency within moving average
+    LATENCY_WEIGHT = 0.2
+
+    def __init__(self,
+                 xknx,
+                 connection_configs,
+                 telegram_received_callback=None,
+                 connection_lost_callback=None,
+                 max_latency_in_seconds=0.5,
+                 retry_interval_in_seconds=10):
+        """Initialize FailoverInterface class."""
+        # pylint: disable=too-many-arguments
+        if not connection_configs:
+            raise XKNXException("No endpoints for failover given")
+        self.xknx = xknx
+        self.endpoints = [FailoverEndpoint(connection_config)
+                          for connection_config in connection_configs]
+        self.telegram_received_callback = telegram_received_callback
+        self.connection_lost_callback = connection_lost_callback
+        self.max_latency_in_seconds = max_latency_in_seconds
+        self.retry_interval_in_seconds = retry_interval_in_seconds
+        self.active = None
+        for endpoint in self.endpoints:
+            endpoint.interface = self.create_interface(endpoint)
+
+    def create_interface(self, endpoint):
+        """Return Tunnel or Routing object for endpoint."""
+        from .knxip_interface import ConnectionType
+        connection_config = endpoint.connection_config
+
+        def telegram_received(telegram):
+            """Pass telegram only from active endpoint, as all endpoints receive the same telegrams."""
+            if endpoint is self.active and self.telegram_received_callback is not None:
+                self.telegram_received_callback(telegram)
+
+        if connection_config.connection_type == ConnectionType.TUNNELING:
+            return Tunnel(
+                self.xknx,
+                self.xknx.own_address,
+                local_ip=connection_config.local_ip,
+                gateway_ip=connection_config.gateway_ip,
+                gateway_port=connection_config.gateway_port,
+                telegram_received_callback=telegram_received,
+                connection_lost_callback=lambda: self.endpoint_lost(endpoint),
+                heartbeat_changed_callback=lambda healthy: self.select())
+        if connection_config.connection_type == ConnectionType.ROUTING:
+            return Routing(self.xknx, telegram_received, connection_config.local_ip,
+                           receive_batch_size=connection_config.receive_batch_size,
+                           send_batching=connection_config.send_batching)
+        raise XKNXException("Connection type not supported for failover: {0}".format(
+            connection_config.connection_type))
+
+    def healthy(self, endpoint, now=None):
+        """Return if endpoint may be used for sending telegrams."""
+        if not endpoint.connected:
+            return False
+        if self.xknx.heartbeat_manager.failures.get(endpoint.interface):
+            return False
+        if endpoint.degraded_until is not None:
+            if (now or self.xknx.loop.time()) < endpoint.degraded_until:
+                return False
+            endpoint.degraded_until = None
+            endpoint.latency = None
+        return True
+
+    def select(self):
+        """Return first healthy endpoint, else the degraded one with lowest latency, and make it the active one. None if no endpoint is connected."""
+        now = self.xknx.loop.time()
+        selected = None
+        degraded = []
+        for endpoint in self.endpoints:
+            if self.healthy(endpoint, now):
+                selected = endpoint
+                break
+            if endpoint.connected and endpoint.degraded_until is not None and \
+                    not self.xknx.heartbeat_manager.failures.get(endpoint.interface):
+                degraded.append(endpoint)
+        if selected is None and degraded:
+            selected = min(degraded, key=lambda endpoint: endpoint.latency)
+        if selected is not None and selected is not self.active:
+            self.xknx.logger.info("Switching to %s", selected)
+        self.active = selected
+        return selected
+
+    async def start(self):
+        """Connect all endpoints. Raises XKNXException if none could be connected."""
+        for endpoint in self.endpoints:
+            try:
+                await endpoint.interface.start()
+                endpoint.connected = True
+            except XKNXException as ex:
+                self.xknx.logger.warning("Could not connect %s: %s", endpoint, ex)
+                self.start_reconnect(endpoint)
+        if self.select() is None:
+            await self.stop()
+            raise XKNXException("Could not connect any endpoint")
+
+    async def stop(self):
+        """Disconnect all endpoints."""
+        for endpoint in self.endpoints:
+            await self.cancel_reconnect(endpoint)
+            endpoint.connected = False
+            try:
+                await endpoint.interface.stop()
+            except XKNXException as ex:
+                self.xknx.logger.debug("Could not stop %s: %s", endpoint, ex)
+        self.active = None
+
+    async def send_telegram(self, telegram):
+        """Send telegram via active endpoint, switching to the next endpoint if sending failed."""
+        while True:
+            endpoint = self.select()
+            if endpoint is None:
+                raise XKNXException("No endpoint connected")
+            start_time = self.xknx.loop.time()
+            try:
+                await endpoint.interface.send_telegram(telegram)
+            except XKNXException as ex:
+                self.xknx.logger.warning("Could not send telegram via %s: %s", endpoint, ex)
+                self.endpoint_lost(endpoint, notify=False)
+                continue
+            self.record_latency(endpoint, self.xknx.loop.time() - start_time)
+            return
+
+    def record_latency(self, endpoint, latency):
+        """Update moving average of ACK latency and mark endpoint as degraded if too slow."""
+        if endpoint.latency is None:
+            endpoint.latency = latency
+        else:
+            endpoint.latency += self.LATENCY_WEIGHT * (latency - endpoint.latency)
+        if endpoint.latency > self.max_latency_in_seconds:
+            self.xknx.logger.warning("Latency of %s too high: %.3fs", endpoint, endpoint.latency)
+            endpoint.degraded_until = self.xknx.loop.time() + self.retry_interval_in_seconds
+
+    def endpoint_lost(self, endpoint, notify=True):
+        """Mark endpoint as disconnected and reconnect it in background. Callback from heartbeat of tunnel."""
+        if not endpoint.connected:
+            return
+        endpoint.connected = False
+        self.select()
+        if any(other.connected for other in self.endpoints):
+            self.start_reconnect(endpoint)
+        elif notify:
+            if self.connection_lost_callback is not None:
+                self.connection_lost_callback()
+            else:
+                self.start_reconnect(endpoint)
+
+    def start_reconnect(self, endpoint):
+        """Start reconnecting endpoint in background."""
+        if endpoint.reconnect_task is None or endpoint.reconnect_task.done():
+            endpoint.reconnect_task = self.xknx.loop.create_task(
+                self.reconnect_endpoint(endpoint))
+
+    async def cancel_reconnect(self, endpoint):
+        """Cancel reconnecting endpoint in background."""
+        if endpoint.reconnect_task is not None:
+            endpoint.reconnect_task.cancel()
+            try:
+                await endpoint.reconnect_task
+            except asyncio.CancelledError:
+                pass
+            endpoint.reconnect_task = None
+
+    async def reconnect_endpoint(self, endpoint):
+        """Reconnect endpoint every retry_interval_in_seconds until successful."""
+        while not endpoint.connected:
+            await asyncio.sleep(self.retry_interval_in_seconds)
+            try:
+                await endpoint.interface.reconnect()
+                endpoint.connected = True
+                self.xknx.logger.info("Reconnected %s", endpoint)
+                self.select()
+            except XKNXException as ex:
+                self.xknx.logger.debug("Could not reconnect %s: %s", endpoint, ex)
+
+    async def reconnect(self):
+        """Reconnect all disconnected endpoints. Raises XKNXException if none could be connected."""
+        for endpoint in self.endpoints:
+            if endpoint.connected:
+                continue
+            await self.cancel_reconnect(endpoint)
+            try:
+                await endpoint.interface.reconnect()
+                endpoint.connected = True
+            except XKNXException as ex:
+                self.xknx.logger.debug("Could not reconnect %s: %s", endpoint, ex)
+                self.start_reconnect(endpoint)
+        if self.select() is None:
+            raise XKNXException("Could not reconnect any endpoint")
@@ -6,9 +6,6 @@ GatewayScanner is an abstraction for searching for KNX/IP devices on the local n
 * it returns the first found device
 """
 
-import asyncio
-
-import netifaces
 from xknx.knxip import (HPAI, DIBServiceFamily, DIBSuppSVCFamilies, KNXIPFrame,
                         KNXIPServiceType, SearchResponse)
 
@@ -23,7 +20,6 @@ class GatewayScanner():
     def __init__(self, xknx, timeout_in_seconds=4):
         """Initialize GatewayScanner class."""
         self.xknx = xknx
-        self.response_received_or_timeout = asyncio.Event()
         self.found = False
         self.found_ip_addr = None
         self.found_port = None
@@ -33,8 +29,6 @@ class GatewayScanner():
         self.supports_tunneling = False
         self.udpclients = []
         self.timeout_in_seconds = timeout_in_seconds
-        self.timeout_callback = None
-        self.timeout_handle = None
 
     def response_rec_callback(self, knxipframe, udp_client):
         """Verify and handle knxipframe. Callback from internal udpclient."""
@@ -54,16 +48,23 @@ class GatewayScanner():
 
             (self.found_local_ip, _) = udp_client.getsockname()
 
-            self.response_received_or_timeout.set()
             self.found = True
+            self.xknx.pending_operations.resolve(self.pending_key(), knxipframe)
+
+    def pending_key(self):
+        """Return key of pending operation waiting for first search response."""
+        return (self, KNXIPServiceType.SEARCH_RESPONSE)
 
     async def start(self):
         """Start searching."""
-        await self.send_search_requests()
-        await self.start_timeout()
-        await self.response_received_or_timeout.wait()
-        await self.stop()
-        await self.stop_timeout()
+        key = self.pending_key()
+        future = self.xknx.pending_operations.add(key, self.timeout_in_seconds)
+        try:
+            await self.send_search_requests()
+            await future
+        finally:
+            self.xknx.pending_operations.cancel(key, future)
+            await self.stop()
 
     async def stop(self):
         """Stop tearing down udpclient."""
@@ -73,6 +74,7 @@ class GatewayScanner():
     async def send_search_requests(self):
         """Send search requests on all connected interfaces."""
         # pylint: disable=no-member
+        import netifaces
         for interface in netifaces.interfaces():
             try:
                 af_inet = netifaces.ifaddresses(interface)[netifaces.AF_INET]
@@ -104,16 +106,3 @@ class GatewayScanner():
             HPAI(ip_addr=local_addr, port=local_port)
         knxipframe.normalize()
         udpclient.send(knxipframe)
-
-    def timeout(self):
-        """Handle timeout for not having received a SearchResponse."""
-        self.response_received_or_timeout.set()
-
-    async def start_timeout(self):
-        """Start time out."""
-        self.timeout_handle = self.xknx.loop.call_later(
-            self.timeout_in_seconds, self.timeout)
-
-    async def stop_timeout(self):
-        """Stop/cancel timeout."""
-        self.timeout_handle.cancel()
@@ -0,0 +1,305 @@
+"""
+GatewaySimulator is a local KNXnet/IP server for testing and benchmarking without KNX hardware.
+
+It listens on a (loopback) UDP port and
+
+* answers SEARCH_REQUEST, CONNECT_REQUEST, CONNECTIONSTATE_REQUEST and DISCONNECT_REQUEST,
+* acknowledges TUNNELLING_REQUEST frames and stores written values,
+* answers GROUP_READ telegrams for group addresses with a simulated value,
+* may simulate latency, loss of frames and delayed ACKs and
+* may generate load by emitting a given number of indications per second.
+"""
+import asyncio
+import random
+from collections import deque
+
+from xknx.exceptions import CouldNotParseKNXIP
+from xknx.knx import (DPTBinary, GroupAddress, PhysicalAddress, Telegram,
+                      TelegramType)
+from xknx.knxip import (HPAI, CEMIMessageCode, ConnectRequestType,
+                        DIBDeviceInformation, DIBServiceFamily,
+                        DIBSuppSVCFamilies, ErrorCode, KNXIPFrame,
+                        KNXIPServiceType)
+
+from .const import DEFAULT_MCAST_GRP, DEFAULT_MCAST_PORT
+
+
+class GatewaySimulator:
+    """Class for simulating a KNXnet/IP tunnelling and routing device."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    class Connection:
+        """Class for storing state of a tunnel connection."""
+
+        # pylint: disable=too-few-public-methods
+
+        def __init__(self, communication_channel, data_endpoint):
+            """Initialize Connection class."""
+            self.communication_channel = communication_channel
+            self.data_endpoint = data_endpoint
+            self.sequence_counter = 0
+
+    class Protocol(asyncio.DatagramProtocol):
+        """Abstraction for managing the asyncio-udp transport of the simulator."""
+
+        def __init__(self, simulator):
+            """Initialize Protocol class."""
+            self.simulator = simulator
+
+        def connection_made(self, transport):
+            """Assign transport. Callback after udp connection was made."""
+            self.simulator.transport = transport
+
+        def datagram_received(self, data, addr):
+            """Pass datagram to simulator. Callback for datagram received."""
+            self.simulator.datagram_received(data, addr)
+
+    def __init__(self,
+                 xknx,
+                 local_ip='127.0.0.1',
+                 port=0,
+                 individual_address='1.1.250',
+                 name='XKNX Gateway Simulator',
+                 latency=0,
+                 loss=0,
+                 ack_delay=0,
+                 max_connections=4,
+                 seed=None):
+        """
+        Initialize GatewaySimulator class.
+
+        latency: delay in seconds of every frame sent by the simulator.
+        loss: probability (0..1) of dropping a received or sent frame.
+        ack_delay: additional delay in seconds of TUNNELLING_ACK frames.
+        """
+        # pylint: disable=too-many-arguments
+        self.xknx = xknx
+        self.local_ip = local_ip
+        self.port = port
+        self.individual_address = PhysicalAddress(individual_address)
+        self.name = name
+        self.latency = latency
+        self.loss = loss
+        self.ack_delay = ack_delay
+        self.max_connections = max_connections
+        self.random = random.Random(seed)
+        self.transport = None
+        self.connections = {}
+        # Values of simulated devices, indexed by raw group address
+        self.group_values = {}
+        self.received_telegrams = deque(maxlen=1000)
+        self.frames_received = 0
+        self.frames_sent = 0
+        self.frames_dropped = 0
+
+    @property
+    def address(self):
+        """Return (ip, port) the simulator is listening on."""
+        return self.transport.get_extra_info('sockname')[:2]
+
+    async def start(self):
+        """Start listening."""
+        await self.xknx.loop.create_datagram_endpoint(
+            lambda: GatewaySimulator.Protocol(self),
+            local_addr=(self.local_ip, self.port))
+
+    async def stop(self):
+        """Stop listening."""
+        if self.transport is not None:
+            self.transport.close()
+            self.transport = None
+        self.connections = {}
+
+    def set_value(self, group_address, payload):
+        """Set value of simulated device. GROUP_READs for group_address will be answered with payload."""
+        self.group_values[GroupAddress(group_address).raw] = payload
+
+    def _drop(self):
+        """Return True if frame should be dropped for simulating loss."""
+        if self.loss and self.random.random() < self.loss:
+            self.frames_dropped += 1
+            return True
+        return False
+
+    def send(self, knxipframe, addr, delay=0):
+        """Send KNXIPFrame to addr after configured latency."""
+        if self.transport is None or self._drop():
+            return
+        knxipframe.normalize()
+        raw = bytes(knxipframe.to_knx())
+        delay += self.latency
+        if delay > 0:
+            self.xknx.loop.call_later(delay, self._sendto, raw, addr)
+        else:
+            self._sendto(raw, addr)
+
+    def _sendto(self, raw, addr):
+        """Send raw data to addr."""
+        if self.transport is not None:
+            self.transport.sendto(raw, addr)
+            self.frames_sent += 1
+
+    def datagram_received(self, data, addr):
+        """Parse and handle received frame."""
+        if self._drop():
+            return
+        self.frames_received += 1
+        knxipframe = KNXIPFrame(self.xknx)
+        try:
+            knxipframe.from_knx(data)
+        except (CouldNotParseKNXIP, ValueError, TypeError) as ex:
+            self.xknx.logger.warning("Simulator could not parse frame from %s: %s", addr, ex)
+            return
+        handlers = {
+            KNXIPServiceType.SEARCH_REQUEST: self._handle_search_request,
+            KNXIPServiceType.CONNECT_REQUEST: self._handle_connect_request,
+            KNXIPServiceType.CONNECTIONSTATE_REQUEST: self._handle_connectionstate_request,
+            KNXIPServiceType.DISCONNECT_REQUEST: self._handle_disconnect_request,
+            KNXIPServiceType.TUNNELLING_REQUEST: self._handle_tunnelling_request,
+            KNXIPServiceType.ROUTING_INDICATION: self._handle_routing_indication}
+        handler = handlers.get(knxipframe.header.service_type_ident)
+        if handler is not None:
+            handler(knxipframe, addr)
+
+    @staticmethod
+    def _endpoint(hpai, addr):
+        """Return address of HPAI or addr if HPAI is empty (NAT mode)."""
+        if hpai.ip_addr == '0.0.0.0' or hpai.port == 0:
+            return addr
+        return hpai.ip_addr, hpai.port
+
+    def _handle_search_request(self, knxipframe, addr):
+        """Answer SEARCH_REQUEST with device information and supported service families."""
+        (local_ip, local_port) = self.address
+        response = KNXIPFrame(self.xknx)
+        response.init(KNXIPServiceType.SEARCH_RESPONSE)
+        response.body.control_endpoint = HPAI(ip_addr=local_ip, port=local_port)
+
+        device_information = DIBDeviceInformation()
+        device_information.individual_address = self.individual_address
+        device_information.serial_number = "00:00:00:00:00:00"
+        device_information.multicast_address = DEFAULT_MCAST_GRP
+        device_information.mac_address = "00:00:00:00:00:00"
+        device_information.name = self.name
+        supported_families = DIBSuppSVCFamilies()
+        for family in (DIBServiceFamily.CORE,
+                       DIBServiceFamily.TUNNELING,
+                       DIBServiceFamily.ROUTING):
+            supported_families.families.append(DIBSuppSVCFamilies.Family(family, 1))
+        response.body.dibs = [device_information, supported_families]
+        self.send(response, self._endpoint(knxipframe.body.discovery_endpoint, addr))
+
+    def _handle_connect_request(self, knxipframe, addr):
+        """Answer CONNECT_REQUEST and open tunnel connection."""
+        response = KNXIPFrame(self.xknx)
+        response.init(KNXIPServiceType.CONNECT_RESPONSE)
+        response.body.request_type = ConnectRequestType.TUNNEL_CONNECTION
+        response.body.identifier = self.individual_address.raw
+        (local_ip, local_port) = self.address
+        response.body.control_endpoint = HPAI(ip_addr=local_ip, port=local_port)
+
+        free_channels = [channel for channel in range(1, 256)
+                         if channel not in self.connections]
+        if len(self.connections) >= self.max_connections or not free_channels:
+            response.body.status_code = ErrorCode.E_NO_MORE_CONNECTIONS
+        else:
+            communication_channel = free_channels[0]
+            self.connections[communication_channel] = GatewaySimulator.Connection(
+                communication_channel,
+                self._endpoint(knxipframe.body.data_endpoint, addr))
+            response.body.communication_channel = communication_channel
+        self.send(response, self._endpoint(knxipframe.body.control_endpoint, addr))
+
+    def _handle_connectionstate_request(self, knxipframe, addr):
+        """Answer CONNECTIONSTATE_REQUEST."""
+        response = KNXIPFrame(self.xknx)
+        response.init(KNXIPServiceType.CONNECTIONSTATE_RESPONSE)
+        response.body.communication_channel_id = knxipframe.body.communication_channel_id
+        if knxipframe.body.communication_channel_id not in self.connections:
+            response.body.status_code = ErrorCode.E_CONNECTION_ID
+        self.send(response, self._endpoint(knxipframe.body.control_endpoint, addr))
+
+    def _handle_disconnect_request(self, knxipframe, addr):
+        """Answer DISCONNECT_REQUEST and close tunnel connection."""
+        self.connections.pop(knxipframe.body.communication_channel_id, None)
+        response = KNXIPFrame(self.xknx)
+        response.init(KNXIPServiceType.DISCONNECT_RESPONSE)
+        response.body.communication_channel_id = knxipframe.body.communication_channel_id
+        self.send(response, self._endpoint(knxipframe.body.control_endpoint, addr))
+
+    def _handle_tunnelling_request(self, knxipframe, addr):
+        """Acknowledge TUNNELLING_REQUEST and process telegram."""
+        connection = self.connections.get(knxipframe.body.communication_channel_id)
+        ack = KNXIPFrame(self.xknx)
+        ack.init(KNXIPServiceType.TUNNELLING_ACK)
+        ack.body.communication_channel_id = knxipframe.body.communication_channel_id
+        ack.body.sequence_counter = knxipframe.body.sequence_counter
+        if connection is None:
+            ack.body.status_code = ErrorCode.E_CONNECTION_ID
+            self.send(ack, addr, self.ack_delay)
+            return
+        self.send(ack, connection.data_endpoint, self.ack_delay)
+        self._process_telegram(knxipframe.body.cemi.telegram)
+
+    def _handle_routing_indication(self, knxipframe, addr):
+        """Process telegram of ROUTING_INDICATION."""
+        # pylint: disable=unused-argument
+        self._process_telegram(knxipframe.body.telegram)
+
+    def _process_telegram(self, telegram):
+        """Store written values and answer GROUP_READs of simulated devices."""
+        self.received_telegrams.append(telegram)
+        if telegram.telegramtype == TelegramType.GROUP_WRITE:
+            self.group_values[telegram.group_address.raw] = telegram.payload
+        elif telegram.telegramtype == TelegramType.GROUP_READ and \
+                telegram.group_address.raw in self.group_values:
+            self.send_indication(
+                Telegram(
+                    telegram.group_address,
+                    TelegramType.GROUP_RESPONSE,
+                    payload=self.group_values[telegram.group_address.raw]),
+                delay=self.ack_delay)
+
+    def send_indication(self, telegram, routing_target=None, delay=0):
+        """Send telegram to all connected tunnels and optionally as ROUTING_INDICATION to routing_target."""
+        for connection in self.connections.values():
+            knxipframe = KNXIPFrame(self.xknx)
+            knxipframe.init(KNXIPServiceType.TUNNELLING_REQUEST)
+            knxipframe.body.communication_channel_id = connection.communication_channel
+            knxipframe.body.sequence_counter = connection.sequence_counter
+            knxipframe.body.cemi.code = CEMIMessageCode.L_DATA_IND
+            knxipframe.body.cemi.telegram = telegram
+            knxipframe.body.cemi.src_addr = self.individual_address
+            connection.sequence_counter = (connection.sequence_counter + 1) & 0xFF
+            self.send(knxipframe, connection.data_endpoint, delay)
+        if routing_target is not None:
+            knxipframe = KNXIPFrame(self.xknx)
+            knxipframe.init(KNXIPServiceType.ROUTING_INDICATION)
+            knxipframe.body.telegram = telegram
+            knxipframe.body.src_addr = self.individual_address
+            self.send(knxipframe, routing_target, delay)
+
+    async def generate_load(self,
+                            rate,
+                            count,
+                            group_address='1/1/1',
+                            payload=None,
+                            routing_target=None):
+        """Send count GROUP_WRITE indications with rate indications per second. Payload defaults to DPTBinary(1)."""
+        # pylint: disable=too-many-arguments
+        if payload is None:
+            payload = DPTBinary(1)
+        telegram = Telegram(GroupAddress(group_address), payload=payload)
+        start_time = self.xknx.loop.time()
+        for number in range(count):
+            delay = start_time + number / rate - self.xknx.loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self.send_indication(telegram, routing_target=routing_target)
+
+    async def generate_routing_load(self, rate, count, group_address='1/1/1', payload=None):
+        """Send count GROUP_WRITE routing indications to the KNX/IP multicast group."""
+        await self.generate_load(
+            rate, count, group_address, payload,
+            routing_target=(DEFAULT_MCAST_GRP, DEFAULT_MCAST_PORT))
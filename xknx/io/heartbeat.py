@@ -0,0 +1,125 @@
+"""
+Heartbeat for monitoring the state of tunnels, as suggested by 03.08.02 KNX Core 5.4.
+
+HeartbeatManager sends CONNECTIONSTATE requests for all tunnels from one task:
+
+* A tunnel is probed every interval_in_seconds.
+* Received tunnelling requests and ACKs prove the tunnel is alive and postpone the probe,
+  but at most until max_interval_in_seconds after the last probe, as the KNX/IP device
+  only keeps the connection alive if it receives CONNECTIONSTATE requests.
+* After a failed probe the tunnel is probed again after retry_interval_in_seconds.
+  If more than max_failures probes in a row failed, the tunnel is reconnected.
+* The tunnel is notified if its first probe failed and if a probe succeeded again afterwards.
+"""
+import asyncio
+
+from xknx.core import Metrics
+from xknx.core.event_loop import loop_kwargs
+from xknx.exceptions import XKNXException
+
+
+class HeartbeatManager():
+    """Class for scheduling heartbeats of all tunnels."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self,
+                 xknx,
+                 interval_in_seconds=15,
+                 max_interval_in_seconds=60,
+                 retry_interval_in_seconds=2,
+                 max_failures=3):
+        """Initialize HeartbeatManager class."""
+        # pylint: disable=too-many-arguments
+        self.xknx = xknx
+        self.interval_in_seconds = interval_in_seconds
+        self.max_interval_in_seconds = max_interval_in_seconds
+        self.retry_interval_in_seconds = retry_interval_in_seconds
+        self.max_failures = max_failures
+        self.next_probe = {}
+        self.last_probe = {}
+        self.failures = {}
+        self.run_task = None
+        self._changed = None
+
+    def register(self, tunnel):
+        """Start monitoring tunnel."""
+        now = self.xknx.loop.time()
+        self.next_probe[tunnel] = now + self.interval_in_seconds
+        self.last_probe[tunnel] = now
+        self.failures[tunnel] = 0
+        if self.run_task is None or self.run_task.done():
+            self._changed = asyncio.Event(**loop_kwargs(self.xknx.loop))
+            self.run_task = self.xknx.loop.create_task(self.run())
+        else:
+            self._changed.set()
+
+    async def unregister(self, tunnel):
+        """Stop monitoring tunnel. Stops task if no tunnel is left."""
+        self.next_probe.pop(tunnel, None)
+        self.last_probe.pop(tunnel, None)
+        self.failures.pop(tunnel, None)
+        if not self.next_probe:
+            await self.stop()
+
+    def alive(self, tunnel):
+        """Postpone probe of tunnel, as traffic proved that it is alive."""
+        if tunnel not in self.next_probe or self.failures[tunnel]:
+            return
+        self.next_probe[tunnel] = min(
+            self.xknx.loop.time() + self.interval_in_seconds,
+            self.last_probe[tunnel] + self.max_interval_in_seconds)
+
+    async def stop(self):
+        """Cancel heartbeat task."""
+        run_task = self.run_task
+        self.run_task = None
+        if run_task is not None:
+            run_task.cancel()
+            try:
+                await run_task
+            except asyncio.CancelledError:
+                pass
+
+    async def run(self):
+        """Endless loop, probing all tunnels which are due."""
+        while self.next_probe:
+            now = self.xknx.loop.time()
+            due = [tunnel for tunnel, next_probe in self.next_probe.items() if next_probe <= now]
+            if due:
+                await asyncio.gather(*[self.probe(tunnel) for tunnel in due])
+                continue
+            self._changed.clear()
+            try:
+                await asyncio.wait_for(
+                    self._changed.wait(), min(self.next_probe.values()) - now)
+            except asyncio.TimeoutError:
+                pass
+
+    async def probe(self, tunnel):
+        """Send CONNECTIONSTATE request to tunnel and schedule next probe."""
+        success = await tunnel.connectionstate()
+        if tunnel not in self.next_probe:
+            return
+        now = self.xknx.loop.time()
+        self.last_probe[tunnel] = now
+        if success:
+            recovered = self.failures[tunnel] > 0
+            self.failures[tunnel] = 0
+            self.next_probe[tunnel] = now + self.interval_in_seconds
+            if recovered:
+                tunnel.heartbeat_changed(True)
+            return
+        self.xknx.metrics.inc(Metrics.HEARTBEAT_FAILURES)
+        self.failures[tunnel] += 1
+        self.next_probe[tunnel] = now + self.retry_interval_in_seconds
+        if self.failures[tunnel] == 1:
+            tunnel.heartbeat_changed(False)
+        if self.failures[tunnel] > self.max_failures:
+            self.xknx.logger.warning("Heartbeat failed - reconnecting")
+            self.failures[tunnel] = 0
+            self.next_probe[tunnel] = now + self.interval_in_seconds
+            try:
+                await tunnel.connection_lost()
+            except XKNXException as ex:
+                self.xknx.logger.error("Could not reconnect tunnel: %s", ex)
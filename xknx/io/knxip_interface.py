@@ -5,13 +5,20 @@ KNXIPInterface manages KNX/IP Tunneling or Routing connections.
 * It passes KNX telegrams from the network and
 * provides callbacks after having received a telegram from the network.
 
+If the connection is lost, KNXIPInterface reconnects in the background with jittered
+exponential backoff. Telegrams sent in the meantime are kept within an OutboundBuffer
+and sent at the rate limit of the bus after the connection was established again.
+Senders never wait for the reconnect.
 """
+import asyncio
+import random
 from enum import Enum
 
+from xknx.core import Metrics
 from xknx.exceptions import XKNXException
 
 from .const import DEFAULT_MCAST_PORT
-from .gateway_scanner import GatewayScanner
+from .outbound_buffer import OutboundBuffer
 from .routing import Routing
 from .tunnel import Tunnel
 
@@ -22,6 +29,17 @@ class ConnectionType(Enum):
     AUTOMATIC = 0
     TUNNELING = 1
     ROUTING = 2
+    FAILOVER = 3
+
+
+class InterfaceState(Enum):
+    """Enum class for the state of the connection of KNXIPInterface."""
+
+    STOPPED = 0
+    CONNECTING = 1
+    CONNECTED = 2
+    DISCONNECTED = 3
+    DRAINING = 4
 
 
 class ConnectionConfig:
@@ -33,23 +51,48 @@ class ConnectionConfig:
         * AUTOMATIC for using GatewayScanner for searching and finding KNX/IP devices in the network.
         * TUNNELING connect to a specific KNX/IP tunneling device.
         * ROUTING use KNX/IP multicast routing.
+        * FAILOVER use the first healthy of several TUNNELING or ROUTING endpoints.
+    * endpoints: ordered list of ConnectionConfig objects for FAILOVER.
     * local_ip: Local ip of the interface though which KNXIPInterface should connect.
     * gateway_ip: IP of KNX/IP tunneling device.
     * gateway_port: Port of KNX/IP tunneling device.
+    * backoff_initial_in_seconds / backoff_max_in_seconds: range of the delay between reconnect attempts.
+    * buffer_maxsize / buffer_ttl_in_seconds / buffer_coalesce: OutboundBuffer used while disconnected.
+    * receive_batch_size: maximum number of datagrams read per wakeup of the event loop for ROUTING.
+      None reads one datagram per wakeup via the asyncio datagram transport.
+    * send_batching: send all frames of one event loop iteration together for ROUTING,
+      e.g. when a scene is recalled. Otherwise each frame is sent immediately.
     """
 
-    # pylint: disable=too-few-public-methods
+    # pylint: disable=too-few-public-methods,too-many-instance-attributes
 
     def __init__(self,
                  connection_type=ConnectionType.AUTOMATIC,
                  local_ip=None,
                  gateway_ip=None,
-                 gateway_port=DEFAULT_MCAST_PORT):
+                 gateway_port=DEFAULT_MCAST_PORT,
+                 backoff_initial_in_seconds=0.5,
+                 backoff_max_in_seconds=60,
+                 buffer_maxsize=1000,
+                 buffer_ttl_in_seconds=None,
+                 buffer_coalesce=False,
+                 endpoints=None,
+                 receive_batch_size=None,
+                 send_batching=False):
         """Initialize ConnectionConfig class."""
+        # pylint: disable=too-many-arguments
         self.connection_type = connection_type
         self.local_ip = local_ip
         self.gateway_ip = gateway_ip
         self.gateway_port = gateway_port
+        self.backoff_initial_in_seconds = backoff_initial_in_seconds
+        self.backoff_max_in_seconds = backoff_max_in_seconds
+        self.buffer_maxsize = buffer_maxsize
+        self.buffer_ttl_in_seconds = buffer_ttl_in_seconds
+        self.buffer_coalesce = buffer_coalesce
+        self.endpoints = endpoints
+        self.receive_batch_size = receive_batch_size
+        self.send_batching = send_batching
 
 
 class KNXIPInterface():
@@ -60,9 +103,26 @@ class KNXIPInterface():
         self.xknx = xknx
         self.interface = None
         self.connection_config = connection_config
+        self.state = InterfaceState.STOPPED
+        self.buffer = OutboundBuffer(
+            xknx,
+            maxsize=connection_config.buffer_maxsize,
+            ttl_in_seconds=connection_config.buffer_ttl_in_seconds,
+            coalesce=connection_config.buffer_coalesce)
+        self.reconnect_task = None
 
     async def start(self):
         """Start interface. Connecting KNX/IP device with the selected method."""
+        self.state = InterfaceState.CONNECTING
+        try:
+            await self._start_interface()
+        except BaseException:
+            self.state = InterfaceState.STOPPED
+            raise
+        self.state = InterfaceState.CONNECTED
+
+    async def _start_interface(self):
+        """Connect KNX/IP device with the selected method."""
         if self.connection_config.connection_type == ConnectionType.AUTOMATIC:
             await self.start_automatic()
         elif self.connection_config.connection_type == ConnectionType.ROUTING:
@@ -73,9 +133,12 @@ class KNXIPInterface():
                 self.connection_config.local_ip,
                 self.connection_config.gateway_ip,
                 self.connection_config.gateway_port)
+        elif self.connection_config.connection_type == ConnectionType.FAILOVER:
+            await self.start_failover(self.connection_config.endpoints)
 
     async def start_automatic(self):
         """Start GatewayScanner and connect to the found device."""
+        from .gateway_scanner import GatewayScanner
         gatewayscanner = GatewayScanner(self.xknx)
         await gatewayscanner.start()
         await gatewayscanner.stop()
@@ -99,7 +162,8 @@ class KNXIPInterface():
             local_ip=local_ip,
             gateway_ip=gateway_ip,
             gateway_port=gateway_port,
-            telegram_received_callback=self.telegram_received)
+            telegram_received_callback=self.telegram_received,
+            connection_lost_callback=self.connection_lost)
         await self.interface.start()
 
     async def start_routing(self, local_ip):
@@ -108,11 +172,32 @@ class KNXIPInterface():
         self.interface = Routing(
             self.xknx,
             self.telegram_received,
-            local_ip)
+            local_ip,
+            receive_batch_size=self.connection_config.receive_batch_size,
+            send_batching=self.connection_config.send_batching)
+        await self.interface.start()
+
+    async def start_failover(self, endpoints):
+        """Start failover between several KNX/IP devices."""
+        from .failover import FailoverInterface
+        self.xknx.logger.debug("Starting failover between %s endpoints", len(endpoints or []))
+        self.interface = FailoverInterface(
+            self.xknx,
+            endpoints,
+            telegram_received_callback=self.telegram_received,
+            connection_lost_callback=self.connection_lost)
         await self.interface.start()
 
     async def stop(self):
         """Stop connected interfae (either Tunneling or Routing)."""
+        self.state = InterfaceState.STOPPED
+        if self.reconnect_task is not None:
+            self.reconnect_task.cancel()
+            try:
+                await self.reconnect_task
+            except asyncio.CancelledError:
+                pass
+            self.reconnect_task = None
         if self.interface is not None:
             await self.interface.stop()
             self.interface = None
@@ -123,5 +208,65 @@ class KNXIPInterface():
             self.xknx.telegrams.put(telegram))
 
     async def send_telegram(self, telegram):
-        """Send telegram to connected device (either Tunneling or Routing)."""
-        await self.interface.send_telegram(telegram)
+        """
+        Send telegram to connected device (either Tunneling or Routing).
+
+        While the connection is lost, the telegram is buffered and sent after reconnecting.
+        """
+        if self.state != InterfaceState.CONNECTED:
+            self.buffer.put(telegram)
+            return
+        try:
+            await self.interface.send_telegram(telegram)
+        except XKNXException as ex:
+            self.xknx.logger.warning("Could not send telegram, buffering it until reconnected: %s", ex)
+            self.buffer.put(telegram)
+            self.connection_lost()
+
+    def connection_lost(self):
+        """Start reconnecting in background. Callback if the connection to the KNX/IP device was lost."""
+        if self.state != InterfaceState.CONNECTED:
+            return
+        self.state = InterfaceState.DISCONNECTED
+        self.reconnect_task = self.xknx.loop.create_task(self.reconnect())
+
+    def backoff(self, attempt):
+        """Return delay before reconnect attempt: first attempt immediately, then jittered exponential backoff."""
+        if attempt == 0:
+            return 0
+        return random.uniform(0, min(
+            self.connection_config.backoff_max_in_seconds,
+            self.connection_config.backoff_initial_in_seconds * 2 ** (attempt - 1)))
+
+    async def reconnect(self):
+        """Reconnect until successful, then send buffered telegrams."""
+        attempt = 0
+        while self.state == InterfaceState.DISCONNECTED:
+            await asyncio.sleep(self.backoff(attempt))
+            attempt += 1
+            self.xknx.metrics.inc(Metrics.RECONNECT_ATTEMPTS)
+            try:
+                await self.interface.reconnect()
+            except XKNXException as ex:
+                self.xknx.logger.warning("Reconnect attempt %s failed: %s", attempt, ex)
+                continue
+            self.xknx.logger.info("Reconnected after %s attempts", attempt)
+            self.state = InterfaceState.DRAINING
+            await self.drain()
+
+    async def drain(self):
+        """Send buffered telegrams at the rate limit of the bus, then continue sending directly."""
+        while self.state == InterfaceState.DRAINING:
+            item = self.buffer.get()
+            if item is None:
+                self.state = InterfaceState.CONNECTED
+                break
+            telegram, timestamp = item
+            try:
+                await self.interface.send_telegram(telegram)
+            except XKNXException as ex:
+                self.xknx.logger.warning("Could not send buffered telegram: %s", ex)
+                self.buffer.put_front(telegram, timestamp)
+                self.state = InterfaceState.DISCONNECTED
+                break
+            await asyncio.sleep(self.xknx.bus_load.outbound_delay(telegram))
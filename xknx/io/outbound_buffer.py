@@ -0,0 +1,71 @@
+"""
+Module for buffering outgoing telegrams while the connection to the KNX/IP device is lost.
+
+* The buffer is bounded, if it is full the oldest telegram is dropped.
+* Telegrams older than ttl_in_seconds are dropped instead of being sent after reconnecting.
+* With coalesce enabled, a telegram replaces a buffered telegram of the same type to the
+  same group address, e.g. only the last brightness of a dimmer is sent after reconnecting.
+"""
+from collections import OrderedDict
+from itertools import count
+
+
+class OutboundBuffer():
+    """Class for buffering outgoing telegrams."""
+
+    def __init__(self, xknx, maxsize=1000, ttl_in_seconds=None, coalesce=False):
+        """Initialize OutboundBuffer class."""
+        self.xknx = xknx
+        self.maxsize = maxsize
+        self.ttl_in_seconds = ttl_in_seconds
+        self.coalesce = coalesce
+        self.dropped = 0
+        self._telegrams = OrderedDict()
+        self._counter = count()
+
+    def __len__(self):
+        """Return number of buffered telegrams."""
+        return len(self._telegrams)
+
+    def _key(self, telegram):
+        """Return key of telegram within buffer."""
+        if self.coalesce:
+            return telegram.group_address.raw, telegram.telegramtype
+        return next(self._counter)
+
+    def put(self, telegram, timestamp=None):
+        """Buffer telegram. Drops oldest telegram if buffer is full."""
+        if timestamp is None:
+            timestamp = self.xknx.loop.time()
+        key = self._key(telegram)
+        if key in self._telegrams:
+            del self._telegrams[key]
+        elif len(self._telegrams) >= self.maxsize:
+            self._telegrams.popitem(last=False)
+            self.dropped += 1
+        self._telegrams[key] = (telegram, timestamp)
+
+    def put_front(self, telegram, timestamp):
+        """Return telegram taken by get() to the front of the buffer, e.g. if sending failed."""
+        key = self._key(telegram)
+        if key in self._telegrams:
+            # A newer telegram was coalesced in the meantime
+            return
+        self._telegrams[key] = (telegram, timestamp)
+        self._telegrams.move_to_end(key, last=False)
+
+    def get(self, now=None):
+        """Return (telegram, timestamp) of oldest telegram not expired or None if buffer is empty."""
+        if now is None:
+            now = self.xknx.loop.time()
+        while self._telegrams:
+            _, (telegram, timestamp) = self._telegrams.popitem(last=False)
+            if self.ttl_in_seconds is not None and now - timestamp > self.ttl_in_seconds:
+                self.dropped += 1
+                continue
+            return telegram, timestamp
+        return None
+
+    def clear(self):
+        """Drop all buffered telegrams."""
+        self._telegrams.clear()
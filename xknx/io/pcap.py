@@ -0,0 +1,302 @@
+"""
+Import and export of KNX/IP traffic in pcap/pcapng format.
+
+* PcapReader reads pcap and pcapng files (e.g. captured by tcpdump) record by record
+  and yields the UDP payloads sent from or to the KNX/IP port. Files are never loaded into
+  memory as a whole, so captures of several gigabytes may be processed.
+* read_knxip_frames() decodes these payloads with KNXIPFrame.from_knx.
+* PcapWriter writes KNX/IP datagrams to a pcap file. It may be assigned to xknx.recorder for
+  capturing all traffic sent and received by XKNX.
+
+Supported link types are Ethernet (incl. VLAN tags), Linux cooked capture, BSD loopback and raw IP.
+"""
+import socket
+import struct
+import time
+from collections import namedtuple
+
+from xknx.exceptions import CouldNotParseKNXIP, XKNXException
+from xknx.knxip import KNXIPFrame
+
+from .const import DEFAULT_MCAST_PORT
+
+CapturedDatagram = namedtuple(
+    'CapturedDatagram', ['timestamp', 'src_addr', 'dst_addr', 'payload'])
+
+LINKTYPE_NULL = 0
+LINKTYPE_ETHERNET = 1
+LINKTYPE_RAW = 101
+LINKTYPE_LINUX_SLL = 113
+LINKTYPE_IPV4 = 228
+LINKTYPE_IPV6 = 229
+
+ETHERTYPE_IPV4 = 0x0800
+ETHERTYPE_IPV6 = 0x86DD
+ETHERTYPE_VLAN = (0x8100, 0x88A8)
+IP_PROTOCOL_UDP = 17
+
+PCAP_MAGIC_MICROSECONDS = 0xa1b2c3d4
+PCAP_MAGIC_NANOSECONDS = 0xa1b23c4d
+PCAPNG_SECTION_HEADER_BLOCK = 0x0A0D0D0A
+PCAPNG_BYTE_ORDER_MAGIC = 0x1A2B3C4D
+PCAPNG_INTERFACE_DESCRIPTION_BLOCK = 0x00000001
+PCAPNG_SIMPLE_PACKET_BLOCK = 0x00000003
+PCAPNG_ENHANCED_PACKET_BLOCK = 0x00000006
+PCAPNG_OPTION_IF_TSRESOL = 9
+
+
+class PcapReader:
+    """Class for streaming UDP datagrams of the KNX/IP port out of pcap and pcapng files."""
+
+    def __init__(self, filename, port=DEFAULT_MCAST_PORT):
+        """Initialize PcapReader class."""
+        self.filename = filename
+        self.port = port
+
+    def __iter__(self):
+        """Iterate over all KNX/IP datagrams within capture."""
+        with open(self.filename, 'rb') as filehandle:
+            magic = filehandle.read(4)
+            if len(magic) < 4:
+                raise XKNXException("Not a pcap file: {0}".format(self.filename))
+            if struct.unpack('<I', magic)[0] == PCAPNG_SECTION_HEADER_BLOCK:
+                packets = self._iter_pcapng(filehandle, magic)
+            else:
+                packets = self._iter_pcap(filehandle, magic)
+            for timestamp, linktype, data in packets:
+                datagram = self._extract_udp(linktype, data)
+                if datagram is None:
+                    continue
+                src_addr, dst_addr, payload = datagram
+                if src_addr[1] != self.port and dst_addr[1] != self.port:
+                    continue
+                yield CapturedDatagram(timestamp, src_addr, dst_addr, payload)
+
+    def _iter_pcap(self, filehandle, magic):
+        """Iterate over (timestamp, linktype, data) of packets within classic pcap file."""
+        for endian in ('<', '>'):
+            magic_number = struct.unpack(endian + 'I', magic)[0]
+            if magic_number in (PCAP_MAGIC_MICROSECONDS, PCAP_MAGIC_NANOSECONDS):
+                break
+        else:
+            raise XKNXException("Not a pcap file: {0}".format(self.filename))
+        resolution = 1e-9 if magic_number == PCAP_MAGIC_NANOSECONDS else 1e-6
+        header = filehandle.read(20)
+        if len(header) < 20:
+            raise XKNXException("Truncated pcap header: {0}".format(self.filename))
+        linktype = struct.unpack(endian + 'I', header[16:20])[0] & 0x0FFFFFFF
+        record_header = struct.Struct(endian + 'IIII')
+        while True:
+            raw_header = filehandle.read(record_header.size)
+            if len(raw_header) < record_header.size:
+                return
+            ts_sec, ts_fraction, caplen, _ = record_header.unpack(raw_header)
+            data = filehandle.read(caplen)
+            if len(data) < caplen:
+                return
+            yield ts_sec + ts_fraction * resolution, linktype, data
+
+    def _iter_pcapng(self, filehandle, first_bytes):
+        """Iterate over (timestamp, linktype, data) of packets within pcapng file."""
+        # pylint: disable=too-many-locals
+        endian = '<'
+        interfaces = []
+        pending = first_bytes
+        while True:
+            raw = pending + filehandle.read(8 - len(pending))
+            pending = b''
+            if len(raw) < 8:
+                return
+            block_type = struct.unpack(endian + 'I', raw[:4])[0]
+            if block_type == PCAPNG_SECTION_HEADER_BLOCK:
+                byte_order_magic = filehandle.read(4)
+                if len(byte_order_magic) < 4:
+                    return
+                endian = '<' \
+                    if struct.unpack('<I', byte_order_magic)[0] == PCAPNG_BYTE_ORDER_MAGIC \
+                    else '>'
+                block_length = struct.unpack(endian + 'I', raw[4:8])[0]
+                filehandle.read(block_length - 12)
+                interfaces = []
+                continue
+            block_length = struct.unpack(endian + 'I', raw[4:8])[0]
+            body = filehandle.read(block_length - 8)
+            if len(body) < block_length - 8:
+                return
+            if block_type == PCAPNG_INTERFACE_DESCRIPTION_BLOCK:
+                linktype = struct.unpack(endian + 'H', body[:2])[0]
+                interfaces.append(
+                    (linktype, self._pcapng_resolution(body[8:-4], endian)))
+            elif block_type == PCAPNG_ENHANCED_PACKET_BLOCK:
+                interface_id, ts_high, ts_low, caplen, _ = \
+                    struct.unpack(endian + 'IIIII', body[:20])
+                linktype, resolution = interfaces[interface_id]
+                yield ((ts_high << 32) + ts_low) * resolution, linktype, body[20:20 + caplen]
+            elif block_type == PCAPNG_SIMPLE_PACKET_BLOCK:
+                linktype, _ = interfaces[0]
+                original_length = struct.unpack(endian + 'I', body[:4])[0]
+                yield None, linktype, body[4:4 + min(original_length, len(body) - 8)]
+
+    @staticmethod
+    def _pcapng_resolution(options, endian):
+        """Return timestamp resolution in seconds from options of interface description block."""
+        pos = 0
+        while pos + 4 <= len(options):
+            code, length = struct.unpack(endian + 'HH', options[pos:pos + 4])
+            if code == 0:
+                break
+            if code == PCAPNG_OPTION_IF_TSRESOL and length >= 1:
+                tsresol = options[pos + 4]
+                if tsresol & 0x80:
+                    return 2 ** -(tsresol & 0x7F)
+                return 10 ** -tsresol
+            pos += 4 + length + (-length % 4)
+        return 1e-6
+
+    @staticmethod
+    def _extract_udp(linktype, data):
+        """Return (src_addr, dst_addr, payload) of UDP packet or None for other packets."""
+        # pylint: disable=too-many-return-statements,too-many-branches
+        if linktype == LINKTYPE_ETHERNET:
+            if len(data) < 14:
+                return None
+            ethertype = struct.unpack('!H', data[12:14])[0]
+            pos = 14
+            while ethertype in ETHERTYPE_VLAN and len(data) >= pos + 4:
+                ethertype = struct.unpack('!H', data[pos + 2:pos + 4])[0]
+                pos += 4
+        elif linktype == LINKTYPE_LINUX_SLL:
+            if len(data) < 16:
+                return None
+            ethertype = struct.unpack('!H', data[14:16])[0]
+            pos = 16
+        elif linktype == LINKTYPE_NULL:
+            if len(data) < 4:
+                return None
+            family = struct.unpack('<I', data[:4])[0]
+            if family > 0xFFFF:
+                family = struct.unpack('>I', data[:4])[0]
+            ethertype = ETHERTYPE_IPV4 if family == 2 else ETHERTYPE_IPV6
+            pos = 4
+        elif linktype in (LINKTYPE_RAW, LINKTYPE_IPV4, LINKTYPE_IPV6):
+            if not data:
+                return None
+            ethertype = ETHERTYPE_IPV4 if data[0] >> 4 == 4 else ETHERTYPE_IPV6
+            pos = 0
+        else:
+            return None
+
+        if ethertype == ETHERTYPE_IPV4:
+            if len(data) < pos + 20:
+                return None
+            header_length = (data[pos] & 0x0F) * 4
+            flags_fragment = struct.unpack('!H', data[pos + 6:pos + 8])[0]
+            if data[pos + 9] != IP_PROTOCOL_UDP or flags_fragment & 0x3FFF:
+                # Not UDP or fragmented
+                return None
+            src_ip = socket.inet_ntoa(data[pos + 12:pos + 16])
+            dst_ip = socket.inet_ntoa(data[pos + 16:pos + 20])
+            pos += header_length
+        elif ethertype == ETHERTYPE_IPV6:
+            if len(data) < pos + 40 or data[pos + 6] != IP_PROTOCOL_UDP:
+                return None
+            src_ip = socket.inet_ntop(socket.AF_INET6, data[pos + 8:pos + 24])
+            dst_ip = socket.inet_ntop(socket.AF_INET6, data[pos + 24:pos + 40])
+            pos += 40
+        else:
+            return None
+
+        if len(data) < pos + 8:
+            return None
+        src_port, dst_port, udp_length = struct.unpack('!HHH', data[pos:pos + 6])
+        payload = data[pos + 8:pos + udp_length]
+        return (src_ip, src_port), (dst_ip, dst_port), payload
+
+
+def read_knxip_frames(xknx, filename, port=DEFAULT_MCAST_PORT):
+    """Iterate over (CapturedDatagram, KNXIPFrame) tuples of capture. Datagrams which cannot be parsed are skipped."""
+    for datagram in PcapReader(filename, port):
+        knxipframe = KNXIPFrame(xknx)
+        try:
+            knxipframe.from_knx(datagram.payload)
+        except (CouldNotParseKNXIP, ValueError, TypeError, IndexError) as ex:
+            xknx.logger.warning("Could not parse KNX/IP frame %s -> %s: %s",
+                                datagram.src_addr, datagram.dst_addr, ex)
+            continue
+        yield datagram, knxipframe
+
+
+class PcapWriter:
+    """Class for writing KNX/IP datagrams to a pcap file with raw IPv4 link type."""
+
+    PCAP_HEADER = struct.Struct('<IHHiIII')
+    RECORD_HEADER = struct.Struct('<IIII')
+    IPV4_HEADER = struct.Struct('!BBHHHBBH4s4s')
+    UDP_HEADER = struct.Struct('!HHHH')
+
+    def __init__(self, xknx, filename):
+        """Initialize PcapWriter class and write pcap header."""
+        self.xknx = xknx
+        self.filename = filename
+        self.filehandle = open(filename, 'wb')
+        self.filehandle.write(self.PCAP_HEADER.pack(
+            PCAP_MAGIC_MICROSECONDS, 2, 4, 0, 0, 65535, LINKTYPE_RAW))
+        self.identification = 0
+
+    def write(self, payload, src_addr, dst_addr, timestamp=None):
+        """Write UDP datagram from src_addr to dst_addr ((ip, port) tuples) to capture."""
+        if timestamp is None:
+            timestamp = time.time()
+        udp_length = self.UDP_HEADER.size + len(payload)
+        total_length = self.IPV4_HEADER.size + udp_length
+        self.identification = (self.identification + 1) & 0xFFFF
+        ip_header = self.IPV4_HEADER.pack(
+            0x45, 0, total_length, self.identification, 0, 64, IP_PROTOCOL_UDP, 0,
+            socket.inet_aton(src_addr[0]), socket.inet_aton(dst_addr[0]))
+        ip_header = ip_header[:10] + struct.pack('!H', self._checksum(ip_header)) + ip_header[12:]
+        # UDP checksum 0: not calculated
+        udp_header = self.UDP_HEADER.pack(src_addr[1], dst_addr[1], udp_length, 0)
+        seconds = int(timestamp)
+        self.filehandle.write(self.RECORD_HEADER.pack(
+            seconds, int((timestamp - seconds) * 1e6), total_length, total_length))
+        self.filehandle.write(ip_header)
+        self.filehandle.write(udp_header)
+        self.filehandle.write(payload)
+
+    @staticmethod
+    def _checksum(header):
+        """Calculate IPv4 header checksum."""
+        total = sum(struct.unpack('!{0}H'.format(len(header) // 2), header))
+        while total > 0xFFFF:
+            total = (total & 0xFFFF) + (total >> 16)
+        return ~total & 0xFFFF
+
+    @staticmethod
+    def _addresses(udp_client):
+        """Return (local_addr, remote_addr) of udp_client."""
+        local_addr = udp_client.local_addr
+        if udp_client.transport is not None:
+            sockname = udp_client.getsockname()
+            if sockname:
+                local_addr = sockname[:2]
+        return local_addr, udp_client.remote_addr
+
+    def record_received(self, raw, udp_client=None):
+        """Write datagram received by udp_client to capture. Callback for xknx.recorder."""
+        local_addr, remote_addr = self._addresses(udp_client) \
+            if udp_client is not None else (('0.0.0.0', 0), ('0.0.0.0', DEFAULT_MCAST_PORT))
+        self.write(raw, remote_addr, local_addr)
+
+    def record_sent(self, raw, udp_client=None):
+        """Write datagram sent by udp_client to capture. Callback for xknx.recorder."""
+        local_addr, remote_addr = self._addresses(udp_client) \
+            if udp_client is not None else (('0.0.0.0', 0), ('0.0.0.0', DEFAULT_MCAST_PORT))
+        self.write(raw, local_addr, remote_addr)
+
+    def flush(self):
+        """Write buffered records to disk."""
+        self.filehandle.flush()
+
+    def close(self):
+        """Close capture."""
+        self.filehandle.close()
@@ -0,0 +1,177 @@
+"""
+Recording and replaying of raw KNX/IP datagrams.
+
+* Recorder appends all datagrams received and sent by the UDPClients of XKNX
+  to a compact binary log. It is activated by assigning it to xknx.recorder.
+* Replay reads such a log via mmap and yields the recorded frames.
+* ReplayInterface is a stand-in for KNXIPInterface which feeds the received frames
+  of a log into XKNX - in original speed, scaled speed or as fast as possible.
+
+Format of the log: an 8 byte magic followed by records of
+
+* timestamp (float64, seconds of time.monotonic()),
+* direction (uint8, value of TelegramDirection),
+* length (uint16) and
+* the raw datagram.
+
+All values are little endian.
+"""
+import asyncio
+import mmap
+import os
+import struct
+import time
+from collections import namedtuple
+
+from xknx.exceptions import XKNXException
+from xknx.knx import TelegramDirection
+from xknx.knxip import KNXIPServiceType
+
+from .udp_client import UDPClient
+
+RecordedFrame = namedtuple('RecordedFrame', ['timestamp', 'direction', 'raw'])
+
+
+class Recorder:
+    """Class for appending KNX/IP datagrams to a binary log."""
+
+    MAGIC = b'XKNXREC1'
+    RECORD_HEADER = struct.Struct('<dBH')
+
+    def __init__(self, xknx, filename):
+        """Initialize Recorder class. Open log for appending."""
+        self.xknx = xknx
+        self.filename = filename
+        self.filehandle = open(filename, 'ab')
+        if self.filehandle.tell() == 0:
+            self.filehandle.write(self.MAGIC)
+        self.xknx.logger.debug("Recording KNX/IP frames to %s", filename)
+
+    def record(self, raw, direction):
+        """Append datagram to log."""
+        self.filehandle.write(self.RECORD_HEADER.pack(
+            time.monotonic(), direction.value, len(raw)))
+        self.filehandle.write(raw)
+
+    def record_received(self, raw, udp_client=None):
+        """Append received datagram to log."""
+        # pylint: disable=unused-argument
+        self.record(raw, TelegramDirection.INCOMING)
+
+    def record_sent(self, raw, udp_client=None):
+        """Append sent datagram to log."""
+        # pylint: disable=unused-argument
+        self.record(raw, TelegramDirection.OUTGOING)
+
+    def flush(self):
+        """Write buffered records to disk."""
+        self.filehandle.flush()
+
+    def close(self):
+        """Close log."""
+        self.filehandle.close()
+
+
+class Replay:
+    """Class for reading a binary log written by Recorder."""
+
+    def __init__(self, filename):
+        """Initialize Replay class."""
+        self.filename = filename
+
+    def __iter__(self):
+        """Iterate over all recorded frames of log."""
+        with open(self.filename, 'rb') as filehandle:
+            if os.fstat(filehandle.fileno()).st_size < len(Recorder.MAGIC):
+                raise XKNXException("Not a xknx recording: {0}".format(self.filename))
+            with mmap.mmap(filehandle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if mapped[:len(Recorder.MAGIC)] != Recorder.MAGIC:
+                    raise XKNXException("Not a xknx recording: {0}".format(self.filename))
+                yield from self._iter_records(mapped)
+
+    @staticmethod
+    def _iter_records(mapped):
+        """Iterate over records within mapped log."""
+        pos = len(Recorder.MAGIC)
+        header_size = Recorder.RECORD_HEADER.size
+        end = len(mapped)
+        while pos + header_size <= end:
+            timestamp, direction, length = Recorder.RECORD_HEADER.unpack_from(mapped, pos)
+            pos += header_size
+            if pos + length > end:
+                # Truncated record, e.g. recorder was not closed properly
+                break
+            yield RecordedFrame(timestamp, TelegramDirection(direction), mapped[pos:pos + length])
+            pos += length
+
+
+class ReplayInterface:
+    """Stand-in for KNXIPInterface, feeding received frames of a log into XKNX."""
+
+    def __init__(self, xknx, filename, speed=1.0):
+        """
+        Initialize ReplayInterface class.
+
+        speed: 1.0 for original speed, 2.0 for twice as fast, None for as fast as possible.
+        """
+        self.xknx = xknx
+        self.replay = Replay(filename)
+        self.speed = speed
+        self.udp_client = UDPClient(self.xknx, ('127.0.0.1', 0), ('127.0.0.1', 0))
+        self.udp_client.register_callback(
+            self.frame_received,
+            [KNXIPServiceType.ROUTING_INDICATION, KNXIPServiceType.TUNNELLING_REQUEST])
+        self.received_telegrams = []
+        self.frames_replayed = 0
+        self.telegrams_sent = 0
+        self.replay_task = None
+
+    def frame_received(self, knxipframe, _):
+        """Extract telegram from frame. Callback from udp_client."""
+        if knxipframe.header.service_type_ident == KNXIPServiceType.TUNNELLING_REQUEST:
+            telegram = knxipframe.body.cemi.telegram
+        else:
+            telegram = knxipframe.body.telegram
+        telegram.direction = TelegramDirection.INCOMING
+        self.received_telegrams.append(telegram)
+
+    async def start(self):
+        """Start replaying log within separate task."""
+        self.replay_task = self.xknx.loop.create_task(self.run())
+
+    async def run(self):
+        """Replay received frames of log."""
+        start_time = self.xknx.loop.time()
+        first_timestamp = None
+        for frame in self.replay:
+            if frame.direction != TelegramDirection.INCOMING:
+                continue
+            if first_timestamp is None:
+                first_timestamp = frame.timestamp
+            if self.speed:
+                delay = start_time + (frame.timestamp - first_timestamp) / self.speed \
+                    - self.xknx.loop.time()
+                await asyncio.sleep(max(delay, 0))
+            else:
+                await asyncio.sleep(0)
+            self.udp_client.data_received_callback(frame.raw)
+            self.frames_replayed += 1
+            for telegram in self.received_telegrams:
+                await self.xknx.telegrams.put(telegram)
+            self.received_telegrams = []
+
+    async def join(self):
+        """Wait until all frames were replayed."""
+        if self.replay_task is not None:
+            await self.replay_task
+
+    async def stop(self):
+        """Stop replaying."""
+        if self.replay_task is not None:
+            self.replay_task.cancel()
+            self.replay_task = None
+
+    async def send_telegram(self, telegram):
+        """Count telegram sent by XKNX. Telegrams are not sent anywhere."""
+        # pylint: disable=unused-argument
+        self.telegrams_sent += 1
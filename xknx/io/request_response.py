@@ -2,12 +2,27 @@
 Base class for sending a specific type of KNX/IP Packet to a KNX/IP device and wait for the corresponding answer.
 
 Will report if the corresponding answer was not received.
-"""
-import asyncio
 
+The request waits within xknx.pending_operations, keyed by response_key(). UDPClient passes
+received frames with matching key directly to the waiting request.
+"""
 from xknx.knxip import ErrorCode
 
 
+def response_key(udp_client, service_type, communication_channel_id=None, sequence_counter=None):
+    """Return key of pending operation awaiting KNX/IP response."""
+    return (udp_client, service_type, communication_channel_id, sequence_counter)
+
+
+def knxipframe_response_key(udp_client, knxipframe):
+    """Return key of pending operation the received KNX/IP frame is the response to."""
+    return response_key(
+        udp_client,
+        knxipframe.header.service_type_ident,
+        getattr(knxipframe.body, 'communication_channel_id', None),
+        getattr(knxipframe.body, 'sequence_counter', None))
+
+
 class RequestResponse():
     """Class for ending a specific type of KNX/IP Packet to a KNX/IP and wait for the corresponding answer."""
 
@@ -18,25 +33,32 @@ class RequestResponse():
         self.xknx = xknx
         self.udpclient = udp_client
         self.awaited_response_class = awaited_response_class
-        self.response_received_or_timeout = asyncio.Event()
         self.success = False
         self.timeout_in_seconds = timeout_in_seconds
-        self.timeout_callback = None
-        self.timeout_handle = None
 
     def create_knxipframe(self):
         """Create KNX/IP Frame object to be sent to device."""
         raise NotImplementedError('create_knxipframe has to be implemented')
 
+    def response_key(self):
+        """Return key of awaited response, including communication channel and sequence counter of request if known."""
+        return response_key(
+            self.udpclient,
+            self.awaited_response_class.service_type,
+            getattr(self, 'communication_channel_id', None),
+            getattr(self, 'sequence_counter', None))
+
     async def start(self):
         """Start. Sending and waiting for answer."""
-        callb = self.udpclient.register_callback(
-            self.response_rec_callback, [self.awaited_response_class.service_type])
-        await self.send_request()
-        await self.start_timeout()
-        await self.response_received_or_timeout.wait()
-        await self.stop_timeout()
-        self.udpclient.unregister_callback(callb)
+        key = self.response_key()
+        future = self.xknx.pending_operations.add(key, self.timeout_in_seconds)
+        try:
+            await self.send_request()
+            knxipframe = await future
+        finally:
+            self.xknx.pending_operations.cancel(key, future)
+        if knxipframe is not None:
+            self.response_rec_callback(knxipframe, self.udpclient)
 
     async def send_request(self):
         """Build knxipframe (within derived class) and send via UDP."""
@@ -49,7 +71,6 @@ class RequestResponse():
         if not isinstance(knxipframe.body, self.awaited_response_class):
             self.xknx.logger.warning("Cant understand knxipframe")
             return
-        self.response_received_or_timeout.set()
         if knxipframe.body.status_code == ErrorCode.E_NO_ERROR:
             self.success = True
             self.on_success_hook(knxipframe)
@@ -63,16 +84,3 @@ class RequestResponse():
     def on_error_hook(self, knxipframe):
         """Do somthing after not having received valid answer within given time. May be overwritten in derived class."""
         self.xknx.logger.warning("Error: reading rading group address from KNX bus failed: %s", knxipframe.body.status_code)
-
-    def timeout(self):
-        """Handle timeout for not having received expected knxipframe."""
-        self.response_received_or_timeout.set()
-
-    async def start_timeout(self):
-        """Start timeout."""
-        self.timeout_handle = self.xknx.loop.call_later(
-            self.timeout_in_seconds, self.timeout)
-
-    async def stop_timeout(self):
-        """Stop timeout."""
-        self.timeout_handle.cancel()
@@ -13,17 +13,27 @@ from .udp_client import UDPClient
 class Routing():
     """Class for handling KNX/IP routing."""
 
-    def __init__(self, xknx, telegram_received_callback, local_ip):
+    def __init__(self, xknx, telegram_received_callback, local_ip, receive_batch_size=None, send_batching=False):
         """Initialize Routing class."""
+        # pylint: disable=too-many-arguments
         self.xknx = xknx
         self.telegram_received_callback = telegram_received_callback
         self.local_ip = local_ip
+        self.receive_batch_size = receive_batch_size
+        self.send_batching = send_batching
 
+        self.udpclient = None
+        self.init_udp_client()
+
+    def init_udp_client(self):
+        """Initialize udpclient."""
         self.udpclient = UDPClient(self.xknx,
-                                   (local_ip, 0),
+                                   (self.local_ip, 0),
                                    (DEFAULT_MCAST_GRP, DEFAULT_MCAST_PORT),
                                    multicast=True,
-                                   bind_to_multicast_addr=True)
+                                   bind_to_multicast_addr=True,
+                                   receive_batch_size=self.receive_batch_size,
+                                   send_batching=self.send_batching)
 
         self.udpclient.register_callback(
             self.response_rec_callback,
@@ -68,3 +78,9 @@ class Routing():
     async def stop(self):
         """Stop routing."""
         await self.udpclient.stop()
+
+    async def reconnect(self):
+        """Recreate multicast socket."""
+        await self.udpclient.stop()
+        self.init_udp_client()
+        await self.start()
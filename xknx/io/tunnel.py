@@ -3,8 +3,6 @@ Abstraction for handling KNX/IP tunnels.
 
 Tunnels connect to KNX/IP devices directly via UDP and build a static UDP connection.
 """
-import asyncio
-
 from xknx.exceptions import XKNXException
 from xknx.knx import TelegramDirection
 from xknx.knxip import KNXIPFrame, KNXIPServiceType, TunnellingRequest
@@ -21,7 +19,8 @@ class Tunnel():
 
     # pylint: disable=too-many-instance-attributes
 
-    def __init__(self, xknx, src_address, local_ip, gateway_ip, gateway_port, telegram_received_callback=None):
+    def __init__(self, xknx, src_address, local_ip, gateway_ip, gateway_port, telegram_received_callback=None,
+                 connection_lost_callback=None, heartbeat_changed_callback=None):
         """Initialize Tunnel class."""
         # pylint: disable=too-many-arguments
         self.xknx = xknx
@@ -30,13 +29,14 @@ class Tunnel():
         self.gateway_ip = gateway_ip
         self.gateway_port = gateway_port
         self.telegram_received_callback = telegram_received_callback
+        self.connection_lost_callback = connection_lost_callback
+        self.heartbeat_changed_callback = heartbeat_changed_callback
 
         self.udp_client = None
         self.init_udp_client()
 
         self.sequence_number = 0
         self.communication_channel = None
-        self.number_heartbeat_failed = 0
 
     def init_udp_client(self):
         """Initialize udp_client."""
@@ -55,6 +55,7 @@ class Tunnel():
             self.xknx.logger.warning("Service not implemented: %s", knxipframe)
         else:
             self.send_ack(knxipframe.body.communication_channel_id, knxipframe.body.sequence_counter)
+            self.xknx.heartbeat_manager.alive(self)
             telegram = knxipframe.body.cemi.telegram
             telegram.direction = TelegramDirection.INCOMING
             if self.telegram_received_callback is not None:
@@ -108,17 +109,15 @@ class Tunnel():
         shall repeat the TUNNELLING_REQUEST frame once and then terminate the
         connection by sending a DISCONNECT_REQUEST frame to the other device’s
         control endpoint.
+
+        Reconnecting is left to the caller (KNXIPInterface), which buffers telegrams meanwhile.
         """
         success = await self._send_telegram_impl(telegram)
         if not success:
             self.xknx.logger.warning("Sending of telegram failed. Retrying a second time.")
             success = await self._send_telegram_impl(telegram)
             if not success:
-                self.xknx.logger.warning("Resending telegram failed. Reconnecting to tunnel.")
-                await self.reconnect()
-                success = await self._send_telegram_impl(telegram)
-                if not success:
-                    raise XKNXException("Could not send telegram to tunnel")
+                raise XKNXException("Could not send telegram to tunnel")
         self.increase_sequence_number()
 
     async def _send_telegram_impl(self, telegram):
@@ -131,6 +130,8 @@ class Tunnel():
             self.sequence_number,
             self.communication_channel)
         await tunnelling.start()
+        if tunnelling.success:
+            self.xknx.heartbeat_manager.alive(self)
         return tunnelling.success
 
     def increase_sequence_number(self):
@@ -163,41 +164,31 @@ class Tunnel():
     async def reconnect(self):
         """Reconnect to tunnel device."""
         await self.disconnect(True)
+        await self.udp_client.stop()
         self.init_udp_client()
         await self.start()
 
+    async def connection_lost(self):
+        """Handle lost connection, detected by heartbeat. Reconnects if no connection_lost_callback is set."""
+        if self.connection_lost_callback is not None:
+            self.connection_lost_callback()
+        else:
+            await self.reconnect()
+
+    def heartbeat_changed(self, healthy):
+        """Handle first failed probe of heartbeat (healthy=False) and first successful probe afterwards (healthy=True)."""
+        if self.heartbeat_changed_callback is not None:
+            self.heartbeat_changed_callback(healthy)
+
     async def stop(self):
         """Stop tunneling."""
-        await self.disconnect()
-        await self.udp_client.stop()
+        await self.xknx.heartbeat_manager.unregister(self)
+        try:
+            if self.communication_channel is not None:
+                await self.disconnect()
+        finally:
+            await self.udp_client.stop()
 
     async def start_heartbeat(self):
         """Start heartbeat for monitoring state of tunnel, as suggested by 03.08.02 KNX Core 5.4."""
-        self.xknx.loop.create_task(
-            self.do_heartbeat())
-
-    async def do_heartbeat(self):
-        """Heartbeat: Worker 'thread', endless loop for sending heartbeat requests."""
-        while True:
-            await asyncio.sleep(15)
-            await self.do_heartbeat_impl()
-
-    async def do_heartbeat_impl(self):
-        """Heartbeat: checking connection state and handling result."""
-        connectionsstate = await self.connectionstate()
-        if connectionsstate:
-            await self.do_heartbeat_success()
-        else:
-            await self.do_heartbeat_failed()
-
-    async def do_heartbeat_success(self):
-        """Heartbeat: handling success."""
-        self.number_heartbeat_failed = 0
-
-    async def do_heartbeat_failed(self):
-        """Heartbeat: handling error."""
-        self.number_heartbeat_failed = self.number_heartbeat_failed + 1
-        if self.number_heartbeat_failed > 3:
-            self.xknx.logger.warning("Heartbeat failed - reconnecting")
-            await self.reconnect()
-            self.number_heartbeat_failed = 0
+        self.xknx.heartbeat_manager.register(self)
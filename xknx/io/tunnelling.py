@@ -1,4 +1,5 @@
 """Abstraction to send a TunnelingRequest and wait for TunnelingResponse."""
+from xknx.core import Metrics
 from xknx.knxip import KNXIPFrame, KNXIPServiceType, TunnellingAck
 
 from .request_response import RequestResponse
@@ -19,6 +20,7 @@ class Tunnelling(RequestResponse):
         self.telegram = telegram
         self.sequence_counter = sequence_counter
         self.communication_channel_id = communication_channel_id
+        self.request_sent_time = None
 
     def create_knxipframe(self):
         """Create KNX/IP Frame object to be sent to device."""
@@ -29,3 +31,15 @@ class Tunnelling(RequestResponse):
         knxipframe.body.cemi.src_addr = self.src_address
         knxipframe.body.sequence_counter = self.sequence_counter
         return knxipframe
+
+    async def send_request(self):
+        """Send TunnelingRequest and remember time for measuring round trip time."""
+        self.request_sent_time = self.xknx.loop.time()
+        await super(Tunnelling, self).send_request()
+
+    def on_success_hook(self, knxipframe):
+        """Record round trip time of TunnelingAck."""
+        self.xknx.metrics.observe(
+            Metrics.TUNNEL_ACK_RTT,
+            self.xknx.loop.time() - self.request_sent_time)
+        super(Tunnelling, self).on_success_hook(knxipframe)
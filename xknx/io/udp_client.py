@@ -3,13 +3,27 @@ UDPClient is an abstraction for handling the complete UDP io.
 
 The module is build upon asyncio udp functions.
 Due to lame support of UDP multicast within asyncio some special treatment for multicast is necessary.
+
+With receive_batch_size set, the socket is not wrapped by an asyncio datagram transport but
+registered via loop.add_reader(). Each wakeup drains up to receive_batch_size datagrams with
+non-blocking recvfrom() calls and passes them to data_received_batch() at once, saving one
+selector round trip per datagram on busy multicast segments. Event loops without add_reader()
+(e.g. ProactorEventLoop) fall back to the datagram transport.
+
+With send_batching enabled, send() serializes the frame but only queues it. All frames queued
+within one iteration of the event loop are flushed together by flush(), keeping their order.
+Rate limiting is not affected, as pacing of telegrams happens before send() is called.
+Without send_batching every frame is sent immediately, which keeps latency of single frames low.
 """
 import asyncio
 import socket
 
+from xknx.core import Metrics
 from xknx.exceptions import CouldNotParseKNXIP, XKNXException
 from xknx.knxip import KNXIPFrame
 
+from .request_response import knxipframe_response_key
+
 
 class UDPClient:
     """Class for handling (sending and receiving) UDP packets."""
@@ -62,7 +76,85 @@ class UDPClient:
             """Log error. Callback for connection lost."""
             self.xknx.logger.info('closing transport %s', exc)
 
-    def __init__(self, xknx, local_addr, remote_addr, multicast=False, bind_to_multicast_addr=False):
+    class BatchTransport:
+        """Minimal datagram transport reading several datagrams per wakeup of the event loop."""
+
+        # Maximum size of a KNX/IP frame is limited by the 16 bit total length of its header
+        MAX_DATAGRAM_SIZE = 0xffff
+
+        def __init__(self, xknx, sock, batch_size, data_received_batch_callback):
+            """Initialize BatchTransport class."""
+            self.xknx = xknx
+            self.sock = sock
+            self.batch_size = batch_size
+            self.data_received_batch_callback = data_received_batch_callback
+
+        def start(self):
+            """Register socket at event loop. Raises NotImplementedError if loop does not support add_reader()."""
+            self.xknx.loop.add_reader(self.sock.fileno(), self.read_ready)
+
+        def read_ready(self):
+            """Drain up to batch_size datagrams from socket. Callback from event loop."""
+            raws = []
+            recvfrom = self.sock.recvfrom
+            for _ in range(self.batch_size):
+                try:
+                    raw, _ = recvfrom(self.MAX_DATAGRAM_SIZE)
+                except (BlockingIOError, InterruptedError):
+                    break
+                except OSError as exc:
+                    self.xknx.logger.warning('Error received: %s', exc)
+                    break
+                raws.append(raw)
+            if raws:
+                self.data_received_batch_callback(raws)
+
+        def sendto(self, data, addr=None):
+            """Send datagram. Datagrams are dropped if the socket buffer is full, as UDP does not guarantee delivery."""
+            try:
+                if addr is None:
+                    self.sock.send(data)
+                else:
+                    self.sock.sendto(data, addr)
+            except (BlockingIOError, InterruptedError):
+                self.xknx.logger.warning('Socket buffer full, dropping datagram')
+            except OSError as exc:
+                self.xknx.logger.warning('Error sending datagram: %s', exc)
+
+        def sendmany(self, datagrams, addr=None):
+            """Send several datagrams in order. Remaining datagrams are dropped if the socket buffer is full."""
+            sock = self.sock
+            send = sock.send if addr is None else lambda data: sock.sendto(data, addr)
+            for index, data in enumerate(datagrams):
+                try:
+                    send(data)
+                except (BlockingIOError, InterruptedError):
+                    self.xknx.logger.warning('Socket buffer full, dropping %d datagrams', len(datagrams) - index)
+                    return
+                except OSError as exc:
+                    self.xknx.logger.warning('Error sending datagram: %s', exc)
+
+        def get_extra_info(self, name, default=None):
+            """Return socket information like asyncio transports."""
+            if name == 'socket':
+                return self.sock
+            if name == 'sockname':
+                return self.sock.getsockname()
+            if name == 'peername':
+                try:
+                    return self.sock.getpeername()
+                except OSError:
+                    return default
+            return default
+
+        def close(self):
+            """Unregister and close socket."""
+            if self.sock.fileno() != -1:
+                self.xknx.loop.remove_reader(self.sock.fileno())
+            self.sock.close()
+
+    def __init__(self, xknx, local_addr, remote_addr, multicast=False, bind_to_multicast_addr=False,
+                 receive_batch_size=None, send_batching=False):
         """Initialize UDPClient class."""
         # pylint: disable=too-many-arguments
         if not isinstance(local_addr, tuple):
@@ -74,22 +166,40 @@ class UDPClient:
         self.remote_addr = remote_addr
         self.multicast = multicast
         self.bind_to_multicast_addr = bind_to_multicast_addr
+        self.receive_batch_size = receive_batch_size
+        self.send_batching = send_batching
         self.transport = None
         self.callbacks = []
+        self._outbound = []
+        self._flush_handle = None
 
     def data_received_callback(self, raw):
         """Parse and process KNXIP frame. Callback for having received an UDP packet."""
         if raw:
+            if self.xknx.recorder is not None:
+                self.xknx.recorder.record_received(raw, self)
             try:
                 knxipframe = KNXIPFrame(self.xknx)
                 knxipframe.from_knx(raw)
                 self.xknx.knx_logger.debug("Received: %s", knxipframe)
+                self.xknx.metrics.inc(
+                    Metrics.FRAMES_RECEIVED,
+                    {'service_type': knxipframe.header.service_type_ident.name.lower()})
                 self.handle_knxipframe(knxipframe)
             except CouldNotParseKNXIP as couldnotparseknxip:
+                self.xknx.metrics.inc(Metrics.PARSE_ERRORS)
                 self.xknx.logger.exception(couldnotparseknxip)
 
+    def data_received_batch(self, raws):
+        """Parse and process several KNXIP frames. Callback for having received a batch of UDP packets."""
+        data_received_callback = self.data_received_callback
+        for raw in raws:
+            data_received_callback(raw)
+
     def handle_knxipframe(self, knxipframe):
-        """Handle KNXIP Frame and call all callbacks which watch for the service type ident."""
+        """Pass KNXIP Frame to request awaiting it or call all callbacks which watch for the service type ident."""
+        if self.xknx.pending_operations.resolve(knxipframe_response_key(self, knxipframe), knxipframe):
+            return
         handled = False
         for callback in self.callbacks:
             if callback.has_service(knxipframe.header.service_type_ident):
@@ -147,8 +257,39 @@ class UDPClient:
         sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 0)
         return sock
 
+    def create_unicast_sock(self):
+        """Create non-blocking UDP socket bound to local_addr and connected to remote_addr."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            sock.setblocking(False)
+            sock.bind(self.local_addr)
+            sock.connect(self.remote_addr)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def connect_batch_transport(self):
+        """Connect socket via BatchTransport. Returns False if the event loop does not support it."""
+        if self.multicast:
+            sock = UDPClient.create_multicast_sock(self.local_addr[0], self.remote_addr, self.bind_to_multicast_addr)
+        else:
+            sock = self.create_unicast_sock()
+        transport = UDPClient.BatchTransport(
+            self.xknx, sock, self.receive_batch_size, self.data_received_batch)
+        try:
+            transport.start()
+        except NotImplementedError:
+            sock.close()
+            return False
+        self.transport = transport
+        return True
+
     async def connect(self):
         """Connect UDP socket. Open UDP port and build mulitcast socket if necessary."""
+        if self.receive_batch_size and self.connect_batch_transport():
+            return
+
         udp_client_factory = UDPClient.UDPClientFactory(
             self.xknx, self.local_addr[0], multicast=self.multicast,
             data_received_callback=self.data_received_callback)
@@ -171,11 +312,40 @@ class UDPClient:
         self.xknx.knx_logger.debug("Sending: %s", knxipframe)
         if self.transport is None:
             raise XKNXException("Transport not connected")
+        self.xknx.metrics.inc(
+            Metrics.FRAMES_SENT,
+            {'service_type': knxipframe.header.service_type_ident.name.lower()})
 
-        if self.multicast:
-            self.transport.sendto(bytes(knxipframe.to_knx()), self.remote_addr)
+        raw = bytes(knxipframe.to_knx())
+        if self.xknx.recorder is not None:
+            self.xknx.recorder.record_sent(raw, self)
+        if self.send_batching:
+            self._outbound.append(raw)
+            if self._flush_handle is None:
+                self._flush_handle = self.xknx.loop.call_soon(self.flush)
+        elif self.multicast:
+            self.transport.sendto(raw, self.remote_addr)
         else:
-            self.transport.sendto(bytes(knxipframe.to_knx()))
+            self.transport.sendto(raw)
+
+    def flush(self):
+        """Send all queued frames. Called once per iteration of the event loop if send_batching is enabled."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        raws, self._outbound = self._outbound, []
+        if not raws:
+            return
+        if self.transport is None:
+            self.xknx.logger.warning('Transport not connected, dropping %d frames', len(raws))
+            return
+        addr = self.remote_addr if self.multicast else None
+        if isinstance(self.transport, UDPClient.BatchTransport):
+            self.transport.sendmany(raws, addr)
+            return
+        sendto = self.transport.sendto
+        for raw in raws:
+            sendto(raw, addr)
 
     def getsockname(self):
         """Return sockname."""
@@ -188,5 +358,7 @@ class UDPClient:
         return peer
 
     async def stop(self):
-        """Stop UDP socket."""
-        self.transport.close()
+        """Stop UDP socket. Frames queued for flushing are sent before."""
+        self.flush()
+        if self.transport is not None:
+            self.transport.close()
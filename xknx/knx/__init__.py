@@ -9,7 +9,7 @@ Module for handling KNX primitves.
 # flake8: noqa
 from .address import GroupAddress, GroupAddressType, PhysicalAddress
 from .address_filter import AddressFilter
-from .telegram import Telegram, TelegramDirection, TelegramType
+from .telegram import Telegram, TelegramDirection, TelegramPriority, TelegramType
 from .dpt import DPTBase, DPTBinary, DPTArray, DPTComparator, DPTWeekday
 from .dpt_float import DPT2ByteFloat, DPT4ByteFloat, DPTLux, DPTTemperature, \
     DPTHumidity, DPTWsp, DPTElectricPotential, DPTElectricCurrent, DPTPower, \
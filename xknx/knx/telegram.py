@@ -11,7 +11,8 @@ It contains
 * the telegram type (e.g. GROUP_WRITE)
 * the direction (incoming or outgoing)
 * the group address (e.g. 1/2/3)
-* and the payload (e.g. "12%" or "23.23 C".
+* the payload (e.g. "12%" or "23.23 C")
+* and the priority (e.g. ALARM).
 
 """
 from enum import Enum
@@ -34,6 +35,21 @@ class TelegramType(Enum):
     GROUP_RESPONSE = 3
 
 
+class TelegramPriority(Enum):
+    """
+    Enum class for the priority of a telegram.
+
+    The members are the four priorities of the KNX bus: system, urgent (ALARM),
+    normal and low. Group communication is sent with priority low by default.
+    Outgoing telegrams of higher priority, e.g. alarms, are sent first.
+    """
+
+    SYSTEM = 0
+    ALARM = 1
+    NORMAL = 2
+    LOW = 3
+
+
 class Telegram:
     """Class for KNX telegrams."""
 
@@ -42,12 +58,15 @@ class Telegram:
     def __init__(self, group_address=GroupAddress(None),
                  telegramtype=TelegramType.GROUP_WRITE,
                  direction=TelegramDirection.OUTGOING,
-                 payload=None):
+                 payload=None,
+                 priority=TelegramPriority.LOW):
         """Initialize Telegram class."""
+        # pylint: disable=too-many-arguments
         self.direction = direction
         self.telegramtype = telegramtype
         self.group_address = group_address
         self.payload = payload
+        self.priority = priority
 
     def __str__(self):
         """Return object as readable string."""
@@ -13,7 +13,7 @@ Documentation within:
 """
 from xknx.exceptions import ConversionError, CouldNotParseKNXIP
 from xknx.knx import (DPTArray, DPTBinary, GroupAddress, PhysicalAddress,
-                      Telegram, TelegramType)
+                      Telegram, TelegramPriority, TelegramType)
 
 from .body import KNXIPBody
 from .knxip_enum import APCICommand, CEMIFlags, CEMIMessageCode
@@ -22,6 +22,18 @@ from .knxip_enum import APCICommand, CEMIFlags, CEMIMessageCode
 class CEMIFrame(KNXIPBody):
     """Representation of a CEMI Frame."""
 
+    PRIORITY_FLAGS = {
+        TelegramPriority.SYSTEM: CEMIFlags.PRIORITY_SYSTEM,
+        TelegramPriority.ALARM: CEMIFlags.PRIORITY_URGENT,
+        TelegramPriority.NORMAL: CEMIFlags.PRIORITY_NORMAL,
+        TelegramPriority.LOW: CEMIFlags.PRIORITY_LOW}
+
+    FLAGS_PRIORITY = {
+        CEMIFlags.PRIORITY_SYSTEM: TelegramPriority.SYSTEM,
+        CEMIFlags.PRIORITY_URGENT: TelegramPriority.ALARM,
+        CEMIFlags.PRIORITY_NORMAL: TelegramPriority.NORMAL,
+        CEMIFlags.PRIORITY_LOW: TelegramPriority.LOW}
+
     # pylint: disable=too-many-instance-attributes
 
     def __init__(self, xknx):
@@ -54,6 +66,7 @@ class CEMIFrame(KNXIPBody):
                 raise ConversionError("Telegram not implemented for {0}".format(self.cmd))
 
         telegram.telegramtype = resolve_telegram_type(self.cmd)
+        telegram.priority = self.FLAGS_PRIORITY[self.flags & CEMIFlags.PRIORITY_MASK]
 
         # TODO: Set telegram.direction [additional flag within KNXIP]
         return telegram
@@ -69,7 +82,7 @@ class CEMIFrame(KNXIPBody):
         self.flags = (CEMIFlags.FRAME_TYPE_STANDARD |
                       CEMIFlags.DO_NOT_REPEAT |
                       CEMIFlags.BROADCAST |
-                      CEMIFlags.PRIORITY_LOW |
+                      self.PRIORITY_FLAGS[telegram.priority] |
                       CEMIFlags.NO_ACK_REQUESTED |
                       CEMIFlags.CONFIRM_NO_ERROR |
                       CEMIFlags.DESTINATION_GROUP_ADDRESS |
@@ -79,9 +79,11 @@ class CEMIFlags():
 
     # Bit 1/3+2
     PRIORITY_SYSTE = 0x0000
+    PRIORITY_SYSTEM = 0x0000
     PRIORITY_NORMAL = 0x0400
     PRIORITY_URGENT = 0x0800
     PRIORITY_LOW = 0x0C00
+    PRIORITY_MASK = 0x0C00
 
     # Bit 1/1
     NO_ACK_REQUESTED = 0x0000
@@ -0,0 +1,28 @@
+"""
+Helper for importing objects of a package on first access.
+
+Packages map names to the submodule defining them and use the function returned by
+lazy_getattr() as module level __getattr__ (PEP 562). Python < 3.7 does not support
+module level __getattr__, there all names are imported immediately.
+"""
+import importlib
+import sys
+
+
+def lazy_getattr(package, namespace, lazy_names):
+    """Return module __getattr__ importing lazy_names ({name: relative module}) of package on first access."""
+    def __getattr__(name):
+        """Import submodule defining name and cache name within package namespace."""
+        try:
+            module = lazy_names[name]
+        except KeyError:
+            raise AttributeError(
+                "module {0!r} has no attribute {1!r}".format(package, name)) from None
+        value = getattr(importlib.import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    if sys.version_info < (3, 7):
+        for name in lazy_names:
+            __getattr__(name)
+    return __getattr__
@@ -0,0 +1,230 @@
+"""
+XKNXRunner hosts XKNX on its own event loop within a background thread.
+
+It allows applications without asyncio (e.g. WSGI applications or batch jobs) to use XKNX
+from any thread:
+
+* set(), read() and sync() block until the operation finished within the loop,
+* set_future(), read_future() and sync_future() return a concurrent.futures.Future,
+* subscribe() returns a Subscription for consuming received telegrams from another thread.
+
+The number of pending operations and the number of buffered telegrams per subscription are bounded.
+
+    runner = XKNXRunner(config='xknx.yaml')
+    runner.start()
+    runner.set('1/2/3', DPTBinary(1))
+    telegram = runner.read('1/2/4')
+    runner.stop()
+"""
+import asyncio
+import queue
+import threading
+
+from xknx.exceptions import XKNXException
+from xknx.knx import GroupAddress, Telegram
+
+
+class Subscription:
+    """Bounded, thread-safe buffer of received telegrams."""
+
+    def __init__(self, runner, address_filters=None, maxsize=1000):
+        """Initialize Subscription class."""
+        self.runner = runner
+        self.address_filters = address_filters
+        self.queue = queue.Queue(maxsize)
+        self.dropped = 0
+        self.callback = None
+
+    async def telegram_received(self, telegram):
+        """Put telegram into buffer, dropping the oldest one if full. Callback from TelegramQueue."""
+        while True:
+            try:
+                self.queue.put_nowait(telegram)
+                break
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+        return False
+
+    def get(self, timeout=None):
+        """Return next received telegram. Raises queue.Empty after timeout."""
+        return self.queue.get(timeout=timeout)
+
+    def __iter__(self):
+        """Iterate over received telegrams, blocking until the next telegram was received."""
+        while True:
+            yield self.queue.get()
+
+    def close(self):
+        """Stop receiving telegrams."""
+        self.runner.unsubscribe(self)
+
+
+class XKNXRunner:
+    """Class for running XKNX within a background thread."""
+
+    def __init__(self, max_pending=100, timeout_in_seconds=10, loop_factory=None, **xknx_kwargs):
+        """
+        Initialize XKNXRunner class.
+
+        max_pending: maximum number of operations submitted but not yet finished.
+        timeout_in_seconds: default timeout of blocking calls.
+        loop_factory: callable returning the event loop, e.g. uvloop.new_event_loop.
+            Defaults to asyncio.new_event_loop, i.e. the loop of the current event loop policy.
+        xknx_kwargs: arguments for constructing XKNX within the runner thread.
+        """
+        self.max_pending = max_pending
+        self.timeout_in_seconds = timeout_in_seconds
+        self.loop_factory = loop_factory or asyncio.new_event_loop
+        self.xknx_kwargs = xknx_kwargs
+        self.xknx = None
+        self.loop = None
+        self.thread = None
+        self._pending = threading.BoundedSemaphore(max_pending)
+        self._ready = threading.Event()
+        self._exception = None
+
+    def start(self, connect=True, **start_kwargs):
+        """Start background thread and event loop, create XKNX and start it if connect is True."""
+        if self.thread is not None:
+            raise XKNXException("XKNXRunner already started")
+        self._ready.clear()
+        self.thread = threading.Thread(target=self._run, name='XKNXRunner', daemon=True)
+        self.thread.start()
+        self._ready.wait()
+        if self._exception is not None:
+            self.thread.join()
+            self.thread = None
+            raise self._exception
+        if connect:
+            try:
+                self._result(self.submit(self.xknx.start, **start_kwargs), None)
+            except BaseException:
+                self.stop()
+                raise
+
+    def _run(self):
+        """Run event loop. Target of background thread."""
+        self.loop = self.loop_factory()
+        asyncio.set_event_loop(self.loop)
+        try:
+            from xknx.xknx import XKNX
+            self.xknx = XKNX(loop=self.loop, **self.xknx_kwargs)
+        except Exception as ex:  # pylint: disable=broad-except
+            self._exception = ex
+            self.loop.close()
+            self._ready.set()
+            return
+        self._ready.set()
+        try:
+            self.loop.run_forever()
+            self._cancel_tasks()
+        finally:
+            self.loop.close()
+
+    def _cancel_tasks(self):
+        """Cancel tasks still running within loop, e.g. heartbeat of tunnel."""
+        all_tasks = getattr(asyncio, 'all_tasks', None) or asyncio.Task.all_tasks
+        tasks = [task for task in all_tasks(self.loop) if not task.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+
+    def stop(self, timeout=None):
+        """Stop XKNX, event loop and background thread."""
+        if self.thread is None:
+            return
+        try:
+            if self.xknx.started:
+                self._result(self.submit(self.xknx.stop), timeout)
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(timeout or self.timeout_in_seconds)
+            self.thread = None
+
+    def submit(self, coroutine_function, *args, **kwargs):
+        """Run coroutine_function within event loop and return concurrent.futures.Future."""
+        if self.thread is None:
+            raise XKNXException("XKNXRunner not started")
+        if not self._pending.acquire(timeout=self.timeout_in_seconds):
+            raise XKNXException("Too many pending operations")
+        try:
+            future = asyncio.run_coroutine_threadsafe(
+                coroutine_function(*args, **kwargs), self.loop)
+        except BaseException:
+            self._pending.release()
+            raise
+        future.add_done_callback(lambda _: self._pending.release())
+        return future
+
+    def _result(self, future, timeout):
+        """Wait for result of future."""
+        return future.result(self.timeout_in_seconds if timeout is None else timeout)
+
+    async def _set(self, group_address, payload):
+        """Queue GROUP_WRITE telegram."""
+        await self.xknx.telegrams.put(Telegram(
+            GroupAddress(group_address), payload=payload))
+
+    def set_future(self, group_address, payload):
+        """Write payload to group address. Returns Future, done when telegram was queued."""
+        return self.submit(self._set, group_address, payload)
+
+    def set(self, group_address, payload, timeout=None):
+        """Write payload to group address and wait until telegram was queued."""
+        return self._result(self.set_future(group_address, payload), timeout)
+
+    async def _read(self, group_address):
+        """Read group address from KNX bus."""
+        from xknx.core import ValueReader
+        value_reader = ValueReader(self.xknx, GroupAddress(group_address))
+        return await value_reader.read()
+
+    def read_future(self, group_address):
+        """Read group address. Returns Future with the response telegram or None if no response."""
+        return self.submit(self._read, group_address)
+
+    def read(self, group_address, timeout=None):
+        """Read group address and return response telegram or None if no response."""
+        return self._result(self.read_future(group_address), timeout)
+
+    async def _sync(self, device_name=None):
+        """Read state of all devices or of device from KNX bus."""
+        if device_name is None:
+            await self.xknx.devices.sync()
+        else:
+            await self.xknx.devices[device_name].sync()
+
+    def sync_future(self, device_name=None):
+        """Sync state of all devices or of device with given name. Returns Future."""
+        return self.submit(self._sync, device_name)
+
+    def sync(self, device_name=None, timeout=None):
+        """Sync state of all devices or of device with given name and wait until done."""
+        return self._result(self.sync_future(device_name), timeout)
+
+    async def _subscribe(self, subscription):
+        """Register subscription at TelegramQueue."""
+        subscription.callback = self.xknx.telegram_queue.register_telegram_received_cb(
+            subscription.telegram_received, subscription.address_filters)
+
+    def subscribe(self, address_filters=None, maxsize=1000):
+        """Return Subscription receiving incoming telegrams, optionally filtered by address_filters."""
+        subscription = Subscription(self, address_filters, maxsize)
+        self._result(self.submit(self._subscribe, subscription), None)
+        return subscription
+
+    async def _unsubscribe(self, subscription):
+        """Unregister subscription at TelegramQueue."""
+        if subscription.callback is not None:
+            self.xknx.telegram_queue.unregister_telegram_received_cb(subscription.callback)
+            subscription.callback = None
+
+    def unsubscribe(self, subscription):
+        """Stop receiving telegrams with subscription."""
+        if self.thread is not None:
+            self._result(self.submit(self._unsubscribe, subscription), None)
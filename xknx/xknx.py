@@ -3,9 +3,11 @@ import asyncio
 import logging
 import signal
 
-from xknx.core import Config, TelegramQueue
+from xknx.core import (BusLoadEstimator, Config, Metrics, PendingOperations,
+                       TelegramQueue, UpdateDispatcher)
+from xknx.core.event_loop import loop_kwargs
 from xknx.devices import Devices
-from xknx.io import ConnectionConfig, KNXIPInterface
+from xknx.io import ConnectionConfig, HeartbeatManager, KNXIPInterface
 from xknx.knx import PhysicalAddress, GroupAddressType
 
 
@@ -25,22 +27,29 @@ class XKNX:
                  device_updated_cb=None):
         """Initialize XKNX class."""
         # pylint: disable=too-many-arguments
-        self.devices = Devices()
-        self.telegrams = asyncio.Queue()
         self.loop = loop or asyncio.get_event_loop()
-        self.sigint_received = asyncio.Event()
+        self.metrics = Metrics()
+        self.bus_load = BusLoadEstimator(self)
+        self.pending_operations = PendingOperations(self)
+        self.update_dispatcher = UpdateDispatcher(self)
+        self.devices = Devices(self.update_dispatcher)
+        self.telegrams = TelegramQueue.Queue(**loop_kwargs(self.loop))
+        self.sigint_received = asyncio.Event(**loop_kwargs(self.loop))
         self.telegram_queue = TelegramQueue(self)
         self.state_updater = None
         self.knxip_interface = None
+        self.heartbeat_manager = HeartbeatManager(self)
+        self.recorder = None
         self.started = False
         self.address_format = address_format
         self.own_address = own_address
         self.logger = logging.getLogger('xknx.log')
         self.knx_logger = logging.getLogger('xknx.knx')
         self.telegram_logger = logging.getLogger('xknx.telegram')
+        self.config = Config(self)
 
         if config is not None:
-            Config(self).read(config)
+            self.config.read(config)
 
         if telegram_received_cb is not None:
             self.telegram_queue.register_telegram_received_cb(telegram_received_cb)
@@ -91,6 +100,8 @@ class XKNX:
         await self.join()
         await self.telegram_queue.stop()
         await self._stop_knxip_interface_if_exists()
+        for device in self.devices:
+            device.shutdown()
         self.started = False
 
     async def loop_until_sigint(self):